@@ -1,29 +1,99 @@
-from flask import Flask, render_template, request, jsonify
-from process import SchedulerFactory
+from flask import Flask, render_template, request, jsonify, g
+from ingest import detect_format, ingest, ingest_records
+from experiments import MAX_SWEEP_POINTS, compare_algorithms, sweep_quantum
+from process import SchedulerFactory, parse_fields
+from sessions import SessionRegistry
+from result_cache import ResultCache, result_rows, schedule_key
+from smp import BALANCING_POLICIES, MAX_CORES, SMP_ALGORITHMS
+from jobs import JobManager, JobQueueFull
+from workload import WorkloadGenerator
+from profiling import MEMORY_BUCKETS, MetricsRegistry, mark, profiled
 import json
 
 app = Flask(__name__)
 
-# Variable global para mantener el estado del scheduler
-current_scheduler = None
-current_algorithm = 'FCFS'
-current_quantum = 3  # Quantum por defecto para Round Robin
+# Estado de simulación por usuario (scheduler, algoritmo y quantum)
+sessions = SessionRegistry()
+
+# Resultados de scheduling memorizados (compartidos entre sesiones)
+schedule_cache = ResultCache()
+
+# Simulaciones en segundo plano (pool acotado, resultados con TTL)
+jobs = JobManager()
+
+# Tipos de trabajo aceptados por /jobs
+JOB_TYPES = ('schedule', 'sweep')
+
+# Valores aceptados en el parámetro profile de /schedule y /jobs
+PROFILE_MODES = {'1': 'time', 'true': 'time', 'time': 'time', 'memory': 'memory'}
+
+# Métricas exportadas en /metrics (formato de texto de Prometheus)
+metrics = MetricsRegistry()
+schedule_seconds = metrics.histogram(
+    'scheduler_schedule_seconds', 'Duración total de cada scheduling (segundos).',
+    ('algorithm', 'mode', 'cache'))
+phase_seconds = metrics.histogram(
+    'scheduler_phase_seconds', 'Duración de cada fase del scheduling (segundos).',
+    ('algorithm', 'mode', 'phase'))
+phase_peak_bytes = metrics.histogram(
+    'scheduler_phase_peak_bytes', 'Pico de memoria reservada en cada fase (solo con profile=memory).',
+    ('algorithm', 'mode', 'phase'), MEMORY_BUCKETS)
+metrics.callback('scheduler_cache_hits_total', 'Aciertos de la caché de resultados.',
+                 lambda: schedule_cache.hits, 'counter')
+metrics.callback('scheduler_cache_misses_total', 'Fallos de la caché de resultados.',
+                 lambda: schedule_cache.misses, 'counter')
+metrics.callback('scheduler_cache_evictions_total', 'Resultados descartados de la caché.',
+                 lambda: schedule_cache.evictions, 'counter')
+metrics.callback('scheduler_cache_entries', 'Resultados guardados en la caché.', lambda: len(schedule_cache))
+metrics.callback('scheduler_sessions', 'Sesiones de simulación en memoria.', lambda: len(sessions))
+metrics.callback('scheduler_jobs', 'Trabajos en segundo plano guardados.', lambda: len(jobs))
+
+# Cookie con el ID de sesión (los clientes de la API pueden usar la cabecera)
+SESSION_COOKIE = 'simulator_session'
+SESSION_HEADER = 'X-Session-Id'
+
+# Máximo de procesos por petición a /generate_workload
+MAX_GENERATED_PROCESSES = 1_000_000
+
+# Máximo de segmentos por respuesta de /gantt (si no se indica limit)
+GANTT_WINDOW_LIMIT = 10000
+
+# Máximo ancho (píxeles) de las consultas agregadas de /gantt
+MAX_GANTT_WIDTH = 20000
+
+def get_session():
+    """Retorna la sesión de simulación del usuario de la petición actual."""
+    if 'simulation_session' not in g:
+        session_id = request.cookies.get(SESSION_COOKIE) or request.headers.get(SESSION_HEADER)
+        g.simulation_session = sessions.get(session_id)
+    return g.simulation_session
+
+@app.after_request
+def save_session_cookie(response):
+    """Envía el ID de sesión al cliente (cookie y cabecera)."""
+    session = g.get('simulation_session')
+    if session is not None:
+        response.headers[SESSION_HEADER] = session.session_id
+        if request.cookies.get(SESSION_COOKIE) != session.session_id:
+            response.set_cookie(SESSION_COOKIE, session.session_id, httponly=True, samesite='Lax')
+    return response
 
 @app.route('/')
 def index():
     """Página principal de la aplicación."""
-    return render_template('index.html', current_algorithm=current_algorithm)
+    return render_template('index.html', current_algorithm=get_session().algorithm)
 
 @app.route('/add_process', methods=['POST'])
 def add_process():
     """Endpoint para añadir un proceso."""
-    global current_scheduler
+    session = get_session()
     
     try:
         data = request.json
         pid = data.get('pid')
         arrival_time = int(data.get('arrival_time'))
         burst_time = int(data.get('burst_time'))
+        priority = int(data.get('priority') or 0)  # Para el algoritmo por prioridades
         
         # Validaciones
         if not pid or arrival_time < 0 or burst_time <= 0:
@@ -32,75 +102,668 @@ def add_process():
                 'message': 'Datos inválidos. Verifique que todos los campos sean correctos.'
             })
         
-        # Crear scheduler si no existe
-        if current_scheduler is None:
-            if current_algorithm == 'RR':
-                current_scheduler = SchedulerFactory.create_scheduler(current_algorithm, quantum=current_quantum)
-            else:
-                current_scheduler = SchedulerFactory.create_scheduler(current_algorithm)
-        
-        # Verificar que el PID no exista ya
-        existing_pids = [p.pid for p in current_scheduler.processes]
-        if pid in existing_pids:
+        with session.lock:
+            # Crear scheduler si no existe
+            scheduler = session.get_scheduler()
+            
+            # Verificar que el PID no exista ya (índice hash de la tabla de procesos)
+            if pid in scheduler.processes:
+                return jsonify({
+                    'success': False, 
+                    'message': f'El proceso {pid} ya existe. Use un ID diferente.'
+                })
+            
+            # Añadir proceso
+            scheduler.add_process(pid, arrival_time, burst_time, priority)
+            
             return jsonify({
-                'success': False, 
-                'message': f'El proceso {pid} ya existe. Use un ID diferente.'
+                'success': True, 
+                'message': f'Proceso {pid} añadido correctamente.',
+                'process_count': len(scheduler.processes)
             })
         
-        # Añadir proceso
-        current_scheduler.add_process(pid, arrival_time, burst_time)
+    except Exception as e:
+        return jsonify({
+            'success': False, 
+            'message': f'Error al añadir proceso: {str(e)}'
+        })
+
+@app.route('/add_processes', methods=['POST'])
+def add_processes():
+    """
+    Endpoint para añadir procesos en bloque.
+    
+    Acepta un arreglo JSON (o {"processes": [...]}), NDJSON
+    (Content-Type: application/x-ndjson) o CSV (Content-Type: text/csv, con
+    cabecera opcional pid,arrival_time,burst_time[,priority]). Las filas inválidas o
+    con PID repetido se rechazan individualmente sin detener la carga.
+    """
+    session = get_session()
+    
+    try:
+        with session.lock:
+            # Crear scheduler si no existe
+            scheduler = session.get_scheduler()
+            
+            report = ingest(scheduler, request.stream, detect_format(request.content_type))
+            process_count = len(scheduler.processes)
         
         return jsonify({
-            'success': True, 
-            'message': f'Proceso {pid} añadido correctamente.',
-            'process_count': len(current_scheduler.processes)
+            'success': report['added'] > 0 or report['rejected'] == 0,
+            'message': f"{report['added']} proceso(s) añadido(s), {report['rejected']} rechazado(s).",
+            'added': report['added'],
+            'rejected': report['rejected'],
+            'errors': report['errors'],
+            'process_count': process_count
         })
         
     except Exception as e:
         return jsonify({
             'success': False, 
-            'message': f'Error al añadir proceso: {str(e)}'
+            'message': f'Error al añadir procesos: {str(e)}'
+        })
+
+@app.route('/generate_workload', methods=['POST'])
+def generate_workload():
+    """
+    Endpoint para añadir una carga sintética reproducible (ver workload).
+    
+    Recibe {"count", "seed", "arrival", "arrival_options", "burst",
+    "burst_options", "priority_levels", "pid_prefix"}; los PIDs continúan
+    la numeración de la tabla (P<n+1>, P<n+2>, ...).
+    """
+    session = get_session()
+    
+    try:
+        data = request.json or {}
+        count = int(data.get('count', 0))
+        if not 0 < count <= MAX_GENERATED_PROCESSES:
+            raise ValueError(f'count debe estar entre 1 y {MAX_GENERATED_PROCESSES}.')
+        
+        with session.lock:
+            scheduler = session.get_scheduler()
+            generator = WorkloadGenerator(
+                count,
+                seed=data.get('seed'),
+                arrival=data.get('arrival', 'poisson'),
+                arrival_options=data.get('arrival_options'),
+                burst=data.get('burst', 'exponential'),
+                burst_options=data.get('burst_options'),
+                priority_levels=data.get('priority_levels', 0),
+                pid_prefix=data.get('pid_prefix', 'P'),
+                first_pid=len(scheduler.processes) + 1
+            )
+            added = generator.load(scheduler)
+            process_count = len(scheduler.processes)
+        
+        return jsonify({
+            'success': True,
+            'message': f'{added} proceso(s) generado(s).',
+            'added': added,
+            'workload': generator.summary(),
+            'process_count': process_count
+        })
+        
+    except (ValueError, TypeError, ImportError) as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
         })
+    except Exception as e:
+        return jsonify({
+            'success': False, 
+            'message': f'Error al generar la carga: {str(e)}'
+        })
+
+def profile_mode(value):
+    """Modo de perfilado pedido: 'time', 'memory' o None (sin perfil)."""
+    if value in (None, '', False, '0', 'false'):
+        return None
+    if value is True:
+        return 'time'
+    mode = PROFILE_MODES.get(str(value).lower())
+    if mode is None:
+        raise ValueError(f'profile debe ser true, time o memory (se recibió {value}).')
+    return mode
+
+def schedule_body(scheduler, algorithm, quantum, smp, report=None, profile=None, fields=None):
+    """
+    Planifica la carga del scheduler y retorna la respuesta de /schedule ya
+    serializada, junto con la clave de caché de la carga planificada (None
+    si la respuesta salió de la caché y el scheduler no se ejecutó).
+    
+    report(progreso, etapa), si se indica, recibe el avance por etapas
+    (lo usan los trabajos en segundo plano).
+    
+    La duración de cada fase se acumula siempre en /metrics; con profile
+    ('time' o 'memory') la respuesta incluye además el perfil de esta
+    llamada en "profile" (ver profiling.Profiler).
+    
+    fields (ver process.parse_fields) limita los resultados a las secciones
+    pedidas; solo esas se calculan y se guardan en caché.
+    """
+    with profiled(memory=profile == 'memory') as profiler:
+        body, sorted_key = plan_schedule(scheduler, algorithm, quantum, smp, report, fields)
+    
+    cached = sorted_key is None
+    mode = 'smp' if smp else 'single'
+    schedule_seconds.observe(profiler.total_seconds, algorithm, mode, 'hit' if cached else 'miss')
+    for phase, entry in profiler.phases.items():
+        phase_seconds.observe(entry['seconds'], algorithm, mode, phase)
+        if entry['peak_bytes'] is not None:
+            phase_peak_bytes.observe(entry['peak_bytes'], algorithm, mode, phase)
+    
+    if profile:
+        # La respuesta guardada en caché no lleva perfil: se inserta aquí
+        summary = dict(profiler.to_dict(), cached=cached)
+        body = '{"profile": ' + app.json.dumps(summary) + ', ' + body[1:]
+    return body, sorted_key
+
+def plan_schedule(scheduler, algorithm, quantum, smp, report=None, fields=None):
+    """Cuerpo de schedule_body(), con las marcas de sus fases."""
+    key = schedule_key(algorithm, quantum, scheduler.processes, smp)
+    # Cada selección de secciones es una respuesta distinta en la caché
+    body = schedule_cache.get((key, fields))
+    mark('cache_lookup')
+    if body is not None:
+        return body, None
+    
+    # Ejecutar el algoritmo
+    if report:
+        report(0.05, 'Planificando')
+    scheduler.schedule()
+    
+    # Obtener resultados (se guarda la respuesta ya serializada)
+    if report:
+        report(0.7, 'Preparando resultados')
+    results = scheduler.get_results(fields)
+    if report:
+        report(0.85, 'Serializando')
+    body = app.json.dumps({
+        'success': True,
+        'results': results,
+        'message': f'Scheduling completado usando {algorithm}'
+    })
+    mark('serialize')
+    rows = result_rows(results)
+    schedule_cache.put((key, fields), body, rows)
+    
+    # schedule() deja la tabla ordenada: se guarda también con la huella del
+    # nuevo orden para acertar en la siguiente llamada
+    sorted_key = schedule_key(algorithm, quantum, scheduler.processes, smp)
+    if sorted_key != key:
+        schedule_cache.put((sorted_key, fields), body, rows)
+    mark('cache_store')
+    return body, sorted_key
 
 @app.route('/schedule', methods=['POST'])
 def schedule_processes():
-    """Endpoint para ejecutar el algoritmo de scheduling."""
-    global current_scheduler
+    """
+    Endpoint para ejecutar el algoritmo de scheduling.
+    
+    Con ?profile=true (o profile=memory) la respuesta incluye "profile":
+    el tiempo (y el pico de memoria) de cada fase de la ejecución.
+    
+    Con ?fields=averages,statistics solo se calculan y retornan esas
+    secciones (processes, gantt_chart, averages, statistics, analysis).
+    """
+    session = get_session()
+    
+    try:
+        profile = profile_mode(request.args.get('profile'))
+        fields = parse_fields(request.args.get('fields'))
+        with session.lock:
+            scheduler = session.scheduler
+            if scheduler is None or not scheduler.processes:
+                return jsonify({
+                    'success': False, 
+                    'message': 'No hay procesos para programar. Añada al menos un proceso.'
+                })
+            
+            # Reutilizar la respuesta si la misma carga ya se planificó
+            body, scheduled_key = schedule_body(scheduler, session.algorithm, session.quantum,
+                                                session.smp_options(), profile=profile, fields=fields)
+            if scheduled_key is not None:
+                session.scheduled_key = scheduled_key
+        
+        return app.response_class(body, mimetype=app.json.mimetype)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False, 
+            'message': f'Error al ejecutar scheduling: {str(e)}'
+        })
+
+def gantt_lanes(session):
+    """
+    Diagramas de Gantt de la sesión (uno por núcleo en modo multiprocesador),
+    ejecutando el scheduling si la carga cambió desde la última ejecución
+    (o si la respuesta de /schedule salió de la caché). Llamar con el lock
+    de la sesión.
+    """
+    scheduler = session.scheduler
+    key = schedule_key(session.algorithm, session.quantum, scheduler.processes, session.smp_options())
+    if session.scheduled_key != key:
+        scheduler.schedule()
+        session.scheduled_key = schedule_key(session.algorithm, session.quantum,
+                                             scheduler.processes, session.smp_options())
+    if session.cores > 1:
+        return scheduler.gantt_charts
+    return [scheduler.gantt_chart]
+
+def optional_int_arg(name):
+    """Parámetro entero opcional de la query string (None si no se envía)."""
+    value = request.args.get(name)
+    return int(value) if value not in (None, '') else None
+
+@app.route('/gantt')
+def gantt_window():
+    """
+    Endpoint para consultar una ventana del diagrama de Gantt.
+    
+    Parámetros (query string, todos opcionales): start y end (ventana
+    [start, end)), pid (solo los segmentos de ese proceso), at (qué proceso
+    se ejecutaba en el instante at) y limit (máximo de segmentos). Las
+    consultas usan un índice construido una vez por scheduling y cuestan
+    O(log n + k).
+    
+    Con width (ancho en píxeles) la ventana se retorna agregada: los
+    segmentos de menos de un píxel se agrupan en tramos 'busy'/'mixed'
+    (ver GanttIndex.downsample), así que la respuesta tiene O(width)
+    elementos por núcleo sea cual sea el tamaño del diagrama.
+    """
+    session = get_session()
     
     try:
-        if current_scheduler is None or not current_scheduler.processes:
+        start = optional_int_arg('start')
+        end = optional_int_arg('end')
+        at = optional_int_arg('at')
+        limit = optional_int_arg('limit')
+        if limit is None:
+            limit = GANTT_WINDOW_LIMIT
+        width = optional_int_arg('width')
+        pid = request.args.get('pid') or None
+        if limit <= 0:
             return jsonify({
-                'success': False, 
-                'message': 'No hay procesos para programar. Añada al menos un proceso.'
+                'success': False,
+                'message': 'El límite de segmentos debe ser un entero positivo.'
+            })
+        if width is not None and not 1 <= width <= MAX_GANTT_WIDTH:
+            return jsonify({
+                'success': False,
+                'message': f'El ancho debe ser un entero entre 1 y {MAX_GANTT_WIDTH}.'
             })
         
-        # Ejecutar el algoritmo
-        current_scheduler.schedule()
+        with session.lock:
+            if session.scheduler is None or not session.scheduler.processes:
+                return jsonify({
+                    'success': False, 
+                    'message': 'No hay procesos para programar. Añada al menos un proceso.'
+                })
+            
+            lanes = gantt_lanes(session)
+            multicore = session.cores > 1
+            chart_start = min((gantt.start[0] for gantt in lanes if len(gantt)), default=0)
+            chart_end = max((gantt.end[-1] for gantt in lanes if len(gantt)), default=0)
+            segments = []
+            running = []
+            total = 0
+            for core, gantt in enumerate(lanes):
+                index = gantt.index()
+                if pid is not None:
+                    matches = index.pid_window(pid, start, end)
+                else:
+                    matches = index.window(start, end)
+                total += len(matches)
+                if width is not None and pid is None:
+                    # Todos los núcleos con la misma escala (la ventana común)
+                    lane_segments = index.downsample(
+                        chart_start if start is None else start,
+                        chart_end if end is None else end, width)
+                else:
+                    lane_segments = [gantt.segment(position)
+                                     for position in matches[:max(0, limit - len(segments))]]
+                for segment in lane_segments:
+                    if multicore:
+                        segment['core'] = core
+                    segments.append(segment)
+                
+                if at is not None:
+                    position = index.running_at(at)
+                    if position is not None:
+                        segment = gantt.segment(position)
+                        if multicore:
+                            segment['core'] = core
+                        running.append(segment)
         
-        # Obtener resultados
-        results = current_scheduler.get_results()
+        response = {
+            'success': True,
+            'segments': segments,
+            'total': total,
+            'truncated': total > len(segments) and (width is None or pid is not None),
+            'chart_start': chart_start,
+            'chart_end': chart_end
+        }
+        if at is not None:
+            # En multiprocesador, los segmentos de los núcleos que cubren at;
+            # en monoprocesador, el único segmento (o None)
+            response['running'] = running if multicore else (running[0] if running else None)
+        return jsonify(response)
+        
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': 'Los parámetros start, end, at, limit y width deben ser enteros.'
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False, 
+            'message': f'Error al consultar el diagrama de Gantt: {str(e)}'
+        })
+
+def sweep_quanta(data):
+    """
+    Quantums de un barrido: la lista "quanta" o el rango "start"/"stop"/"step"
+    (stop inclusivo). Lanza ValueError si el rango no es válido.
+    """
+    quanta = data.get('quanta')
+    if quanta is None:
+        start = int(data.get('start', 1))
+        stop = int(data.get('stop', 20))
+        step = int(data.get('step', 1))
+        if step <= 0:
+            raise ValueError('El paso del barrido debe ser un entero positivo.')
+        # Número de puntos calculado antes de construir la lista de quantums
+        if max(stop - start, -1) // step + 1 > MAX_SWEEP_POINTS:
+            raise ValueError(f'Máximo {MAX_SWEEP_POINTS} quantums por barrido.')
+        quanta = range(start, stop + 1, step)
+    return quanta
+
+@app.route('/sweep', methods=['POST'])
+def sweep():
+    """
+    Endpoint para barrer el quantum de Round Robin sobre los procesos cargados.
+    
+    Recibe {"quanta": [1, 2, 4]} o {"start": 1, "stop": 20, "step": 1}
+    (stop inclusivo) y opcionalmente "workers". Retorna un resumen por
+    quantum (WT/TT/NTAT promedio y cambios de contexto).
+    """
+    session = get_session()
+    
+    try:
+        data = request.json or {}
+        quanta = sweep_quanta(data)
+        
+        workers = data.get('workers')
+        with session.lock:
+            if session.scheduler is None or not session.scheduler.processes:
+                return jsonify({
+                    'success': False, 
+                    'message': 'No hay procesos para el barrido. Añada al menos un proceso.'
+                })
+            
+            results = sweep_quantum(session.scheduler.processes, quanta,
+                                    workers=int(workers) if workers else None)
         
         return jsonify({
             'success': True,
             'results': results,
-            'message': f'Scheduling completado usando {current_algorithm}'
+            'message': f'Barrido completado para {len(results)} quantum(s).'
         })
         
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        })
     except Exception as e:
         return jsonify({
             'success': False, 
-            'message': f'Error al ejecutar scheduling: {str(e)}'
+            'message': f'Error al ejecutar el barrido: {str(e)}'
+        })
+
+def run_schedule_job(job, session, scheduler, algorithm, quantum, smp, profile=None, fields=None):
+    """Trabajo de scheduling sobre una copia de la carga de la sesión."""
+    job.report(0.0, 'Buscando en caché')
+    key = schedule_key(algorithm, quantum, scheduler.processes, smp)
+    body, scheduled_key = schedule_body(scheduler, algorithm, quantum, smp, job.report, profile, fields)
+    
+    # Si la carga y el algoritmo de la sesión no cambiaron mientras tanto,
+    # la sesión adopta el scheduler ya ejecutado (así /gantt no vuelve a
+    # planificar)
+    if scheduled_key is not None:
+        with session.lock:
+            current = session.scheduler
+            if current is not None and schedule_key(session.algorithm, session.quantum, current.processes,
+                                                    session.smp_options()) == key:
+                session.scheduler = scheduler
+                session.scheduled_key = scheduled_key
+    return body
+
+def run_sweep_job(job, table, quanta, workers):
+    """Trabajo de barrido de quantum (el progreso avanza con cada quantum)."""
+    job.report(0.0, 'Barriendo quantums')
+    results = sweep_quantum(table, quanta, workers=workers,
+                            progress=lambda done, total: job.report(done / total, f'{done}/{total} quantums'))
+    return app.json.dumps({
+        'success': True,
+        'results': results,
+        'message': f'Barrido completado para {len(results)} quantum(s).'
+    })
+
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    """
+    Endpoint para ejecutar una simulación en segundo plano.
+    
+    Recibe {"type": "schedule"} (con "profile" y "fields" opcionales, como
+    en /schedule) o {"type": "sweep", ...} (con los mismos parámetros que
+    /sweep) y retorna el ID del trabajo; el progreso y el resultado se
+    consultan en /jobs/<id>. Se planifica una copia de la
+    carga actual, así que la sesión sigue disponible mientras tanto.
+    """
+    session = get_session()
+    
+    try:
+        data = request.json or {}
+        kind = data.get('type', 'schedule')
+        if kind not in JOB_TYPES:
+            return jsonify({
+                'success': False,
+                'message': f'Tipo de trabajo {kind} no soportado. Tipos disponibles: {", ".join(JOB_TYPES)}'
+            })
+        if kind == 'sweep':
+            quanta = sweep_quanta(data)
+            workers = int(data['workers']) if data.get('workers') else None
+        profile = profile_mode(data.get('profile'))
+        fields = parse_fields(data.get('fields'))
+        
+        with session.lock:
+            scheduler = session.snapshot_scheduler()
+            if scheduler is None:
+                return jsonify({
+                    'success': False, 
+                    'message': 'No hay procesos para programar. Añada al menos un proceso.'
+                })
+            
+            if kind == 'schedule':
+                options = (session.algorithm, session.quantum, session.smp_options())
+                work = lambda job: run_schedule_job(job, session, scheduler, *options, profile, fields)
+            else:
+                work = lambda job: run_sweep_job(job, scheduler.processes, quanta, workers)
+            
+            job = jobs.submit(kind, session.session_id, work)
+        
+        return jsonify({
+            'success': True,
+            'job_id': job.job_id,
+            'job': job.to_dict(),
+            'message': f'Trabajo {job.job_id} en cola.'
+        })
+        
+    except (ValueError, JobQueueFull) as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False, 
+            'message': f'Error al crear el trabajo: {str(e)}'
+        })
+
+@app.route('/jobs/<job_id>')
+def get_job(job_id):
+    """
+    Endpoint con el estado de un trabajo; cuando está completado incluye
+    "result" (la misma respuesta que daría /schedule o /sweep).
+    """
+    session = get_session()
+    job = jobs.get(job_id, session.session_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'message': f'Trabajo {job_id} no encontrado (o ya expiró).'
+        })
+    
+    body = app.json.dumps({'success': True, 'job': job.to_dict()})
+    result = job.result
+    if result is not None:
+        # El resultado ya está serializado: se inserta sin volver a codificarlo
+        body = body[:body.rindex('}')] + ', "result": ' + result + '}'
+    return app.response_class(body, mimetype=app.json.mimetype)
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Endpoint para cancelar un trabajo en cola o en ejecución."""
+    session = get_session()
+    job = jobs.cancel(job_id, session.session_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'message': f'Trabajo {job_id} no encontrado (o ya expiró).'
+        })
+    return jsonify({
+        'success': True,
+        'job': job.to_dict(),
+        'message': f'Cancelación del trabajo {job_id} solicitada.'
+    })
+
+def comparison_gantt(value):
+    """Opción "gantt" de /compare: 'full', 'none' o un ancho en píxeles."""
+    if value in (None, ''):
+        return 'full'
+    if value in ('full', 'none') or isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    raise ValueError("gantt debe ser 'full', 'none' o un ancho en píxeles positivo.")
+
+def comparison_list(value):
+    """Lista de una opción de /compare (arreglo JSON o texto separado por comas)."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    return list(value)
+
+@app.route('/compare', methods=['POST'])
+def compare():
+    """
+    Endpoint para comparar varios algoritmos sobre la misma carga.
+    
+    Con un cuerpo JSON recibe {"algorithms": ["FCFS", "SJF", "RR"],
+    "quanta": [2, 4], "gantt": "full" | "none" | ancho, "workers": n} y,
+    opcionalmente, "processes" con la carga; sin "processes" se comparan
+    los procesos de la sesión. Con un cuerpo NDJSON o CSV el cuerpo es la
+    carga y las opciones van en la query string
+    (?algorithms=FCFS,SJF,RR&quanta=2,4). La sesión no se modifica.
+    """
+    session = get_session()
+    
+    try:
+        fmt = detect_format(request.content_type)
+        report = None
+        if fmt == 'json':
+            data = request.get_json(silent=True) or {}
+            if isinstance(data, list):
+                data = {'processes': data}
+        else:
+            data = request.args
+        
+        algorithms = comparison_list(data.get('algorithms')) or ['FCFS', 'SJF', 'RR']
+        quanta = comparison_list(data.get('quanta'))
+        gantt = comparison_gantt(data.get('gantt'))
+        workers = int(data['workers']) if data.get('workers') else None
+        
+        if fmt != 'json' or 'processes' in data:
+            # Carga propia de la comparación (el scheduler solo contiene la tabla)
+            holder = SchedulerFactory.create_scheduler('FCFS')
+            if fmt == 'json':
+                rows = data.get('processes')
+                if not isinstance(rows, list):
+                    raise ValueError('Se esperaba un arreglo JSON de procesos')
+                report = ingest_records(holder, enumerate(rows, start=1))
+            else:
+                report = ingest(holder, request.stream, fmt)
+            table = holder.processes
+        else:
+            with session.lock:
+                if session.scheduler is None or not session.scheduler.processes:
+                    return jsonify({
+                        'success': False, 
+                        'message': 'No hay procesos para comparar. Añada al menos un proceso.'
+                    })
+                holder = session.snapshot_scheduler()
+            table = holder.processes
+        
+        if not table:
+            return jsonify({
+                'success': False,
+                'message': 'No hay procesos válidos para comparar.',
+                'ingest': report
+            })
+        
+        results = compare_algorithms(table, algorithms, quanta=quanta, workers=workers, gantt=gantt)
+        
+        response = {
+            'success': True,
+            'results': results,
+            'message': f'Comparación completada: {len(results["runs"])} ejecución(es) sobre {len(table)} procesos.'
+        }
+        if report is not None:
+            response['ingest'] = report
+        return jsonify(response)
+        
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
         })
+    except Exception as e:
+        return jsonify({
+            'success': False, 
+            'message': f'Error al comparar algoritmos: {str(e)}'
+        })
+
+@app.route('/cache_stats')
+def cache_stats():
+    """Endpoint con los contadores de la caché de resultados."""
+    return jsonify(schedule_cache.stats())
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Endpoint con las métricas acumuladas en el formato de texto de Prometheus."""
+    return app.response_class(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/reset', methods=['POST'])
 def reset_scheduler():
     """Endpoint para reiniciar el scheduler."""
-    global current_scheduler
+    session = get_session()
     
     try:
-        if current_scheduler:
-            current_scheduler.reset()
-        current_scheduler = None
+        with session.lock:
+            session.reset()
         
         return jsonify({
             'success': True, 
@@ -116,15 +779,19 @@ def reset_scheduler():
 @app.route('/change_algorithm', methods=['POST'])
 def change_algorithm():
     """Endpoint para cambiar el algoritmo de scheduling."""
-    global current_algorithm, current_scheduler, current_quantum
+    session = get_session()
     
     try:
         data = request.json
         new_algorithm = data.get('algorithm', 'FCFS').upper()
-        quantum = data.get('quantum', current_quantum)  # Obtener quantum si se proporciona
+        quantum = data.get('quantum', session.quantum)  # Obtener quantum si se proporciona
+        # Modo multiprocesador (opcional): núcleos, balanceo y work stealing
+        cores = data.get('cores', session.cores)
+        balancing = data.get('balancing', session.balancing)
+        work_stealing = bool(data.get('work_stealing', session.work_stealing))
         
         # Verificar si el algoritmo es soportado
-        supported_algorithms = ['FCFS', 'SJF', 'RR']  # Round Robin añadido
+        supported_algorithms = ['FCFS', 'SJF', 'RR', 'SRTF', 'PRIORITY']
         if new_algorithm not in supported_algorithms:
             return jsonify({
                 'success': False, 
@@ -138,19 +805,40 @@ def change_algorithm():
                     'success': False,
                     'message': 'Para Round Robin, el quantum debe ser un entero positivo.'
                 })
-            current_quantum = quantum
         
-        current_algorithm = new_algorithm
+        # Validar el modo multiprocesador
+        if not isinstance(cores, int) or not 1 <= cores <= MAX_CORES:
+            return jsonify({
+                'success': False,
+                'message': f'El número de núcleos debe ser un entero entre 1 y {MAX_CORES}.'
+            })
+        if cores > 1 and new_algorithm not in SMP_ALGORITHMS:
+            return jsonify({
+                'success': False,
+                'message': f'El modo multiprocesador solo está disponible para {", ".join(SMP_ALGORITHMS)}.'
+            })
+        if balancing not in BALANCING_POLICIES:
+            return jsonify({
+                'success': False,
+                'message': f'Política de balanceo {balancing} no soportada. Políticas disponibles: {", ".join(BALANCING_POLICIES)}'
+            })
         
-        # Reiniciar scheduler si existe
-        if current_scheduler:
-            current_scheduler.reset()
-        current_scheduler = None
+        with session.lock:
+            if new_algorithm == 'RR':
+                session.quantum = quantum
+            session.algorithm = new_algorithm
+            session.cores = cores
+            session.balancing = balancing
+            session.work_stealing = work_stealing
+            
+            # Reiniciar scheduler si existe
+            session.reset()
         
         return jsonify({
             'success': True, 
-            'message': f'Algoritmo cambiado a {current_algorithm}.' + 
-                      (f' Quantum configurado a {current_quantum}.' if new_algorithm == 'RR' else '') +
+            'message': f'Algoritmo cambiado a {new_algorithm}.' + 
+                      (f' Quantum configurado a {quantum}.' if new_algorithm == 'RR' else '') +
+                      (f' {cores} núcleos ({balancing}).' if cores > 1 else '') +
                       ' Scheduler reiniciado.'
         })
         
@@ -163,31 +851,35 @@ def change_algorithm():
 @app.route('/get_current_state')
 def get_current_state():
     """Endpoint para obtener el estado actual del scheduler."""
-    global current_scheduler, current_algorithm, current_quantum
+    session = get_session()
     
     try:
-        state = {
-            'algorithm': current_algorithm,
-            'quantum': current_quantum if current_algorithm == 'RR' else None,
-            'process_count': len(current_scheduler.processes) if current_scheduler else 0,
-            'processes': []
-        }
-        
-        if current_scheduler and current_scheduler.processes:
-            state['processes'] = [
-                {
-                    'pid': p.pid,
-                    'arrival_time': p.arrival_time,
-                    'burst_time': p.burst_time
-                } for p in current_scheduler.processes
-            ]
+        with session.lock:
+            scheduler = session.scheduler
+            state = {
+                'algorithm': session.algorithm,
+                'quantum': session.quantum if session.algorithm == 'RR' else None,
+                'cores': session.cores,
+                'process_count': len(scheduler.processes) if scheduler else 0,
+                'processes': []
+            }
+            
+            if scheduler and scheduler.processes:
+                state['processes'] = [
+                    {
+                        'pid': p.pid,
+                        'arrival_time': p.arrival_time,
+                        'burst_time': p.burst_time,
+                        'priority': p.priority
+                    } for p in scheduler.processes
+                ]
         
         return jsonify(state)
         
     except Exception as e:
         return jsonify({
-            'algorithm': current_algorithm,
-            'quantum': current_quantum if current_algorithm == 'RR' else None,
+            'algorithm': session.algorithm,
+            'quantum': session.quantum if session.algorithm == 'RR' else None,
             'process_count': 0,
             'processes': [],
             'error': str(e)
@@ -196,7 +888,7 @@ def get_current_state():
 @app.route('/set_quantum', methods=['POST'])
 def set_quantum():
     """Endpoint para configurar el quantum de Round Robin."""
-    global current_quantum, current_scheduler
+    session = get_session()
     
     try:
         data = request.json
@@ -209,12 +901,13 @@ def set_quantum():
                 'message': 'El quantum debe estar entre 1 y 20'
             })
         
-        current_quantum = quantum
-        
-        # Si hay un scheduler RR activo, reiniciarlo con el nuevo quantum
-        if current_scheduler and current_algorithm == 'RR':
-            current_scheduler.reset()
-            current_scheduler = SchedulerFactory.create_scheduler('RR', quantum=current_quantum)
+        with session.lock:
+            session.quantum = quantum
+            
+            # Si hay un scheduler RR activo, reiniciarlo con el nuevo quantum
+            if session.scheduler and session.algorithm == 'RR':
+                session.reset()
+                session.get_scheduler()
         
         return jsonify({
             'success': True,
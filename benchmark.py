@@ -0,0 +1,369 @@
+"""
+Benchmarks reproducibles de los schedulers.
+
+Ejecuta cada scheduler (y Round Robin con varios quantums) sobre cargas
+sintéticas fijas (misma semilla y mismas distribuciones, ver workload) de
+distintos tamaños y mide, por caso y tamaño:
+
+- schedule_seconds: duración de schedule() (y el throughput, procesos/s)
+- results_seconds: duración de get_results() (estadísticas y análisis)
+- serialize_seconds: duración de la serialización JSON de los resultados
+- peak_rss_bytes: memoria residente máxima del proceso del caso
+
+Cada caso se ejecuta en un proceso propio (la memoria máxima es la del
+caso y un caso que supera timeout se detiene sin afectar al resto); si un
+caso excede el límite, sus tamaños mayores se omiten. Los resultados se
+guardan en JSON y pueden compararse con una línea base:
+
+    python benchmark.py --sizes 1000 10000 100000 --output actual.json
+    python benchmark.py --sizes 1000 10000 100000 --baseline base.json --threshold 0.1
+
+El comando termina con código 1 si alguna métrica empeora más que el
+umbral respecto a la línea base.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from process import SchedulerFactory
+from workload import WorkloadGenerator
+
+try:
+    import resource
+except ImportError:  # resource solo existe en sistemas Unix
+    resource = None
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional (lo requiere el generador de cargas)
+    np = None
+
+
+# Versión del formato de resultados
+RESULTS_VERSION = 1
+
+# Tamaños de carga por defecto
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+# Quantums de Round Robin por defecto
+DEFAULT_QUANTA = (2, 4, 8)
+
+# Carga fija de los benchmarks: llegadas de Poisson y ráfagas exponenciales
+# de media 8 con carga ofrecida 0.9 (la cola de listos crece pero no diverge)
+BENCHMARK_SEED = 20240601
+BENCHMARK_WORKLOAD = {
+    'arrival': 'poisson',
+    'arrival_options': {'rate': 0.9 / 8},
+    'burst': 'exponential',
+    'burst_options': {'mean': 8},
+    'priority_levels': 8,
+}
+
+# Repeticiones por defecto (se conserva la mejor y la mediana); a partir de
+# LARGE_SIZE procesos cada caso se ejecuta una sola vez
+DEFAULT_REPEAT = 3
+LARGE_SIZE = 10 ** 6
+
+# Segundos máximos por caso y tamaño
+DEFAULT_TIMEOUT = 300
+
+# Umbral de regresión por defecto (0.1 = 10 % más lento o más memoria)
+DEFAULT_THRESHOLD = 0.10
+
+# Métricas comparadas con la línea base (menor es mejor)
+COMPARED_METRICS = ('schedule_seconds', 'results_seconds', 'serialize_seconds', 'peak_rss_bytes')
+
+# Duraciones por debajo de este valor no se comparan (son ruido)
+MIN_COMPARED_SECONDS = 0.01
+
+
+def benchmark_cases(algorithms=('FCFS', 'SJF', 'RR', 'SRTF', 'PRIORITY'), quanta=DEFAULT_QUANTA,
+                    backend='python', event_driven=False):
+    """
+    Casos del benchmark: uno por algoritmo y, para RR, uno por quantum.
+
+    El nombre incluye el backend (FCFS/SJF) y el modo por eventos (RR)
+    cuando no son los de por defecto, para no confundirlos en la línea base.
+
+    Returns:
+        list: Diccionarios con name, algorithm, quantum, backend y event_driven
+    """
+    cases = []
+    for algorithm in algorithms:
+        if algorithm == 'RR':
+            for quantum in quanta:
+                name = f'RR (q={quantum}, eventos)' if event_driven else f'RR (q={quantum})'
+                cases.append({'name': name, 'algorithm': 'RR', 'quantum': quantum,
+                              'backend': 'python', 'event_driven': event_driven})
+        elif algorithm in ('FCFS', 'SJF'):
+            name = algorithm if backend == 'python' else f'{algorithm} ({backend})'
+            cases.append({'name': name, 'algorithm': algorithm, 'quantum': None,
+                          'backend': backend, 'event_driven': False})
+        else:
+            cases.append({'name': algorithm, 'algorithm': algorithm, 'quantum': None,
+                          'backend': 'python', 'event_driven': False})
+    return cases
+
+
+def _create_scheduler(case):
+    if case['algorithm'] == 'RR':
+        return SchedulerFactory.create_scheduler('RR', quantum=case['quantum'], event_driven=case['event_driven'])
+    if case['algorithm'] in ('FCFS', 'SJF'):
+        return SchedulerFactory.create_scheduler(case['algorithm'], backend=case['backend'])
+    return SchedulerFactory.create_scheduler(case['algorithm'])
+
+
+def _peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss está en KiB en Linux y en bytes en macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_case(case, size, repeat=DEFAULT_REPEAT, seed=BENCHMARK_SEED):
+    """
+    Ejecuta un caso sobre la carga fija de size procesos.
+
+    Cada repetición crea un scheduler nuevo y vuelve a cargar la misma carga;
+    las duraciones son la mejor repetición (y la mediana de schedule()).
+
+    Returns:
+        dict: Métricas del caso (ver el docstring del módulo)
+    """
+    generator = WorkloadGenerator(size, seed=seed, **BENCHMARK_WORKLOAD)
+    runs = []
+    for _ in range(repeat if size < LARGE_SIZE else 1):
+        scheduler = _create_scheduler(case)
+        started = time.perf_counter()
+        generator.load(scheduler)
+        loaded = time.perf_counter()
+        scheduler.schedule()
+        scheduled = time.perf_counter()
+        results = scheduler.get_results()
+        collected = time.perf_counter()
+        body = json.dumps(results, sort_keys=True)
+        serialized = time.perf_counter()
+        runs.append({
+            'load_seconds': loaded - started,
+            'schedule_seconds': scheduled - loaded,
+            'results_seconds': collected - scheduled,
+            'serialize_seconds': serialized - collected,
+            'response_bytes': len(body),
+            'segments': len(results['gantt_chart']),
+        })
+        del scheduler, results, body
+
+    schedule_times = [run['schedule_seconds'] for run in runs]
+    best = min(schedule_times)
+    return {
+        'repeat': len(runs),
+        'load_seconds': min(run['load_seconds'] for run in runs),
+        'schedule_seconds': best,
+        'schedule_seconds_median': statistics.median(schedule_times),
+        'results_seconds': min(run['results_seconds'] for run in runs),
+        'serialize_seconds': min(run['serialize_seconds'] for run in runs),
+        'response_bytes': runs[0]['response_bytes'],
+        'segments': runs[0]['segments'],
+        'throughput': round(size / best, 1) if best else None,
+        'peak_rss_bytes': _peak_rss_bytes(),
+    }
+
+
+def _run_isolated(case, size, repeat, seed, timeout):
+    # Un proceso nuevo por caso: la memoria máxima es solo la del caso y se
+    # puede detener si supera el límite de tiempo
+    context = multiprocessing.get_context('spawn')
+    pool = context.Pool(processes=1, maxtasksperchild=1)
+    try:
+        return pool.apply_async(run_case, (case, size, repeat, seed)).get(timeout)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def run_suite(cases=None, sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT, seed=BENCHMARK_SEED,
+              timeout=DEFAULT_TIMEOUT, isolate=True, progress=None):
+    """
+    Ejecuta todos los casos para cada tamaño (de menor a mayor).
+
+    Args:
+        cases (list): Casos (ver benchmark_cases()); por defecto todos
+        sizes (iterable): Número de procesos de cada carga
+        repeat (int): Repeticiones por caso y tamaño
+        seed (int): Semilla de las cargas
+        timeout (float): Segundos máximos por caso y tamaño (solo con isolate)
+        isolate (bool): Ejecutar cada caso en un proceso propio
+        progress: Función progress(result) llamada tras cada medición
+
+    Returns:
+        dict: Resultados listos para guardar como JSON
+    """
+    cases = cases or benchmark_cases()
+    sizes = sorted(int(size) for size in sizes)
+    measurements = []
+    for case in cases:
+        failed = None
+        for size in sizes:
+            result = {'case': case['name'], 'algorithm': case['algorithm'], 'quantum': case['quantum'],
+                      'backend': case['backend'], 'event_driven': case['event_driven'], 'size': size}
+            if failed:
+                result['status'] = 'skipped'
+                result['error'] = f'Omitido: el tamaño anterior terminó con {failed}'
+            else:
+                try:
+                    if isolate:
+                        result.update(_run_isolated(case, size, repeat, seed, timeout))
+                    else:
+                        result.update(run_case(case, size, repeat, seed))
+                        result['peak_rss_bytes'] = None
+                    result['status'] = 'ok'
+                except multiprocessing.TimeoutError:
+                    result['status'] = failed = 'timeout'
+                    result['error'] = f'Superó {timeout} s'
+                except Exception as e:
+                    result['status'] = failed = 'error'
+                    result['error'] = str(e) or type(e).__name__
+            measurements.append(result)
+            if progress is not None:
+                progress(result)
+
+    return {
+        'version': RESULTS_VERSION,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'environment': environment(),
+        'workload': dict(BENCHMARK_WORKLOAD, seed=seed),
+        'repeat': repeat,
+        'results': measurements,
+    }
+
+
+def environment():
+    """Descripción de la máquina y las versiones (para interpretar los resultados)."""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'numpy': np.__version__ if np is not None else None,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': multiprocessing.cpu_count(),
+    }
+
+
+def _result_key(result):
+    """Clave de una medición en la comparación: el mismo código y la misma carga."""
+    return (result['case'], result.get('backend', 'python'), bool(result.get('event_driven')), result['size'])
+
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD, metrics=COMPARED_METRICS):
+    """
+    Compara unos resultados con la línea base.
+
+    Se comparan las mediciones correctas de ambos con el mismo caso,
+    backend, modo por eventos y tamaño (ver _result_key). Una métrica empeora si current / baseline > 1 + threshold
+    (las duraciones menores que MIN_COMPARED_SECONDS en ambos no cuentan).
+
+    Returns:
+        dict: {'comparisons': [...], 'regressions': [...]} con case, size,
+        metric, baseline, current y ratio
+
+    Raises:
+        ValueError: Si las cargas de los dos resultados no son la misma
+    """
+    if current.get('workload') != baseline.get('workload'):
+        raise ValueError('La línea base se midió con otra carga de trabajo; no es comparable.')
+    previous = {_result_key(result): result
+                for result in baseline.get('results', ()) if result.get('status') == 'ok'}
+
+    comparisons = []
+    regressions = []
+    for result in current.get('results', ()):
+        before = previous.get(_result_key(result))
+        if before is None or result.get('status') != 'ok':
+            continue
+        for metric in metrics:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            if metric.endswith('_seconds') and max(old, new) < MIN_COMPARED_SECONDS:
+                continue
+            comparison = {'case': result['case'], 'size': result['size'], 'metric': metric,
+                          'baseline': old, 'current': new, 'ratio': round(new / old, 4)}
+            comparisons.append(comparison)
+            if new / old > 1 + threshold:
+                regressions.append(comparison)
+    return {'threshold': threshold, 'comparisons': comparisons, 'regressions': regressions}
+
+
+def _format_result(result):
+    label = f"{result['case']:<20} {result['size']:>10,}"
+    if result['status'] != 'ok':
+        return f"{label}  {result['status']}: {result.get('error', '')}"
+    rss = result.get('peak_rss_bytes')
+    rss = f"{rss / 2 ** 20:8.1f} MiB" if rss else '       - MiB'
+    return (f"{label}  schedule {result['schedule_seconds']:9.4f} s  "
+            f"results {result['results_seconds']:9.4f} s  "
+            f"json {result['serialize_seconds']:9.4f} s  "
+            f"{result['throughput']:>12,.0f} proc/s  {rss}")
+
+
+def main(argv=None):
+    """Ejecuta el benchmark desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Benchmarks reproducibles de los schedulers.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--algorithms', nargs='+', default=['FCFS', 'SJF', 'RR', 'SRTF', 'PRIORITY'],
+                        choices=('FCFS', 'SJF', 'RR', 'SRTF', 'PRIORITY'))
+    parser.add_argument('--quanta', type=int, nargs='+', default=list(DEFAULT_QUANTA))
+    parser.add_argument('--backend', choices=('python', 'numpy'), default='python',
+                        help='Backend de FCFS y SJF')
+    parser.add_argument('--event-driven', action='store_true', help='RR por eventos')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    parser.add_argument('--seed', type=int, default=BENCHMARK_SEED)
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='Segundos máximos por caso y tamaño')
+    parser.add_argument('--no-isolate', action='store_true',
+                        help='Ejecutar los casos en este proceso (sin límite de tiempo ni memoria por caso)')
+    parser.add_argument('--output', help='Archivo JSON donde guardar los resultados')
+    parser.add_argument('--baseline', help='Resultados JSON con los que comparar')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Empeoramiento tolerado respecto a la línea base (0.1 = 10 %%)')
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1 or args.threshold < 0 or any(size < 1 for size in args.sizes):
+        parser.error('repeat y los tamaños deben ser positivos y threshold no negativo')
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as source:
+            baseline = json.load(source)
+
+    cases = benchmark_cases(args.algorithms, args.quanta, args.backend, args.event_driven)
+    results = run_suite(cases, args.sizes, args.repeat, args.seed, args.timeout, not args.no_isolate,
+                        progress=lambda result: print(_format_result(result), flush=True))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as target:
+            json.dump(results, target, indent=2)
+            target.write('\n')
+
+    if baseline is not None:
+        try:
+            report = compare_results(results, baseline, args.threshold)
+        except ValueError as e:
+            parser.exit(2, f'Error: {e}\n')
+        print(f"\n{len(report['comparisons'])} métrica(s) comparada(s), "
+              f"{len(report['regressions'])} regresión(es) (umbral {args.threshold:.0%}).")
+        for regression in report['regressions']:
+            print(f"  {regression['case']} n={regression['size']:,} {regression['metric']}: "
+                  f"{regression['baseline']:.4g} -> {regression['current']:.4g} (x{regression['ratio']})")
+        if report['regressions']:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,331 @@
+"""
+Experimentos sobre una misma carga de trabajo.
+
+sweep_quantum() ejecuta RoundRobinScheduler para una serie de quantums en
+un pool de procesos y resume cada ejecución (WT/TT promedio, NTAT promedio
+y cambios de contexto), para obtener la curva completa en una sola llamada.
+
+compare_algorithms() ejecuta varios algoritmos (y varios quantums de Round
+Robin) sobre la misma carga, ordenada una sola vez, y retorna sus métricas
+por proceso alineadas en un mismo orden y sus diagramas de Gantt sobre un
+mismo eje de tiempo.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from process import RoundRobinScheduler, SchedulerFactory
+from process_table import ProcessTable
+
+
+# Máximo de puntos aceptados en un barrido
+MAX_SWEEP_POINTS = 1000
+
+# Algoritmos que acepta compare_algorithms()
+COMPARE_ALGORITHMS = ('FCFS', 'SJF', 'RR', 'SRTF', 'PRIORITY')
+
+# Quantum de Round Robin si no se indican quantums en una comparación
+DEFAULT_COMPARE_QUANTUM = 4
+
+# Máximo de ejecuciones (algoritmo, quantum) por comparación
+MAX_COMPARE_RUNS = 64
+
+# Métricas en las que compare_algorithms() señala la mejor ejecución (menor es mejor)
+COMPARE_METRICS = (
+    'average_waiting_time',
+    'average_turnaround_time',
+    'average_normalized_turnaround_time',
+    'makespan',
+    'context_switches'
+)
+
+# Scheduler de cada proceso del pool (la carga se envía una sola vez por worker)
+_worker_scheduler = None
+
+# Carga ordenada de cada proceso del pool en las comparaciones
+_worker_workload = None
+
+
+def unique_quanta(quanta, limit, message):
+    """
+    Quantums ordenados y sin repetir.
+
+    El número de puntos se comprueba antes de construir la lista: en un
+    range con su longitud (aritmética, sin recorrerlo) y en una lista con
+    los elementos recibidos, así que un rango enorme se rechaza sin
+    reservar memoria.
+
+    Args:
+        quanta (iterable): range o lista de quantums
+        limit (int): Máximo de quantums aceptados
+        message (str): Mensaje del error si se supera limit ({} = limit)
+
+    Raises:
+        ValueError: Si hay más de limit quantums o alguno no es positivo
+    """
+    if not isinstance(quanta, range):
+        quanta = list(quanta)
+    if len(quanta) > limit:
+        raise ValueError(message.format(limit))
+    quanta = sorted(set(int(q) for q in quanta))
+    if not quanta or quanta[0] <= 0:
+        raise ValueError('Los quantums deben ser enteros positivos.')
+    return quanta
+
+
+def _build_scheduler(pids, arrival_times, burst_times, event_driven):
+    """Crea un RoundRobinScheduler con la carga de trabajo, ordenada una única vez."""
+    scheduler = RoundRobinScheduler(event_driven=event_driven)
+    scheduler.add_processes(pids, arrival_times, burst_times)
+    scheduler.processes.sort_by('arrival_time', 'pid')
+    return scheduler
+
+
+def _init_worker(*workload):
+    """Inicializador del pool: cada worker recibe la carga una sola vez."""
+    global _worker_scheduler
+    _worker_scheduler = _build_scheduler(*workload)
+
+
+def _summarize(scheduler):
+    """Métricas resumidas de una ejecución de Round Robin."""
+    table = scheduler.processes
+    count = len(table)
+    return {
+        'quantum': scheduler.quantum,
+        'average_waiting_time': round(scheduler.calculate_average_waiting_time(), 2),
+        'average_turnaround_time': round(scheduler.calculate_average_turnaround_time(), 2),
+        'average_normalized_turnaround_time': round(sum(table.normalized_turnaround_time) / count, 2) if count else 0,
+        # Igual que analyze_round_robin() en /schedule: un cambio por quantum
+        # después del primero de cada proceso. Se cuenta desde los quantums
+        # usados y no desde los segmentos, porque en modo por eventos los
+        # quantums consecutivos de un mismo proceso forman un solo segmento
+        'context_switches': max(sum(table.quantum_used) - count, 0)
+    }
+
+
+def _run_quantum(scheduler, quantum):
+    """Ejecuta Round Robin con el quantum indicado y resume el resultado."""
+    scheduler.quantum = quantum
+    scheduler.schedule()
+    return _summarize(scheduler)
+
+
+def _run_worker_quantum(quantum):
+    """Tarea del pool: ejecuta un quantum sobre la carga del worker."""
+    return _run_quantum(_worker_scheduler, quantum)
+
+
+def sweep_quantum(table, quanta, workers=None, event_driven=True, progress=None):
+    """
+    Ejecuta Round Robin para cada quantum sobre la misma carga de trabajo.
+
+    Args:
+        table (ProcessTable): Procesos a planificar (p. ej. scheduler.processes)
+        quanta (iterable): Quantums a evaluar (enteros positivos)
+        workers (int): Procesos del pool (por defecto os.cpu_count()); con 1
+            o un solo quantum se ejecuta en el proceso actual
+        event_driven (bool): Usa la simulación por eventos de Round Robin
+        progress: Función progress(completados, total) que se llama tras
+            cada quantum; si lanza una excepción el barrido se interrumpe
+            (los quantums pendientes del pool se cancelan)
+
+    Returns:
+        list: Un resumen por quantum, en orden creciente de quantum
+    """
+    quanta = unique_quanta(quanta, MAX_SWEEP_POINTS, 'Máximo {} quantums por barrido.')
+
+    workload = (list(table.pids), table.arrival_time.tolist(), table.burst_time.tolist(), event_driven)
+    workers = min(workers or os.cpu_count() or 1, len(quanta))
+
+    results = []
+    if workers <= 1:
+        scheduler = _build_scheduler(*workload)
+        for quantum in quanta:
+            results.append(_run_quantum(scheduler, quantum))
+            if progress is not None:
+                progress(len(results), len(quanta))
+        return results
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=workload)
+    try:
+        for summary in pool.map(_run_worker_quantum, quanta):
+            results.append(summary)
+            if progress is not None:
+                progress(len(results), len(quanta))
+        return results
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _init_compare_worker(*workload):
+    """Inicializador del pool de comparación: la carga ordenada llega una sola vez."""
+    global _worker_workload
+    _worker_workload = workload
+
+
+def _aligned(table, column, position):
+    """Columna de la tabla reordenada al orden común de la comparación."""
+    values = getattr(table, column)
+    if position is None:
+        return values.tolist()
+    aligned = [0] * len(values)
+    for pid, value in zip(table.pids, values):
+        aligned[position[pid]] = value
+    return aligned
+
+
+def _average_normalized_turnaround(table):
+    """
+    NTAT promedio (TT / BT) calculado desde las columnas de la tabla, con el
+    mismo redondeo por proceso que Round Robin (los demás algoritmos no
+    rellenan la columna normalized_turnaround_time).
+    """
+    total = sum(round(turnaround_time / burst_time, 2) if burst_time > 0 else 0
+                for turnaround_time, burst_time in zip(table.turnaround_time, table.burst_time))
+    return total / len(table)
+
+
+def _context_switches(scheduler):
+    """
+    Cambios de contexto de una ejecución, como los reporta /schedule.
+
+    En Round Robin se cuentan desde los quantums usados (igual que
+    _summarize y analyze_round_robin), porque en modo por eventos los
+    quantums consecutivos de un mismo proceso forman un solo segmento; en
+    los demás algoritmos, cada segmento extra de un proceso es una
+    expulsión.
+    """
+    table = scheduler.processes
+    if isinstance(scheduler, RoundRobinScheduler):
+        return max(sum(table.quantum_used) - len(table), 0)
+    return max(scheduler.gantt_chart.count_process_segments() - len(table), 0)
+
+
+def _run_comparison(workload, algorithm, quantum, event_driven):
+    """Ejecuta un algoritmo sobre la carga ordenada y resume el resultado."""
+    pids, arrival_times, burst_times, priorities = workload
+    scheduler = SchedulerFactory.create_scheduler(algorithm, quantum=quantum, event_driven=event_driven)
+    scheduler.add_processes(pids, arrival_times, burst_times, priorities)
+    scheduler.schedule()
+
+    table = scheduler.processes
+    count = len(table)
+    makespan = max(table.completion_time)
+    # Los algoritmos que reordenan la tabla (p. ej. SJF) se llevan al orden común
+    position = None if table.pids == pids else {pid: row for row, pid in enumerate(pids)}
+    return {
+        'label': f'RR (q={quantum})' if algorithm == 'RR' else algorithm,
+        'algorithm': algorithm,
+        'quantum': quantum if algorithm == 'RR' else None,
+        'metrics': {
+            'average_waiting_time': round(scheduler.calculate_average_waiting_time(), 2),
+            'average_turnaround_time': round(scheduler.calculate_average_turnaround_time(), 2),
+            'average_normalized_turnaround_time': round(_average_normalized_turnaround(table), 2),
+            'makespan': makespan,
+            'throughput': round(count / makespan, 4) if makespan else 0,
+            'cpu_utilization': round(sum(table.burst_time) / makespan, 4) if makespan else 0,
+            'context_switches': _context_switches(scheduler)
+        },
+        'statistics': scheduler.calculate_statistics(),
+        'completion_time': _aligned(table, 'completion_time', position),
+        'turnaround_time': _aligned(table, 'turnaround_time', position),
+        'waiting_time': _aligned(table, 'waiting_time', position),
+        'gantt': scheduler.gantt_chart
+    }
+
+
+def _run_worker_comparison(run):
+    """Tarea del pool: ejecuta una comparación sobre la carga del worker."""
+    return _run_comparison(_worker_workload, *run)
+
+
+def comparison_runs(algorithms, quanta=None):
+    """
+    Lista de ejecuciones (algoritmo, quantum) de una comparación: un quantum
+    por ejecución de Round Robin y None en los demás algoritmos.
+    """
+    runs = []
+    for algorithm in dict.fromkeys(str(name).upper() for name in algorithms):
+        if algorithm not in COMPARE_ALGORITHMS:
+            raise ValueError(f'Algoritmo {algorithm} no soportado. Algoritmos disponibles: {", ".join(COMPARE_ALGORITHMS)}')
+        if algorithm == 'RR':
+            rr_quanta = (unique_quanta(quanta, MAX_COMPARE_RUNS, 'Máximo {} ejecuciones por comparación.')
+                         if quanta else [DEFAULT_COMPARE_QUANTUM])
+            runs.extend(('RR', quantum) for quantum in rr_quanta)
+        else:
+            runs.append((algorithm, None))
+    if not runs:
+        raise ValueError('Indique al menos un algoritmo para comparar.')
+    if len(runs) > MAX_COMPARE_RUNS:
+        raise ValueError(f'Máximo {MAX_COMPARE_RUNS} ejecuciones por comparación.')
+    return runs
+
+
+def compare_algorithms(table, algorithms=('FCFS', 'SJF', 'RR'), quanta=None, workers=None,
+                       gantt='full', event_driven=True):
+    """
+    Ejecuta varios algoritmos sobre la misma carga de trabajo.
+
+    La carga se ordena una sola vez (por llegada y PID) y se envía una sola
+    vez a cada proceso del pool; cada ejecución corre en paralelo.
+
+    Args:
+        table (ProcessTable): Procesos a planificar (no se modifica)
+        algorithms (iterable): Algoritmos a comparar (ver COMPARE_ALGORITHMS)
+        quanta (iterable): Quantums de Round Robin (una ejecución por quantum)
+        workers (int): Procesos del pool (por defecto os.cpu_count()); con 1
+            o una sola ejecución se ejecuta en el proceso actual
+        gantt: 'full' (todos los segmentos), 'none' o un ancho en píxeles
+            para agregar cada diagrama (ver GanttIndex.downsample) sobre la
+            ventana común a todas las ejecuciones
+        event_driven (bool): Usa la simulación por eventos de Round Robin
+
+    Returns:
+        dict: 'pids', 'arrival_time' y 'burst_time' en el orden común; 'runs'
+        con las métricas, estadísticas, tiempos por proceso (alineados con
+        'pids') y el Gantt de cada ejecución; y 'best' con la etiqueta de la
+        mejor ejecución en cada métrica de COMPARE_METRICS
+    """
+    runs = comparison_runs(algorithms, quanta)
+    if not len(table):
+        raise ValueError('No hay procesos para comparar.')
+    if gantt not in ('full', 'none') and (not isinstance(gantt, int) or gantt <= 0):
+        raise ValueError("gantt debe ser 'full', 'none' o un ancho en píxeles positivo.")
+
+    # Ordenar una sola vez (sobre una copia: la tabla del llamador no cambia)
+    sorted_table = ProcessTable()
+    sorted_table.extend(table.pids, table.arrival_time, table.burst_time, table.priority)
+    sorted_table.sort_by('arrival_time', 'pid')
+    workload = (sorted_table.pids, sorted_table.arrival_time, sorted_table.burst_time, sorted_table.priority)
+
+    workers = min(workers or os.cpu_count() or 1, len(runs))
+    if workers <= 1:
+        results = [_run_comparison(workload, algorithm, quantum, event_driven) for algorithm, quantum in runs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_compare_worker, initargs=workload) as pool:
+            results = list(pool.map(_run_worker_comparison,
+                                    [(algorithm, quantum, event_driven) for algorithm, quantum in runs]))
+
+    # Diagramas sobre un mismo eje de tiempo
+    chart_start = min(result['gantt'].start[0] for result in results if len(result['gantt']))
+    chart_end = max(result['gantt'].end[-1] for result in results if len(result['gantt']))
+    for result in results:
+        chart = result.pop('gantt')
+        if gantt == 'full':
+            result['gantt_chart'] = chart.to_list()
+        elif gantt != 'none':
+            result['gantt_chart'] = chart.index().downsample(chart_start, chart_end, gantt)
+
+    return {
+        'pids': list(sorted_table.pids),
+        'arrival_time': sorted_table.arrival_time.tolist(),
+        'burst_time': sorted_table.burst_time.tolist(),
+        'chart_start': chart_start,
+        'chart_end': chart_end,
+        'runs': results,
+        'best': {
+            metric: min(results, key=lambda result: result['metrics'][metric])['label']
+            for metric in COMPARE_METRICS
+        }
+    }
@@ -0,0 +1,171 @@
+"""
+Análisis de equidad y starvation de una ejecución.
+
+Un proceso q es adelantado por p cuando p llegó después (AT_p > AT_q) pero
+tiene una ráfaga menor (BT_p < BT_q), que es lo que hace SJF al ordenar por
+BT. Contar los adelantamientos comparando cada par es O(n²); aquí se
+recorren los procesos por tiempo de llegada con un árbol de Fenwick sobre
+el rango de cada BT, así que el análisis completo es O(n log n).
+
+El informe es de tamaño acotado: totales, espera máxima, índice de
+equidad de Jain y los top_k procesos con más espera, en lugar de una
+línea por proceso.
+"""
+
+import heapq
+from array import array
+from collections import Counter
+
+
+# Procesos más perjudicados que se listan en el informe
+DEFAULT_TOP_K = 5
+
+
+class FenwickTree:
+    """
+    Árbol de Fenwick (binary indexed tree) de conteos.
+
+    Suma posiciones y consulta sumas de prefijos en O(log n).
+    """
+
+    __slots__ = ('_tree',)
+
+    def __init__(self, size):
+        self._tree = [0] * (size + 1)
+
+    def add(self, index, amount=1):
+        """Suma amount en la posición index (desde 0)."""
+        tree = self._tree
+        index += 1
+        while index < len(tree):
+            tree[index] += amount
+            index += index & -index
+
+    def prefix_sum(self, index):
+        """Suma de las posiciones [0, index)."""
+        tree = self._tree
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+
+def overtake_counts(arrival_times, burst_times):
+    """
+    Cuenta los adelantamientos de cada proceso en O(n log n).
+
+    Args:
+        arrival_times: Columna de tiempos de llegada
+        burst_times: Columna de tiempos de ráfaga (misma longitud)
+
+    Returns:
+        tuple: (overtaken_by, overtook), dos array('q') por fila: cuántos
+        procesos que llegaron después con menor BT adelantaron a cada uno,
+        y a cuántos que llegaron antes con mayor BT adelantó cada uno
+    """
+    count = len(arrival_times)
+    overtaken_by = array('q', bytes(8 * count))
+    overtook = array('q', bytes(8 * count))
+
+    # Rango de cada BT y cuántos procesos tienen un BT de rango menor
+    frequencies = Counter(burst_times)
+    bursts = sorted(frequencies)
+    rank = {burst: position for position, burst in enumerate(bursts)}
+    shorter = []
+    seen = 0
+    for burst in bursts:
+        shorter.append(seen)
+        seen += frequencies[burst]
+
+    tree = FenwickTree(len(bursts))
+    order = sorted(range(count), key=arrival_times.__getitem__)
+    inserted = 0
+    start = 0
+    while start < count:
+        # Los procesos con el mismo AT no se adelantan entre sí
+        arrival = arrival_times[order[start]]
+        end = start
+        while end < count and arrival_times[order[end]] == arrival:
+            end += 1
+        group = order[start:end]
+
+        # Llegaron antes y tienen mayor BT
+        for row in group:
+            overtook[row] = inserted - tree.prefix_sum(rank[burst_times[row]] + 1)
+        for row in group:
+            tree.add(rank[burst_times[row]])
+        inserted += len(group)
+        # Con menor BT en total, menos los que no llegaron después
+        for row in group:
+            position = rank[burst_times[row]]
+            overtaken_by[row] = shorter[position] - tree.prefix_sum(position)
+        start = end
+
+    return overtaken_by, overtook
+
+
+def jain_index(values):
+    """
+    Índice de equidad de Jain: (Σx)² / (n·Σx²), entre 1/n y 1 (todos iguales).
+
+    Retorna 1.0 si no hay valores o todos son 0.
+    """
+    count = 0
+    total = 0.0
+    squares = 0.0
+    for value in values:
+        count += 1
+        total += value
+        squares += value * value
+    if not squares:
+        return 1.0
+    return total * total / (count * squares)
+
+
+def fairness_report(table, top_k=DEFAULT_TOP_K):
+    """
+    Informe de equidad y starvation de una tabla ya planificada.
+
+    La equidad se mide con el índice de Jain sobre el slowdown de cada
+    proceso (TT / BT): 1 si todos esperan en proporción a su ráfaga.
+
+    Args:
+        table (ProcessTable): Procesos con los tiempos ya calculados
+        top_k (int): Procesos más perjudicados a listar
+
+    Returns:
+        dict: Adelantamientos totales, procesos adelantados y que
+        adelantaron, espera máxima, índice de Jain y top_starved (los top_k
+        de mayor espera, con sus adelantamientos)
+    """
+    count = len(table)
+    if not count:
+        return {}
+
+    arrival_times = table.arrival_time
+    burst_times = table.burst_time
+    waiting_times = table.waiting_time
+    turnaround_times = table.turnaround_time
+    pids = table.pids
+    overtaken_by, overtook = overtake_counts(arrival_times, burst_times)
+
+    slowdowns = (turnaround / burst for turnaround, burst in zip(turnaround_times, burst_times) if burst)
+    # Mayor espera; a igual espera, el más adelantado
+    starved = heapq.nlargest(top_k, range(count), key=lambda row: (waiting_times[row], overtaken_by[row]))
+
+    return {
+        'overtakes': sum(overtaken_by),
+        'overtaken_processes': count - overtaken_by.count(0),
+        'overtaking_processes': count - overtook.count(0),
+        'max_overtaken_by': max(overtaken_by),
+        'max_waiting_time': waiting_times[starved[0]] if starved else max(waiting_times),
+        'jain_index': round(jain_index(slowdowns), 4),
+        'top_starved': [{
+            'pid': pids[row],
+            'arrival_time': arrival_times[row],
+            'burst_time': burst_times[row],
+            'waiting_time': waiting_times[row],
+            'overtaken_by': overtaken_by[row],
+        } for row in starved],
+    }
@@ -0,0 +1,381 @@
+"""
+Diagrama de Gantt en columnas.
+
+Cada segmento del diagrama se guarda en arreglos paralelos de enteros
+(inicio, fin, código de PID y los campos extra de cada algoritmo) en lugar
+de un diccionario por segmento. Los PIDs se internan: cada PID distinto se
+guarda una sola vez y los segmentos solo almacenan su código; el código
+IDLE (-1) marca los segmentos en que la CPU está ociosa.
+
+El formato clásico (lista de diccionarios con 'type', 'pid', 'start',
+'end', 'duration', ...) se genera bajo demanda con to_list().
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo usa extend_columns()
+    np = None
+
+
+# Código de PID de los segmentos idle
+IDLE = -1
+
+
+def _as_array(values):
+    """Convierte un iterable o arreglo NumPy en array('q')."""
+    if np is not None and isinstance(values, np.ndarray):
+        column = array('q')
+        column.frombytes(values.astype(np.int64, copy=False).tobytes())
+        return column
+    return array('q', values)
+
+
+class GanttChart:
+    """
+    Diagrama de Gantt compacto (struct-of-arrays).
+
+    Args:
+        extra_fields (tuple): Campos enteros adicionales de los segmentos de
+            proceso, en el orden en que aparecen en el diccionario (p. ej.
+            ('quantum_number', 'remaining_time') para Round Robin)
+    """
+
+    def __init__(self, extra_fields=()):
+        self.start = array('q')
+        self.end = array('q')
+        self.pid_code = array('q')
+        self.pids = []
+        # PID -> código (None hasta que haga falta, ver _code_map())
+        self._codes = None
+        self.extra_fields = tuple(extra_fields)
+        self.extras = {name: array('q') for name in self.extra_fields}
+        # Cambia cada vez que se eliminan segmentos (los añadidos ya cambian
+        # la longitud); index() lo usa para saber si su índice sigue vigente
+        self.revision = 0
+        self._index = None
+
+    def __len__(self):
+        return len(self.start)
+
+    def __iter__(self):
+        """Itera sobre los segmentos en formato diccionario."""
+        return (self.segment(index) for index in range(len(self.start)))
+
+    def __getitem__(self, index):
+        size = len(self.start)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError('Índice de segmento fuera de rango')
+        return self.segment(index)
+
+    def _code_map(self):
+        """Diccionario PID -> código, construyéndolo si intern_many() lo omitió."""
+        if self._codes is None:
+            self._codes = dict(zip(self.pids, range(len(self.pids))))
+        return self._codes
+
+    def intern(self, pid):
+        """Retorna el código del PID, registrándolo si es nuevo."""
+        codes = self._code_map()
+        code = codes.get(pid)
+        if code is None:
+            code = codes[pid] = len(self.pids)
+            self.pids.append(pid)
+        return code
+
+    def intern_many(self, pids, unique=False):
+        """
+        Códigos de una lista de PIDs, como intern() sobre cada uno.
+
+        Con unique=True (los PIDs no se repiten, como los de una
+        ProcessTable) y el diagrama sin PIDs, el código de cada PID es su
+        posición: no se hace un intern() por PID y el diccionario de códigos
+        solo se construye si luego se necesita.
+        """
+        if unique and not self.pids:
+            self.pids = list(pids)
+            self._codes = None
+            return range(len(self.pids))
+        return [self.intern(pid) for pid in pids]
+
+    def add_process(self, pid, start, end, *extras):
+        """Añade un segmento de proceso (extras en el orden de extra_fields)."""
+        codes = self._codes
+        if codes is None:
+            codes = self._code_map()
+        code = codes.get(pid)
+        if code is None:
+            code = self.intern(pid)
+        self.start.append(start)
+        self.end.append(end)
+        self.pid_code.append(code)
+        for name, value in zip(self.extra_fields, extras):
+            self.extras[name].append(value)
+
+    def add_idle(self, start, end):
+        """Añade un segmento idle."""
+        self.start.append(start)
+        self.end.append(end)
+        self.pid_code.append(IDLE)
+        for column in self.extras.values():
+            column.append(0)
+
+    def extend_columns(self, pid_codes, starts, ends, **extras):
+        """
+        Añade segmentos en bloque a partir de columnas.
+
+        Args:
+            pid_codes: Códigos de PID (de intern()) o IDLE por segmento
+            starts, ends: Inicio y fin de cada segmento
+            **extras: Una columna por cada campo de extra_fields
+        """
+        count = len(starts)
+        self.start.extend(_as_array(starts))
+        self.end.extend(_as_array(ends))
+        self.pid_code.extend(_as_array(pid_codes))
+        for name in self.extra_fields:
+            values = extras.get(name)
+            self.extras[name].extend(_as_array(values) if values is not None else array('q', bytes(8 * count)))
+
+    def drop_last_processes(self, count):
+        """
+        Elimina los últimos count segmentos de proceso, junto con los
+        segmentos idle que siguen al último proceso conservado (los que
+        llevaban al primer proceso eliminado). Cuesta O(segmentos eliminados).
+        """
+        length = len(self.pid_code)
+        pid_code = self.pid_code
+        while count > 0 and length > 0:
+            length -= 1
+            if pid_code[length] != IDLE:
+                count -= 1
+        while length > 0 and pid_code[length - 1] == IDLE:
+            length -= 1
+        for column in [self.start, self.end, self.pid_code] + list(self.extras.values()):
+            del column[length:]
+        self.revision += 1
+
+    def is_idle(self, index):
+        """Indica si el segmento es idle."""
+        return self.pid_code[index] == IDLE
+
+    def pid_at(self, index):
+        """PID del segmento (None si es idle)."""
+        code = self.pid_code[index]
+        return None if code == IDLE else self.pids[code]
+
+    def segment(self, index):
+        """Convierte un segmento al formato diccionario clásico."""
+        start = self.start[index]
+        end = self.end[index]
+        code = self.pid_code[index]
+        if code == IDLE:
+            return {
+                'type': 'idle',
+                'start': start,
+                'end': end,
+                'duration': end - start
+            }
+        segment = {
+            'type': 'process',
+            'pid': self.pids[code],
+            'start': start,
+            'end': end,
+            'duration': end - start
+        }
+        for name in self.extra_fields:
+            segment[name] = self.extras[name][index]
+        return segment
+
+    def to_list(self):
+        """Convierte todo el diagrama a la lista de diccionarios de get_results()."""
+        return [self.segment(index) for index in range(len(self.start))]
+
+    def to_columns(self):
+        """Formato columnar compacto para JSON (un arreglo por campo)."""
+        columns = {
+            'pids': list(self.pids),
+            'pid_code': self.pid_code.tolist(),
+            'start': self.start.tolist(),
+            'end': self.end.tolist()
+        }
+        for name in self.extra_fields:
+            columns[name] = self.extras[name].tolist()
+        return columns
+
+    def index(self):
+        """
+        Índice de consultas por intervalo del diagrama (ver GanttIndex).
+
+        Se construye una vez y se reutiliza mientras el diagrama no cambie.
+        """
+        state = (len(self.start), self.revision)
+        if self._index is None or self._index.state != state:
+            self._index = GanttIndex(self)
+            self._index.state = state
+        return self._index
+
+    def count_process_segments(self):
+        """Número de segmentos de proceso (no idle)."""
+        return len(self.pid_code) - self.pid_code.count(IDLE)
+
+    def nbytes(self):
+        """Memoria aproximada de las columnas (sin contar los PIDs internados)."""
+        columns = [self.start, self.end, self.pid_code] + list(self.extras.values())
+        return sum(column.itemsize * len(column) for column in columns)
+
+
+class GanttIndex:
+    """
+    Índice de un diagrama de Gantt para consultas por ventana de tiempo y
+    por PID en O(log n + k).
+
+    Los segmentos de un diagrama son consecutivos y no se solapan, así que
+    tanto los inicios como los fines están ordenados: los segmentos que
+    intersecan [start, end) forman un rango contiguo que se encuentra con
+    dos búsquedas binarias. Para las consultas por PID se guardan los
+    segmentos agrupados por PID, y la lista de cada uno se recorta igual.
+    """
+
+    def __init__(self, gantt):
+        self.gantt = gantt
+        self.state = None
+        # Segmentos de proceso agrupados por código de PID (formato CSR): los
+        # del código c son order[offsets[c]:offsets[c + 1]], en orden
+        pid_count = len(gantt.pids)
+        if np is not None:
+            codes = np.frombuffer(gantt.pid_code, dtype=np.int64)
+            process_rows = np.flatnonzero(codes != IDLE)
+            grouped = process_rows[np.argsort(codes[process_rows], kind='stable')]
+            counts = np.bincount(codes[process_rows], minlength=pid_count)
+            self.order = _as_array(grouped)
+            self.offsets = _as_array(np.concatenate(([0], np.cumsum(counts))))
+        else:
+            counts = [0] * (pid_count + 1)
+            for code in gantt.pid_code:
+                counts[code + 1] += 1  # los idle (-1) caen en counts[0]
+            counts[0] = 0
+            for code in range(pid_count):
+                counts[code + 1] += counts[code]
+            self.offsets = array('q', counts)
+            cursor = counts[:-1]
+            order = array('q', bytes(8 * counts[-1]))
+            for index, code in enumerate(gantt.pid_code):
+                if code != IDLE:
+                    order[cursor[code]] = index
+                    cursor[code] += 1
+            self.order = order
+
+        # Tiempo de CPU ocupada acumulado: busy_prefix[i] es la suma de las
+        # duraciones de los segmentos de proceso anteriores al segmento i
+        if np is not None:
+            starts = np.frombuffer(gantt.start, dtype=np.int64)
+            ends = np.frombuffer(gantt.end, dtype=np.int64)
+            busy = np.where(codes != IDLE, ends - starts, 0)
+            self.busy_prefix = _as_array(np.concatenate(([0], np.cumsum(busy))))
+        else:
+            self.busy_prefix = array('q', accumulate(
+                (end - start if code != IDLE else 0
+                 for start, end, code in zip(gantt.start, gantt.end, gantt.pid_code)),
+                initial=0))
+
+    def window(self, start=None, end=None):
+        """
+        Índices (range) de los segmentos que intersecan [start, end).
+
+        Un extremo None deja la ventana abierta por ese lado.
+        """
+        gantt = self.gantt
+        low = 0 if start is None else bisect_right(gantt.end, start)
+        high = len(gantt.start) if end is None else bisect_left(gantt.start, end)
+        return range(low, max(low, high))
+
+    def pid_window(self, pid, start=None, end=None):
+        """Índices de los segmentos del PID que intersecan [start, end)."""
+        gantt = self.gantt
+        code = gantt._code_map().get(pid)
+        if code is None:
+            return array('q')
+        low = self.offsets[code]
+        high = self.offsets[code + 1]
+        if start is not None:
+            low = bisect_right(self.order, start, low, high, key=gantt.end.__getitem__)
+        if end is not None:
+            high = bisect_left(self.order, end, low, high, key=gantt.start.__getitem__)
+        return self.order[low:max(low, high)]
+
+    def running_at(self, time):
+        """Índice del segmento (de proceso o idle) que contiene el instante time, o None."""
+        gantt = self.gantt
+        index = bisect_right(gantt.start, time) - 1
+        if index >= 0 and time < gantt.end[index]:
+            return index
+        return None
+
+    def downsample(self, start, end, width):
+        """
+        Versión agregada (nivel de detalle) de la ventana [start, end) para
+        dibujarla en width píxeles.
+
+        Los segmentos de al menos un píxel de ancho se retornan tal cual
+        (en formato diccionario). Los más estrechos se agrupan por píxel en
+        tramos {'type': 'busy' | 'mixed' | 'idle', 'start', 'end', 'duration',
+        'busy_time', 'segments'}: 'busy' si la CPU estuvo ocupada todo el
+        tramo, 'mixed' si alternó procesos e idle. El resultado tiene O(width)
+        elementos y cuesta O(width log n), sin importar cuántos segmentos
+        caigan en la ventana.
+        """
+        gantt = self.gantt
+        starts = gantt.start
+        ends = gantt.end
+        busy_prefix = self.busy_prefix
+        window = self.window(start, end)
+        index = window.start
+        stop = window.stop
+        if index >= stop:
+            return []
+        if start is None:
+            start = starts[index]
+        if end is None:
+            end = ends[stop - 1]
+        pixel = max(end - start, 1) / width
+
+        spans = []
+        while index < stop:
+            if ends[index] - starts[index] >= pixel:
+                spans.append(gantt.segment(index))
+                index += 1
+                continue
+            # Segmentos estrechos que empiezan en el mismo píxel (sin incluir
+            # uno ancho al final, que se retorna aparte)
+            column = max(0, int((starts[index] - start) / pixel))
+            last = bisect_left(starts, start + (column + 1) * pixel, index + 1, stop)
+            if last - 1 > index and ends[last - 1] - starts[last - 1] >= pixel:
+                last -= 1
+            if last - index == 1:
+                spans.append(gantt.segment(index))
+            else:
+                span_start = starts[index]
+                span_end = ends[last - 1]
+                busy_time = busy_prefix[last] - busy_prefix[index]
+                if busy_time == span_end - span_start:
+                    kind = 'busy'
+                elif busy_time == 0:
+                    kind = 'idle'
+                else:
+                    kind = 'mixed'
+                spans.append({
+                    'type': kind,
+                    'start': span_start,
+                    'end': span_end,
+                    'duration': span_end - span_start,
+                    'busy_time': busy_time,
+                    'segments': last - index
+                })
+            index = last
+        return spans
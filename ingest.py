@@ -0,0 +1,168 @@
+"""
+Carga masiva de procesos.
+
+Convierte el cuerpo de una petición (arreglo JSON, NDJSON o CSV) en filas
+(pid, arrival_time, burst_time[, priority]) validadas con las mismas reglas
+que /add_process, y las vuelca al scheduler por bloques de columnas.
+"""
+
+import csv
+import io
+import json
+
+
+# Columnas esperadas en cada fila (priority es opcional, por defecto 0)
+FIELDS = ('pid', 'arrival_time', 'burst_time', 'priority')
+
+# Tamaño de los bloques que se vuelcan al scheduler
+CHUNK_SIZE = 10000
+
+# Máximo de errores detallados en la respuesta (el total se cuenta siempre)
+MAX_REPORTED_ERRORS = 100
+
+
+def detect_format(content_type):
+    """Retorna 'json', 'ndjson' o 'csv' según el Content-Type."""
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    if content_type in ('application/x-ndjson', 'application/ndjson', 'application/jsonlines'):
+        return 'ndjson'
+    if content_type in ('text/csv', 'application/csv'):
+        return 'csv'
+    return 'json'
+
+
+def validate_row(data):
+    """
+    Valida una fila y retorna (pid, arrival_time, burst_time, priority).
+
+    Raises:
+        ValueError: Si falta un campo o los tiempos no son válidos
+    """
+    if not isinstance(data, dict):
+        raise ValueError('La fila debe ser un objeto con pid, arrival_time y burst_time')
+    pid = data.get('pid')
+    pid = str(pid).strip() if pid is not None else ''
+    try:
+        arrival_time = int(data.get('arrival_time'))
+        burst_time = int(data.get('burst_time'))
+    except (TypeError, ValueError):
+        raise ValueError('arrival_time y burst_time deben ser enteros')
+    priority = data.get('priority')
+    try:
+        priority = int(priority) if priority not in (None, '') else 0
+    except (TypeError, ValueError):
+        raise ValueError('priority debe ser un entero')
+    if not pid or arrival_time < 0 or burst_time <= 0:
+        raise ValueError('Datos inválidos: se requiere pid, arrival_time >= 0 y burst_time > 0')
+    return pid, arrival_time, burst_time, priority
+
+
+def iter_rows(stream, fmt):
+    """
+    Itera sobre las filas del cuerpo sin validarlas.
+
+    Args:
+        stream: Flujo binario con el cuerpo de la petición
+        fmt (str): 'json', 'ndjson' o 'csv'
+
+    Yields:
+        tuple: (número de fila, dict) o (número de fila, ValueError) si la
+        fila no se pudo interpretar
+    """
+    if fmt == 'json':
+        try:
+            data = json.load(io.TextIOWrapper(stream, encoding='utf-8'))
+        except ValueError as e:
+            yield 1, ValueError(f'JSON inválido: {e}')
+            return
+        if isinstance(data, dict):
+            data = data.get('processes')
+        if not isinstance(data, list):
+            yield 1, ValueError('Se esperaba un arreglo JSON de procesos')
+            return
+        yield from enumerate(data, start=1)
+        return
+
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+
+    if fmt == 'ndjson':
+        for line_number, line in enumerate(text, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                yield line_number, ValueError(f'JSON inválido: {e}')
+        return
+
+    # CSV: la cabecera es opcional; sin ella se asume pid,arrival_time,burst_time[,priority]
+    reader = csv.reader(text)
+    header = None
+    for line_number, record in enumerate(reader, start=1):
+        if not record or all(not field.strip() for field in record):
+            continue
+        if header is None and line_number == 1 and 'pid' in [field.strip().lower() for field in record]:
+            header = [field.strip().lower() for field in record]
+            continue
+        yield line_number, dict(zip(header or FIELDS, record))
+
+
+def ingest(scheduler, stream, fmt, chunk_size=CHUNK_SIZE):
+    """Valida y añade al scheduler los procesos del cuerpo (ver ingest_records())."""
+    return ingest_records(scheduler, iter_rows(stream, fmt), chunk_size)
+
+
+def ingest_records(scheduler, records, chunk_size=CHUNK_SIZE):
+    """
+    Valida y añade al scheduler filas ya interpretadas.
+
+    Los PIDs duplicados se detectan contra el índice de la tabla de procesos
+    y contra las filas ya aceptadas en la misma carga; las filas válidas se
+    vuelcan al scheduler por bloques con add_processes().
+
+    Args:
+        records: Iterable de (número de fila, dict), como iter_rows()
+
+    Returns:
+        dict: {'added', 'rejected', 'errors'} con a lo sumo
+        MAX_REPORTED_ERRORS errores detallados ({'row', 'pid', 'message'})
+    """
+    table = scheduler.processes
+    seen = set()
+    pids, arrival_times, burst_times, priorities = [], [], [], []
+    added = rejected = 0
+    errors = []
+
+    def flush():
+        scheduler.add_processes(pids, arrival_times, burst_times, priorities)
+        return len(pids)
+
+    for row_number, data in records:
+        pid = data.get('pid') if isinstance(data, dict) else None
+        try:
+            if isinstance(data, Exception):
+                raise data
+            pid, arrival_time, burst_time, priority = validate_row(data)
+            if pid in table or pid in seen:
+                raise ValueError(f'El proceso {pid} ya existe. Use un ID diferente.')
+        except ValueError as e:
+            rejected += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({'row': row_number, 'pid': pid, 'message': str(e)})
+            continue
+
+        seen.add(pid)
+        pids.append(pid)
+        arrival_times.append(arrival_time)
+        burst_times.append(burst_time)
+        priorities.append(priority)
+        if len(pids) >= chunk_size:
+            added += flush()
+            seen.clear()
+            pids, arrival_times, burst_times, priorities = [], [], [], []
+
+    if pids:
+        added += flush()
+
+    return {'added': added, 'rejected': rejected, 'errors': errors}
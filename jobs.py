@@ -0,0 +1,246 @@
+"""
+Trabajos en segundo plano.
+
+Las simulaciones largas (scheduling de cargas grandes, barridos de quantum)
+se ejecutan en un pool acotado de hilos en lugar de en el hilo de la
+petición: el cliente recibe un ID de trabajo y consulta su progreso hasta
+que el resultado está listo. Los trabajos pendientes pueden cancelarse; los
+que ya se están ejecutando se detienen en su siguiente punto de control:
+report() entre etapas o checkpoint(), que los bucles de simulación llaman
+cada CHECKPOINT_INTERVAL iteraciones. Los resultados se conservan result_ttl segundos después de
+terminar y luego se descartan.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Hilos del pool de trabajos
+JOB_WORKERS = 2
+
+# Máximo de trabajos en cola o en ejecución a la vez
+MAX_PENDING_JOBS = 32
+
+# Segundos que se conserva el resultado de un trabajo terminado
+RESULT_TTL = 10 * 60
+
+# Máximo de trabajos guardados (incluidos los terminados)
+MAX_JOBS = 1000
+
+# Intervalo mínimo (segundos) entre barridos de trabajos expirados
+PURGE_INTERVAL = 30
+
+# Iteraciones de los bucles de simulación entre dos llamadas a checkpoint()
+CHECKPOINT_INTERVAL = 1 << 14
+
+# Estados de un trabajo
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Se lanza dentro de un trabajo cuando se solicitó su cancelación."""
+
+
+class JobQueueFull(RuntimeError):
+    """Se lanza al enviar un trabajo con la cola llena."""
+
+
+# Trabajo que se ejecuta en cada hilo del pool
+_current = threading.local()
+
+
+def checkpoint():
+    """
+    Punto de control de los bucles de simulación.
+
+    Dentro de un trabajo lanza JobCancelled si se solicitó su cancelación;
+    fuera de un trabajo no hace nada más que consultar una variable local
+    del hilo.
+    """
+    job = getattr(_current, 'job', None)
+    if job is not None and job.cancel_requested:
+        raise JobCancelled()
+
+
+class Job:
+    """
+    Trabajo en segundo plano.
+
+    La función del trabajo recibe el propio Job y debe llamar a report()
+    para publicar su progreso; report() es también el punto en que se
+    atiende la cancelación. El resultado es el cuerpo JSON ya serializado
+    de la respuesta.
+    """
+
+    def __init__(self, job_id, kind, owner):
+        self.job_id = job_id
+        self.kind = kind
+        self.owner = owner
+        self.status = QUEUED
+        self.progress = 0.0
+        self.stage = 'En cola'
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.future = None
+        self._finished_monotonic = None
+        self._cancel = threading.Event()
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    @property
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    def report(self, progress, stage=None):
+        """
+        Publica el progreso (0 a 1) y, opcionalmente, la etapa actual.
+
+        Raises:
+            JobCancelled: Si se solicitó la cancelación del trabajo
+        """
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.progress = min(max(progress, 0.0), 1.0)
+        if stage is not None:
+            self.stage = stage
+
+    def _finish(self, status, stage):
+        self.status = status
+        self.stage = stage
+        self.finished_at = time.time()
+        self._finished_monotonic = time.monotonic()
+
+    def to_dict(self):
+        """Estado del trabajo (sin el resultado)."""
+        return {
+            'id': self.job_id,
+            'type': self.kind,
+            'status': self.status,
+            'progress': round(self.progress, 4),
+            'stage': self.stage,
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+
+class JobManager:
+    """
+    Pool acotado de trabajos en segundo plano, seguro entre hilos.
+
+    Cada trabajo pertenece a un dueño (el ID de sesión): get() y cancel()
+    solo encuentran los trabajos del dueño indicado.
+    """
+
+    def __init__(self, workers=JOB_WORKERS, max_pending=MAX_PENDING_JOBS,
+                 result_ttl=RESULT_TTL, max_jobs=MAX_JOBS):
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.max_jobs = max_jobs
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='simulation-job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_purge = time.monotonic()
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def submit(self, kind, owner, function):
+        """
+        Encola un trabajo y retorna su Job.
+
+        Args:
+            kind (str): Tipo de trabajo ('schedule', 'sweep', ...)
+            owner (str): Dueño del trabajo (ID de sesión)
+            function: Función function(job) que retorna el cuerpo JSON
+                serializado del resultado
+
+        Raises:
+            JobQueueFull: Si ya hay max_pending trabajos sin terminar
+        """
+        with self._lock:
+            self._purge(time.monotonic(), force=True)
+            pending = sum(1 for job in self._jobs.values() if not job.finished)
+            if pending >= self.max_pending:
+                raise JobQueueFull(f'Hay {pending} trabajos pendientes. Espere a que terminen o cancele alguno.')
+
+            job = Job(secrets.token_urlsafe(12), kind, owner)
+            self._jobs[job.job_id] = job
+            job.future = self._pool.submit(self._run, job, function)
+            return job
+
+    def get(self, job_id, owner):
+        """Retorna el trabajo del dueño indicado, o None."""
+        with self._lock:
+            self._purge(time.monotonic())
+            job = self._jobs.get(job_id)
+        if job is None or job.owner != owner:
+            return None
+        return job
+
+    def cancel(self, job_id, owner):
+        """
+        Cancela un trabajo y lo retorna (None si no existe).
+
+        Un trabajo en cola se cancela de inmediato; uno en ejecución se
+        detiene en su siguiente report() o checkpoint() y su resultado se
+        descarta.
+        """
+        job = self.get(job_id, owner)
+        if job is None or job.finished:
+            return job
+        job._cancel.set()
+        if job.future.cancel():
+            job._finish(CANCELLED, 'Cancelado')
+        return job
+
+    def _run(self, job, function):
+        if job.cancel_requested:
+            job._finish(CANCELLED, 'Cancelado')
+            return
+        job.status = RUNNING
+        job.stage = 'En ejecución'
+        job.started_at = time.time()
+        _current.job = job
+        try:
+            result = function(job)
+            job.report(1.0)
+            job.result = result
+            job._finish(COMPLETED, 'Completado')
+        except JobCancelled:
+            job._finish(CANCELLED, 'Cancelado')
+        except Exception as e:
+            job.error = str(e)
+            job._finish(FAILED, 'Error')
+        finally:
+            _current.job = None
+
+    def _purge(self, now, force=False):
+        # Descarta los trabajos terminados hace más de result_ttl y, si aun
+        # así se supera max_jobs, los terminados más antiguos
+        if not force and now - self._last_purge < PURGE_INTERVAL:
+            return
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished and now - job._finished_monotonic > self.result_ttl]
+        for job_id in expired:
+            del self._jobs[job_id]
+        if len(self._jobs) > self.max_jobs:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[:len(self._jobs) - self.max_jobs]:
+                del self._jobs[job_id]
+        self._last_purge = now
@@ -0,0 +1,351 @@
+"""
+Pruebas de carga de la API HTTP.
+
+Simula varios clientes concurrentes (un hilo por cliente, cada uno con su
+propia sesión salvo con shared_session) que envían una mezcla ponderada de
+peticiones durante un tiempo fijo, y reporta por endpoint las peticiones
+por segundo y la latencia (media, p50/p95/p99 y máxima).
+
+Los clientes pueden usar el cliente de pruebas de Flask dentro del mismo
+proceso (sin red; mide el coste de la aplicación y la contención de sus
+locks), un servidor local lanzado en otro proceso (serve=True) o un
+servidor ya en marcha (url):
+
+    python loadtest.py --concurrency 8 --duration 10
+    python loadtest.py --serve --concurrency 16 --mix add_process:5,schedule:2,get_current_state:3
+    python loadtest.py --url http://127.0.0.1:5000 --shared-session
+
+Cada cliente usa un generador aleatorio con semilla propia, así que con los
+mismos parámetros la secuencia de peticiones es la misma.
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import multiprocessing
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+from statistics_engine import PERCENTILES, QuantileSketch
+
+
+# Mezcla de peticiones por defecto (endpoint: peso)
+DEFAULT_MIX = {'add_process': 5, 'schedule': 2, 'get_current_state': 3}
+
+# Procesos que carga cada cliente antes de empezar a medir
+DEFAULT_PRELOAD = 100
+
+# Procesos por petición de add_processes
+BATCH_SIZE = 50
+
+# Cabecera con el ID de sesión (ver app.SESSION_HEADER)
+SESSION_HEADER = 'X-Session-Id'
+
+# Segundos máximos de espera de cada petición en modo HTTP
+REQUEST_TIMEOUT = 60
+
+
+def _process(state, rng):
+    state['next_pid'] += 1
+    return {
+        'pid': f"L{state['client']}-{state['next_pid']}",
+        'arrival_time': rng.randrange(0, 100),
+        'burst_time': rng.randint(1, 20),
+        'priority': rng.randrange(0, 5),
+    }
+
+
+# Peticiones disponibles: cada una recibe el estado del cliente y su
+# generador aleatorio y retorna (método, ruta, cuerpo JSON o None)
+ENDPOINTS = {
+    'add_process': lambda state, rng: ('POST', '/add_process', _process(state, rng)),
+    'add_processes': lambda state, rng: ('POST', '/add_processes',
+                                         [_process(state, rng) for _ in range(BATCH_SIZE)]),
+    'schedule': lambda state, rng: ('POST', '/schedule', None),
+    'get_current_state': lambda state, rng: ('GET', '/get_current_state', None),
+    'gantt': lambda state, rng: ('GET', '/gantt?width=1000', None),
+    'metrics': lambda state, rng: ('GET', '/metrics', None),
+}
+
+
+def parse_mix(text):
+    """
+    Convierte 'add_process:5,schedule:2' en {'add_process': 5, 'schedule': 2}.
+
+    Raises:
+        ValueError: Si un endpoint no existe o un peso no es un número positivo
+    """
+    mix = {}
+    for item in text.split(','):
+        name, _, weight = item.strip().partition(':')
+        if name not in ENDPOINTS:
+            raise ValueError(f"Endpoint {name} no soportado. Disponibles: {', '.join(ENDPOINTS)}")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f'Peso inválido para {name}: {weight}')
+        if mix[name] <= 0:
+            raise ValueError(f'El peso de {name} debe ser mayor que 0')
+    return mix
+
+
+class _TestClient:
+    """Cliente de pruebas de Flask (mismo proceso, sin red)."""
+
+    def __init__(self, app, session_id=None):
+        self.client = app.test_client()
+        self.session_id = session_id
+
+    def request(self, method, path, body=None):
+        headers = {SESSION_HEADER: self.session_id} if self.session_id else {}
+        response = self.client.open(path, method=method, json=body, headers=headers)
+        self.session_id = response.headers.get(SESSION_HEADER, self.session_id)
+        data = response.get_json(silent=True) if response.is_json else None
+        return response.status_code, data
+
+    def close(self):
+        pass
+
+
+class _HTTPClient:
+    """Cliente HTTP con conexión persistente (se reabre si el servidor la cierra)."""
+
+    def __init__(self, url, session_id=None):
+        parts = urlsplit(url)
+        self.prefix = parts.path.rstrip('/')
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=REQUEST_TIMEOUT)
+        self.session_id = session_id
+
+    def request(self, method, path, body=None):
+        headers = {SESSION_HEADER: self.session_id} if self.session_id else {}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        try:
+            self.connection.request(method, self.prefix + path, payload, headers)
+            response = self.connection.getresponse()
+            content = response.read()
+        except (http.client.HTTPException, OSError):
+            self.connection.close()
+            raise
+        self.session_id = response.getheader(SESSION_HEADER) or self.session_id
+        data = None
+        if (response.getheader('Content-Type') or '').startswith('application/json'):
+            data = json.loads(content)
+        return response.status, data
+
+    def close(self):
+        self.connection.close()
+
+
+def _serve(port_queue):
+    # Proceso del servidor local: servidor con hilos de werkzeug en un puerto libre
+    from werkzeug.serving import make_server
+    from app import app
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+class _Endpoint:
+    """Latencias (ms) y contadores de un endpoint."""
+
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.failures = 0
+
+    def merge(self, other):
+        self.latencies.extend(other.latencies)
+        self.errors += other.errors
+        self.failures += other.failures
+
+    def to_dict(self, elapsed):
+        sketch = QuantileSketch()
+        for latency in self.latencies:
+            sketch.update(latency)
+        count = sketch.count
+        return {
+            'requests': count,
+            'errors': self.errors,
+            'failures': self.failures,
+            'throughput': round(count / elapsed, 2),
+            'latency_ms': {
+                'mean': round(sum(self.latencies) / count, 3) if count else 0,
+                **{f'p{p}': round(sketch.quantile(p / 100), 3) for p in PERCENTILES},
+                'max': round(sketch.max or 0, 3),
+            },
+        }
+
+
+def run_load_test(concurrency=4, duration=10.0, mix=None, requests=None, preload=DEFAULT_PRELOAD,
+                  url=None, serve=False, shared_session=False, seed=0):
+    """
+    Ejecuta la prueba de carga.
+
+    Args:
+        concurrency (int): Clientes concurrentes (un hilo cada uno)
+        duration (float): Segundos de medición
+        mix (dict): Pesos por endpoint (ver ENDPOINTS); por defecto DEFAULT_MIX
+        requests (int): Si se indica, peticiones por cliente (y duration es
+            solo el límite de tiempo)
+        preload (int): Procesos que añade cada cliente antes de medir
+        url (str): Servidor ya en marcha (si no, cliente de pruebas de Flask)
+        serve (bool): Lanzar un servidor local con hilos en otro proceso
+        shared_session (bool): Todos los clientes usan la misma sesión
+        seed (int): Semilla base (el cliente i usa seed + i)
+
+    Returns:
+        dict: Resumen global y por endpoint (peticiones, errores, fallos
+        con success false, req/s y latencias en milisegundos)
+    """
+    mix = dict(mix or DEFAULT_MIX)
+    if concurrency < 1 or duration <= 0:
+        raise ValueError('concurrency y duration deben ser mayores que 0')
+
+    server = None
+    if serve:
+        context = multiprocessing.get_context('spawn')
+        port_queue = context.Queue()
+        server = context.Process(target=_serve, args=(port_queue,), daemon=True)
+        server.start()
+        url = f'http://127.0.0.1:{port_queue.get(timeout=30)}'
+
+    if url:
+        make_client = lambda session_id=None: _HTTPClient(url, session_id)
+    else:
+        # Importación diferida: app solo se necesita con el cliente de pruebas
+        from app import app
+        make_client = lambda session_id=None: _TestClient(app, session_id)
+
+    try:
+        session_id = None
+        if shared_session:
+            client = make_client()
+            client.request('GET', '/get_current_state')
+            session_id = client.session_id
+            client.close()
+
+        names = list(mix)
+        weights = [mix[name] for name in names]
+        results = [dict() for _ in range(concurrency)]
+        ready = threading.Barrier(concurrency + 1)
+        timing = {}
+
+        def worker(index):
+            rng = random.Random(seed + index)
+            state = {'client': index, 'next_pid': 0}
+            client = make_client(session_id)
+            endpoints = results[index]
+            try:
+                for start in range(0, preload, BATCH_SIZE):
+                    batch = [_process(state, rng) for _ in range(min(BATCH_SIZE, preload - start))]
+                    client.request('POST', '/add_processes', batch)
+            finally:
+                ready.wait()
+            try:
+                deadline = timing['start'] + duration
+                sent = 0
+                while time.perf_counter() < deadline and (requests is None or sent < requests):
+                    name = rng.choices(names, weights)[0]
+                    method, path, body = ENDPOINTS[name](state, rng)
+                    endpoint = endpoints.get(name)
+                    if endpoint is None:
+                        endpoint = endpoints[name] = _Endpoint()
+                    started = time.perf_counter()
+                    try:
+                        status, data = client.request(method, path, body)
+                    except Exception:
+                        status, data = None, None
+                    latency = (time.perf_counter() - started) * 1000
+                    endpoint.latencies.append(latency)
+                    if status is None or status >= 400:
+                        endpoint.errors += 1
+                    elif isinstance(data, dict) and data.get('success') is False:
+                        endpoint.failures += 1
+                    sent += 1
+            finally:
+                client.close()
+
+        threads = [threading.Thread(target=worker, args=(index,), daemon=True) for index in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        # Todos los clientes empiezan a medir a la vez, tras la precarga
+        timing['start'] = time.perf_counter() + 0.01
+        ready.wait()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - timing['start']
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+    # Se combinan las mediciones de todos los clientes por endpoint
+    merged = {}
+    for endpoints in results:
+        for name, endpoint in endpoints.items():
+            merged.setdefault(name, _Endpoint()).merge(endpoint)
+    total = sum(len(endpoint.latencies) for endpoint in merged.values())
+
+    return {
+        'mode': 'http' if url else 'test_client',
+        'url': url if url and not serve else None,
+        'concurrency': concurrency,
+        'duration_seconds': round(elapsed, 3),
+        'mix': mix,
+        'preload': preload,
+        'shared_session': shared_session,
+        'requests': total,
+        'errors': sum(endpoint.errors for endpoint in merged.values()),
+        'failures': sum(endpoint.failures for endpoint in merged.values()),
+        'throughput': round(total / elapsed, 2),
+        'endpoints': {name: endpoint.to_dict(elapsed) for name, endpoint in sorted(merged.items())},
+    }
+
+
+def main(argv=None):
+    """Ejecuta la prueba de carga desde la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Pruebas de carga de la API HTTP.')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--requests', type=int, help='Peticiones por cliente')
+    parser.add_argument('--mix', default=','.join(f'{name}:{weight}' for name, weight in DEFAULT_MIX.items()),
+                        help=f"Pesos por endpoint ({', '.join(ENDPOINTS)})")
+    parser.add_argument('--preload', type=int, default=DEFAULT_PRELOAD)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--shared-session', action='store_true', help='Todos los clientes en la misma sesión')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', help='Servidor ya en marcha (p. ej. http://127.0.0.1:5000)')
+    target.add_argument('--serve', action='store_true', help='Lanzar un servidor local con hilos')
+    parser.add_argument('--output', help='Archivo JSON donde guardar el resumen')
+    args = parser.parse_args(argv)
+
+    try:
+        report = run_load_test(args.concurrency, args.duration, parse_mix(args.mix), args.requests,
+                               args.preload, args.url, args.serve, args.shared_session, args.seed)
+    except ValueError as e:
+        parser.exit(2, f'Error: {e}\n')
+
+    print(f"{report['mode']}: {report['concurrency']} cliente(s), {report['duration_seconds']} s, "
+          f"{report['requests']} peticiones ({report['throughput']} req/s), "
+          f"{report['errors']} error(es), {report['failures']} fallo(s)")
+    print(f"{'endpoint':<20}{'req':>8}{'req/s':>10}{'media':>10}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}  (ms)")
+    for name, endpoint in report['endpoints'].items():
+        latency = endpoint['latency_ms']
+        print(f"{name:<20}{endpoint['requests']:>8}{endpoint['throughput']:>10}{latency['mean']:>10}"
+              f"{latency['p50']:>10}{latency['p95']:>10}{latency['p99']:>10}{latency['max']:>10}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as target_file:
+            json.dump(report, target_file, indent=2)
+            target_file.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,199 @@
+import heapq
+from bisect import bisect_right
+from collections import deque
+
+from fairness import DEFAULT_TOP_K, fairness_report
+from gantt import IDLE, GanttChart
+from jobs import CHECKPOINT_INTERVAL, checkpoint
+from process_table import ProcessTable
+from profiling import mark
+from statistics_engine import compute_statistics
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo requiere el backend 'numpy'
+    np = None
+
+BACKENDS = ('python', 'numpy')
+
+# Campos adicionales de los segmentos de proceso en el diagrama de Gantt
+SJF_GANTT_FIELDS = ('original_arrival_time', 'order')
+RR_GANTT_FIELDS = ('quantum_number', 'remaining_time')
+SRTF_GANTT_FIELDS = ('remaining_time',)
+PRIORITY_GANTT_FIELDS = ('priority', 'effective_priority')
+
+# Procesos hasta los que el análisis de SJF detalla el orden de ejecución
+SJF_DETAIL_LIMIT = 20
+
+# Unidades de espera por cada nivel de prioridad ganado (aging)
+DEFAULT_AGING_INTERVAL = 10
+
+# Métricas resumidas por calculate_statistics()
+STATISTICS_METRICS = ('arrival_time', 'burst_time', 'completion_time', 'turnaround_time', 'waiting_time')
+RR_STATISTICS_METRICS = STATISTICS_METRICS + ('quantum_used', 'normalized_turnaround_time')
+
+# Secciones de get_results() que se pueden pedir con fields, con la fase de
+# perfilado a la que se atribuye su cálculo. La configuración del algoritmo
+# (quantum, aging_interval, núcleos...) se incluye siempre.
+RESULT_FIELDS = {
+    'processes': 'to_dict',
+    'gantt_chart': 'to_dict',
+    'averages': 'statistics',
+    'statistics': 'statistics',
+    'analysis': 'analysis',
+}
+
+
+def _check_backend(backend):
+    """Valida el backend de cálculo solicitado para FCFS/SJF."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend {backend} no soportado. Backends disponibles: {', '.join(BACKENDS)}")
+    if backend == 'numpy' and np is None:
+        raise ImportError("El backend 'numpy' requiere tener NumPy instalado (pip install numpy).")
+    return backend
+
+
+def parse_fields(fields):
+    """
+    Normaliza la selección de secciones de get_results().
+    
+    Args:
+        fields: None (todas), 'averages,statistics' o una lista de nombres
+            de RESULT_FIELDS
+    
+    Returns:
+        tuple: Secciones pedidas sin repetir y en el orden de RESULT_FIELDS,
+        o None si se piden todas
+    
+    Raises:
+        ValueError: Si alguna sección no existe o no se pide ninguna
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    requested = {str(field).strip() for field in fields} - {''}
+    unknown = requested.difference(RESULT_FIELDS)
+    if unknown:
+        raise ValueError(f"Campo(s) {', '.join(sorted(unknown))} no soportado(s). "
+                         f"Campos disponibles: {', '.join(RESULT_FIELDS)}")
+    if not requested:
+        raise ValueError('fields debe incluir al menos un campo.')
+    return tuple(field for field in RESULT_FIELDS if field in requested)
+
+
+def build_results(sections, fields=None, **config):
+    """
+    Construye el resultado de get_results() calculando solo las secciones
+    pedidas, cada una una sola vez.
+    
+    Args:
+        sections (dict): Sección de RESULT_FIELDS -> función sin argumentos
+            que retorna las claves de esa sección
+        fields: Selección de secciones (ver parse_fields)
+        **config: Claves de configuración, incluidas siempre
+    """
+    results = {}
+    for field in parse_fields(fields) or RESULT_FIELDS:
+        results.update(sections[field]())
+        mark(RESULT_FIELDS[field])
+    results.update(config)
+    return results
+
+
+def fcfs_times_vectorized(arrival_times, burst_times):
+    """
+    Calcula FCFS para columnas de llegada y ráfaga con operaciones de arreglo.
+    
+    La recurrencia CT[i] = max(CT[i-1], AT[i]) + BT[i] se resuelve como
+    CT = S + max.acumulado(AT - (S - BT)), donde S es la suma acumulada de BT,
+    así que no hace falta recorrer los procesos uno a uno.
+    
+    Args:
+        arrival_times: Arreglo de tiempos de llegada
+        burst_times: Arreglo de tiempos de ráfaga
+    
+    Returns:
+        tuple: (order, start, completion, turnaround, waiting), con los
+        tiempos ya en orden de ejecución y order los índices originales
+    """
+    arrival_times = np.asarray(arrival_times, dtype=np.int64)
+    burst_times = np.asarray(burst_times, dtype=np.int64)
+    
+    # Orden estable por llegada, igual que list.sort
+    order = np.argsort(arrival_times, kind='stable')
+    arrival = arrival_times[order]
+    burst = burst_times[order]
+    
+    cumulative = np.cumsum(burst)
+    completion = cumulative + np.maximum.accumulate(arrival - (cumulative - burst))
+    start = completion - burst
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    return order, start, completion, turnaround, waiting
+
+
+def sjf_times_vectorized(pids, burst_times):
+    """
+    Calcula SJF (no preemptivo, sin considerar AT) con operaciones de arreglo.
+    
+    Ordena por (BT, PID) y obtiene los tiempos con una suma acumulada.
+    Como en SJFScheduler, TT = CT.
+    
+    Returns:
+        tuple: (order, start, completion, turnaround, waiting)
+    """
+    burst_times = np.asarray(burst_times, dtype=np.int64)
+    order = np.lexsort((np.asarray(pids), burst_times))
+    burst = burst_times[order]
+    
+    completion = np.cumsum(burst)
+    start = completion - burst
+    turnaround = completion
+    waiting = turnaround - burst
+    return order, start, completion, turnaround, waiting
+
+
+def _merge_appended_rows(scheduler, key):
+    """
+    Reprogramación incremental: si la tabla del scheduler solo ha recibido
+    filas nuevas al final desde el último schedule() (mismo objeto y misma
+    revision), las inserta en su posición del orden ya calculado.
+    
+    Las filas planificadas forman un prefijo ordenado por key; las nuevas se
+    ordenan entre sí (k log k), se busca con bisect la primera posición
+    afectada y solo se reordena el sufijo desde ahí.
+    
+    Returns:
+        tuple: (primera fila a recalcular, filas que ya estaban planificadas),
+        o None si hay que planificar desde cero
+    """
+    table = scheduler.processes
+    state = scheduler._scheduled
+    if state is None or state[0] is not table or state[2] != table.revision or state[1] == 0:
+        return None
+    
+    scheduled_rows = state[1]
+    total = len(table)
+    if scheduled_rows >= total:
+        return total, scheduled_rows
+    
+    # Empates: las filas nuevas van detrás de las planificadas (bisect_right
+    # y heapq.merge son estables), igual que con una ordenación completa
+    new_rows = sorted(range(scheduled_rows, total), key=key)
+    first_row = bisect_right(range(scheduled_rows), key(new_rows[0]), key=key)
+    table.permute_tail(first_row, heapq.merge(range(first_row, scheduled_rows), new_rows, key=key))
+    return first_row, scheduled_rows
+
+
 class Process:
-    """Clase que representa un proceso en el sistema."""
+    """
+    Clase que representa un proceso en el sistema.
+    
+    Los schedulers no crean un Process por proceso: guardan los datos en una
+    ProcessTable (columnas tipadas) y exponen cada fila como ProcessRow, que
+    tiene esta misma interfaz.
+    """
     
     def __init__(self, pid, arrival_time, burst_time):
         self.pid = pid
@@ -52,87 +246,180 @@ class Process:
 class FCFSScheduler:
     """Implementación del algoritmo First-Come, First-Served (FCFS)."""
     
-    def __init__(self):
-        self.processes = []
+    def __init__(self, backend='python'):
+        """
+        Args:
+            backend (str): 'python' (bucle por proceso) o 'numpy' (cálculo
+                vectorizado con fcfs_times_vectorized, requiere NumPy)
+        """
+        self.processes = ProcessTable()
         self.execution_order = []
-        self.gantt_chart = []
+        self.gantt_chart = GanttChart()
+        self.backend = _check_backend(backend)
+        # (tabla, filas, revision) del último schedule(), para reprogramar
+        # de forma incremental cuando solo se añaden procesos
+        self._scheduled = None
+        
+    def add_process(self, pid, arrival_time, burst_time, priority=0):
+        """Añade un proceso a la tabla de procesos."""
+        self.processes.append(pid, arrival_time, burst_time, priority)
         
-    def add_process(self, pid, arrival_time, burst_time):
-        """Añade un proceso a la lista."""
-        process = Process(pid, arrival_time, burst_time)
-        self.processes.append(process)
+    def add_processes(self, pids, arrival_times, burst_times, priorities=None):
+        """Añade procesos en bloque (columnas) sin crear un objeto por fila."""
+        self.processes.extend(pids, arrival_times, burst_times, priorities)
         
     def schedule(self):
-        """Ejecuta el algoritmo FCFS y calcula todos los tiempos."""
+        """
+        Ejecuta el algoritmo FCFS y calcula todos los tiempos.
+        
+        Si desde la ejecución anterior solo se añadieron procesos, se
+        insertan en el orden por llegada y se recalculan únicamente los
+        procesos desde el primer punto de inserción (los anteriores no
+        cambian).
+        """
         if not self.processes:
             return
-            
-        # Ordenar procesos por tiempo de llegada (FCFS)
-        self.processes.sort(key=lambda p: p.arrival_time)
         
-        current_time = 0
-        self.gantt_chart = []
+        table = self.processes
+        
+        if self.backend == 'numpy':
+            self._schedule_numpy()
+            mark('simulate')
+            self._scheduled = (table, len(table), table.revision)
+            return
         
-        for process in self.processes:
+        arrival_times = table.arrival_time
+        incremental = _merge_appended_rows(self, arrival_times.__getitem__)
+        if incremental is None:
+            # Ordenar procesos por tiempo de llegada (FCFS)
+            table.sort_by('arrival_time')
+            table.reset_results()
+            self.gantt_chart = GanttChart()
+            first_row = 0
+        else:
+            first_row, scheduled_rows = incremental
+            # Quitar del diagrama los procesos que se recalculan (y el idle previo)
+            self.gantt_chart.drop_last_processes(scheduled_rows - first_row)
+        mark('sort')
+        
+        self._schedule_from(first_row)
+        mark('simulate')
+        
+        # La tabla queda en orden de ejecución
+        self.execution_order = table
+        self._scheduled = (table, len(table), table.revision)
+        
+    def _schedule_from(self, first_row):
+        """Calcula los tiempos desde first_row (las filas anteriores ya están calculadas)."""
+        table = self.processes
+        gantt = self.gantt_chart
+        
+        pids = table.pids
+        arrival_times = table.arrival_time
+        burst_times = table.burst_time
+        start_times = table.start_time
+        completion_times = table.completion_time
+        turnaround_times = table.turnaround_time
+        waiting_times = table.waiting_time
+        
+        current_time = completion_times[first_row - 1] if first_row else 0
+        
+        for row in range(first_row, len(table)):
+            if not row % CHECKPOINT_INTERVAL:
+                checkpoint()
+            arrival_time = arrival_times[row]
+            burst_time = burst_times[row]
+            
             # Si el proceso llega después del tiempo actual, esperamos
-            if process.arrival_time > current_time:
+            if arrival_time > current_time:
                 # Añadir tiempo idle al diagrama de Gantt
-                if current_time < process.arrival_time:
-                    self.gantt_chart.append({
-                        'type': 'idle',
-                        'start': current_time,
-                        'end': process.arrival_time,
-                        'duration': process.arrival_time - current_time
-                    })
-                current_time = process.arrival_time
+                gantt.add_idle(current_time, arrival_time)
+                current_time = arrival_time
             
             # Tiempo de inicio del proceso
-            process.start_time = current_time
-            
-            # Tiempo de finalización
-            process.completion_time = current_time + process.burst_time
+            start_times[row] = current_time
             
-            # Calcular tiempos
-            process.calculate_times(process.completion_time)
+            # Tiempo de finalización y tiempos derivados (TT = CT - AT, WT = TT - BT)
+            completion_time = current_time + burst_time
+            completion_times[row] = completion_time
+            turnaround_times[row] = completion_time - arrival_time
+            waiting_times[row] = completion_time - arrival_time - burst_time
             
             # Añadir al diagrama de Gantt
-            self.gantt_chart.append({
-                'type': 'process',
-                'pid': process.pid,
-                'start': current_time,
-                'end': process.completion_time,
-                'duration': process.burst_time
-            })
+            gantt.add_process(pids[row], current_time, completion_time)
             
             # Actualizar tiempo actual
-            current_time = process.completion_time
-            
-        # Ordenar por orden de ejecución para mostrar
-        self.execution_order = self.processes.copy()
+            current_time = completion_time
+        
+    def _schedule_numpy(self):
+        """Backend vectorizado de FCFS: mismos resultados que schedule()."""
+        table = self.processes
+        order, start, completion, turnaround, waiting = fcfs_times_vectorized(
+            np.frombuffer(table.arrival_time, dtype=np.int64),
+            np.frombuffer(table.burst_time, dtype=np.int64)
+        )
+        
+        table.permute(order)
+        table.reset_results()
+        table.set_column('start_time', start)
+        table.set_column('completion_time', completion)
+        table.set_column('turnaround_time', turnaround)
+        table.set_column('waiting_time', waiting)
+        
+        # Fin del proceso anterior (0 para el primero): hay un segmento idle
+        # antes de cada proceso que empieza después de ese instante
+        previous_end = np.concatenate(([0], completion[:-1]))
+        idle = start > previous_end
+        
+        # Posición de cada segmento en el diagrama intercalando los idle
+        process_position = np.arange(len(table)) + np.cumsum(idle)
+        idle_position = process_position[idle] - 1
+        segment_count = len(table) + int(idle.sum())
+        
+        segment_start = np.empty(segment_count, dtype=np.int64)
+        segment_end = np.empty(segment_count, dtype=np.int64)
+        pid_codes = np.full(segment_count, IDLE, dtype=np.int64)
+        segment_start[process_position] = start
+        segment_end[process_position] = completion
+        segment_start[idle_position] = previous_end[idle]
+        segment_end[idle_position] = start[idle]
+        
+        self.gantt_chart = GanttChart()
+        pid_codes[process_position] = self.gantt_chart.intern_many(table.pids, unique=True)
+        self.gantt_chart.extend_columns(pid_codes, segment_start, segment_end)
+        
+        self.execution_order = table
+        
+    def get_results(self, fields=None):
+        """
+        Retorna los resultados del scheduling.
         
-    def get_results(self):
-        """Retorna los resultados del scheduling."""
-        return {
-            'processes': [p.to_dict() for p in self.processes],
-            'gantt_chart': self.gantt_chart,
-            'average_waiting_time': self.calculate_average_waiting_time(),
-            'average_turnaround_time': self.calculate_average_turnaround_time(),
-            'convoy_effect_info': self.analyze_convoy_effect(),
-            'statistics': self.calculate_statistics()
-        }
+        Args:
+            fields: Secciones a calcular (ver parse_fields); por defecto todas
+        """
+        return build_results({
+            'processes': lambda: {'processes': self.processes.to_dicts()},
+            'gantt_chart': lambda: {'gantt_chart': self.gantt_chart.to_list()},
+            'averages': lambda: {
+                'average_waiting_time': self.calculate_average_waiting_time(),
+                'average_turnaround_time': self.calculate_average_turnaround_time()
+            },
+            'statistics': lambda: {'statistics': self.calculate_statistics()},
+            'analysis': lambda: {'convoy_effect_info': self.analyze_convoy_effect()}
+        }, fields)
         
     def calculate_average_waiting_time(self):
         """Calcula el tiempo promedio de espera."""
         if not self.processes:
             return 0
-        total_waiting_time = sum(p.waiting_time for p in self.processes)
+        total_waiting_time = sum(self.processes.waiting_time)
         return total_waiting_time / len(self.processes)
         
     def calculate_average_turnaround_time(self):
         """Calcula el tiempo promedio de turnaround."""
         if not self.processes:
             return 0
-        total_turnaround_time = sum(p.turnaround_time for p in self.processes)
+        total_turnaround_time = sum(self.processes.turnaround_time)
         return total_turnaround_time / len(self.processes)
         
     def analyze_convoy_effect(self):
@@ -140,184 +427,258 @@ class FCFSScheduler:
         if len(self.processes) < 2:
             return "No hay suficientes procesos para analizar el efecto convoy."
             
-        long_processes = [p for p in self.processes if p.burst_time > 10]
+        long_processes = sum(1 for burst_time in self.processes.burst_time if burst_time > 10)
         if long_processes:
-            return f"Convoy Effect detectado: {len(long_processes)} proceso(s) largo(s) pueden causar retrasos significativos."
+            return f"Convoy Effect detectado: {long_processes} proceso(s) largo(s) pueden causar retrasos significativos."
         else:
             return "No se detectó efecto convoy significativo."
             
     def calculate_statistics(self):
         """
-        Calcula estadísticas completas (media y desviación estándar).
+        Calcula estadísticas completas en una sola pasada (ver statistics_engine).
         
         Returns:
-            dict: Diccionario con medias y desviaciones estándar de todas las métricas
+            dict: Media, desviación estándar, mínimo y máximo de cada métrica,
+            más p50/p95/p99 de los tiempos de espera y de turnaround
         """
-        if not self.processes:
-            return {}
-        
-        import math
-        
-        # Extraer todas las métricas
-        arrival_times = [p.arrival_time for p in self.processes]
-        burst_times = [p.burst_time for p in self.processes]
-        completion_times = [p.completion_time for p in self.processes]
-        turnaround_times = [p.turnaround_time for p in self.processes]
-        waiting_times = [p.waiting_time for p in self.processes]
-        
-        def calculate_mean_std(values):
-            """Calcula media y desviación estándar de una lista de valores."""
-            if not values:
-                return 0, 0
-            
-            mean = sum(values) / len(values)
-            
-            if len(values) == 1:
-                return mean, 0
+        return compute_statistics(self.processes, STATISTICS_METRICS)
             
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            std_dev = math.sqrt(variance)
-            
-            return mean, std_dev
+    def stream(self, processes):
+        """
+        Simulación en streaming con memoria acotada (ver streaming.py).
         
-        # Calcular estadísticas para cada métrica
-        stats = {}
-        metrics = {
-            'arrival_time': arrival_times,
-            'burst_time': burst_times,
-            'completion_time': completion_times,
-            'turnaround_time': turnaround_times,
-            'waiting_time': waiting_times
-        }
+        Args:
+            processes: Iterador de procesos (pid, arrival_time, burst_time[,
+                priority]) ordenado por tiempo de llegada
         
-        for metric_name, values in metrics.items():
-            mean, std_dev = calculate_mean_std(values)
-            stats[metric_name] = {
-                'mean': round(mean, 2),
-                'std_dev': round(std_dev, 2),
-                'min': min(values) if values else 0,
-                'max': max(values) if values else 0
-            }
+        Returns:
+            SimulationStream: Registros de segmentos y procesos terminados
+            a medida que ocurren, y su resumen (summary())
+        """
+        # Importación diferida: streaming importa este módulo
+        from streaming import stream_simulation
+        return stream_simulation('FCFS', processes)
         
-        return stats
-            
     def reset(self):
         """Reinicia el scheduler."""
-        self.processes = []
+        self.processes = ProcessTable()
         self.execution_order = []
-        self.gantt_chart = []
+        self.gantt_chart = GanttChart()
+        self._scheduled = None
 
 
 class SJFScheduler:
     """Implementación del algoritmo Shortest Job First (SJF)."""
     
-    def __init__(self):
-        self.processes = []
+    def __init__(self, backend='python'):
+        """
+        Args:
+            backend (str): 'python' (bucle por proceso) o 'numpy' (cálculo
+                vectorizado con sjf_times_vectorized, requiere NumPy)
+        """
+        self.processes = ProcessTable()
         self.execution_order = []
-        self.gantt_chart = []
+        self.gantt_chart = GanttChart(SJF_GANTT_FIELDS)
+        self.backend = _check_backend(backend)
+        # (tabla, filas, revision) del último schedule(), para reprogramar
+        # de forma incremental cuando solo se añaden procesos
+        self._scheduled = None
         
-    def add_process(self, pid, arrival_time, burst_time):
-        """Añade un proceso a la lista."""
-        process = Process(pid, arrival_time, burst_time)
-        self.processes.append(process)
+    def add_process(self, pid, arrival_time, burst_time, priority=0):
+        """Añade un proceso a la tabla de procesos."""
+        self.processes.append(pid, arrival_time, burst_time, priority)
+        
+    def add_processes(self, pids, arrival_times, burst_times, priorities=None):
+        """Añade procesos en bloque (columnas) sin crear un objeto por fila."""
+        self.processes.extend(pids, arrival_times, burst_times, priorities)
         
     def schedule(self):
-        """Ejecuta el algoritmo SJF y calcula todos los tiempos."""
+        """
+        Ejecuta el algoritmo SJF y calcula todos los tiempos.
+        
+        Si desde la ejecución anterior solo se añadieron procesos, se
+        insertan según su rango por (BT, PID) y se recalculan únicamente los
+        procesos desde el primer punto de inserción.
+        """
         if not self.processes:
             return
-            
-        # SJF ordena por Burst Time (tiempo de ráfaga) independientemente del AT
-        # En caso de empate en BT, ordenar por PID para consistencia
-        self.processes.sort(key=lambda p: (p.burst_time, p.pid))
         
-        current_time = 0
-        self.gantt_chart = []
+        table = self.processes
+        
+        if self.backend == 'numpy':
+            self._schedule_numpy()
+            mark('simulate')
+            self._scheduled = (table, len(table), table.revision)
+            return
         
-        for i, process in enumerate(self.processes):
+        burst_times = table.burst_time
+        pids = table.pids
+        incremental = _merge_appended_rows(self, lambda row: (burst_times[row], pids[row]))
+        if incremental is None:
+            # SJF ordena por Burst Time (tiempo de ráfaga) independientemente del AT
+            # En caso de empate en BT, ordenar por PID para consistencia
+            table.sort_by('burst_time', 'pid')
+            table.reset_results()
+            self.gantt_chart = GanttChart(SJF_GANTT_FIELDS)
+            first_row = 0
+        else:
+            first_row, scheduled_rows = incremental
+            # Quitar del diagrama los procesos que se recalculan
+            self.gantt_chart.drop_last_processes(scheduled_rows - first_row)
+        mark('sort')
+        
+        self._schedule_from(first_row)
+        mark('simulate')
+        
+        # La tabla queda en orden de ejecución
+        self.execution_order = table
+        self._scheduled = (table, len(table), table.revision)
+        
+    def _schedule_from(self, first_row):
+        """Calcula los tiempos desde first_row (las filas anteriores ya están calculadas)."""
+        table = self.processes
+        gantt = self.gantt_chart
+        
+        pids = table.pids
+        arrival_times = table.arrival_time
+        burst_times = table.burst_time
+        start_times = table.start_time
+        completion_times = table.completion_time
+        turnaround_times = table.turnaround_time
+        waiting_times = table.waiting_time
+        
+        current_time = completion_times[first_row - 1] if first_row else 0
+        
+        for row in range(first_row, len(table)):
+            if not row % CHECKPOINT_INTERVAL:
+                checkpoint()
             # En SJF puro, no consideramos el arrival time para el ordenamiento
             # pero sí lo mostramos en la tabla para evidenciar la "injusticia"
+            burst_time = burst_times[row]
             
             # Tiempo de inicio del proceso (inmediatamente después del anterior)
-            process.start_time = current_time
-            
-            # Tiempo de finalización
-            process.completion_time = current_time + process.burst_time
+            start_times[row] = current_time
             
-            # Calcular tiempos con método específico para SJF
-            process.calculate_times_sjf(process.completion_time)
+            # Tiempo de finalización; en SJF TT = CT y WT = TT - BT
+            completion_time = current_time + burst_time
+            completion_times[row] = completion_time
+            turnaround_times[row] = completion_time
+            waiting_times[row] = completion_time - burst_time
             
-            # Añadir al diagrama de Gantt
-            self.gantt_chart.append({
-                'type': 'process',
-                'pid': process.pid,
-                'start': current_time,
-                'end': process.completion_time,
-                'duration': process.burst_time,
-                'original_arrival_time': process.arrival_time,  # Para mostrar la injusticia
-                'order': i + 1  # Orden de ejecución en SJF
-            })
+            # Añadir al diagrama de Gantt con el AT original (para mostrar la
+            # injusticia) y el orden de ejecución en SJF
+            gantt.add_process(pids[row], current_time, completion_time, arrival_times[row], row + 1)
             
             # Actualizar tiempo actual
-            current_time = process.completion_time
-            
-        # Ordenar por orden de ejecución para mostrar
-        self.execution_order = self.processes.copy()
+            current_time = completion_time
+        
+    def _schedule_numpy(self):
+        """Backend vectorizado de SJF: mismos resultados que schedule()."""
+        table = self.processes
+        order, start, completion, turnaround, waiting = sjf_times_vectorized(
+            table.pids,
+            np.frombuffer(table.burst_time, dtype=np.int64)
+        )
+        
+        table.permute(order)
+        table.reset_results()
+        table.set_column('start_time', start)
+        table.set_column('completion_time', completion)
+        table.set_column('turnaround_time', turnaround)
+        table.set_column('waiting_time', waiting)
+        
+        self.gantt_chart = GanttChart(SJF_GANTT_FIELDS)
+        self.gantt_chart.extend_columns(
+            self.gantt_chart.intern_many(table.pids, unique=True),
+            start,
+            completion,
+            original_arrival_time=table.arrival_time,
+            order=range(1, len(table) + 1)
+        )
+        
+        self.execution_order = table
+        
+    def get_results(self, fields=None):
+        """
+        Retorna los resultados del scheduling.
         
-    def get_results(self):
-        """Retorna los resultados del scheduling."""
-        return {
-            'processes': [p.to_dict() for p in self.processes],
-            'gantt_chart': self.gantt_chart,
-            'average_waiting_time': self.calculate_average_waiting_time(),
-            'average_turnaround_time': self.calculate_average_turnaround_time(),
-            'algorithm_analysis': self.analyze_sjf_characteristics(),
-            'statistics': self.calculate_statistics()
-        }
+        Args:
+            fields: Secciones a calcular (ver parse_fields); por defecto todas
+        """
+        return build_results({
+            'processes': lambda: {'processes': self.processes.to_dicts()},
+            'gantt_chart': lambda: {'gantt_chart': self.gantt_chart.to_list()},
+            'averages': lambda: {
+                'average_waiting_time': self.calculate_average_waiting_time(),
+                'average_turnaround_time': self.calculate_average_turnaround_time()
+            },
+            'statistics': lambda: {'statistics': self.calculate_statistics()},
+            'analysis': self.analysis_results
+        }, fields)
         
     def calculate_average_waiting_time(self):
         """Calcula el tiempo promedio de espera."""
         if not self.processes:
             return 0
-        total_waiting_time = sum(p.waiting_time for p in self.processes)
+        total_waiting_time = sum(self.processes.waiting_time)
         return total_waiting_time / len(self.processes)
         
     def calculate_average_turnaround_time(self):
         """Calcula el tiempo promedio de turnaround."""
         if not self.processes:
             return 0
-        total_turnaround_time = sum(p.turnaround_time for p in self.processes)
+        total_turnaround_time = sum(self.processes.turnaround_time)
         return total_turnaround_time / len(self.processes)
         
-    def analyze_sjf_characteristics(self):
-        """Analiza las características específicas del algoritmo SJF."""
+    def analyze_fairness(self, top_k=DEFAULT_TOP_K):
+        """
+        Equidad y starvation de la ejecución en O(n log n) (ver fairness.py).
+        
+        Returns:
+            dict: Adelantamientos, espera máxima, índice de Jain y los top_k
+            procesos con más espera
+        """
+        return fairness_report(self.processes, top_k)
+        
+    def analyze_sjf_characteristics(self, fairness=None):
+        """
+        Analiza las características específicas del algoritmo SJF.
+        
+        El texto tiene tamaño acotado: el detalle del orden solo se muestra
+        con pocos procesos (SJF_DETAIL_LIMIT) y los adelantamientos se
+        resumen con el informe de analyze_fairness() (que puede pasarse ya
+        calculado en fairness).
+        """
         if len(self.processes) < 2:
             return "No hay suficientes procesos para analizar las características de SJF."
-        
-        # Crear orden original (como fueron añadidos) vs orden de ejecución SJF
-        original_order = sorted(self.processes, key=lambda p: p.pid)  # Por ID para mostrar orden natural
-        execution_order = self.processes  # Ya ordenado por burst_time
+        if fairness is None:
+            fairness = self.analyze_fairness()
         
         analysis = []
         
         # Mostrar el reordenamiento por BT
         analysis.append(f"🔄 REORDENAMIENTO SJF:")
-        analysis.append(f"📝 Procesos por BT: {[(p.pid, f'BT={p.burst_time}') for p in execution_order]}")
-        
-        # Verificar si el orden cambió respecto al orden natural
-        natural_order_pids = [p.pid for p in original_order]
-        execution_order_pids = [p.pid for p in execution_order]
-        
-        if natural_order_pids != execution_order_pids:
-            analysis.append(f"⚠️ Orden natural: {natural_order_pids}")
-            analysis.append(f"⚡ Orden SJF: {execution_order_pids}")
-        
-        # Identificar procesos que fueron "saltados"
-        for i, process in enumerate(execution_order):
-            if process.arrival_time > 0:  # Si llegó después del tiempo 0
-                earlier_processes = [p for p in self.processes if p.arrival_time < process.arrival_time and p.burst_time > process.burst_time]
-                if earlier_processes:
-                    earlier_pids = [p.pid for p in earlier_processes]
-                    analysis.append(f"🏃‍♂️ {process.pid} (BT={process.burst_time}) ejecutó antes que {earlier_pids} (llegaron primero)")
+        if len(self.processes) <= SJF_DETAIL_LIMIT:
+            # Crear orden original (como fueron añadidos) vs orden de ejecución SJF
+            execution_order = self.processes  # Ya ordenado por burst_time
+            analysis.append(f"📝 Procesos por BT: {[(p.pid, f'BT={p.burst_time}') for p in execution_order]}")
+            
+            # Verificar si el orden cambió respecto al orden natural (por ID)
+            natural_order_pids = sorted(self.processes.pids)
+            execution_order_pids = list(self.processes.pids)
+            if natural_order_pids != execution_order_pids:
+                analysis.append(f"⚠️ Orden natural: {natural_order_pids}")
+                analysis.append(f"⚡ Orden SJF: {execution_order_pids}")
+        
+        # Procesos que fueron "saltados" por otros que llegaron después
+        if fairness['overtakes']:
+            analysis.append(f"🏃‍♂️ {fairness['overtaking_processes']} proceso(s) ejecutaron antes que otros que "
+                            f"llegaron primero ({fairness['overtakes']} adelantamiento(s))")
+            most_starved = fairness['top_starved'][0] if fairness['top_starved'] else None
+            if most_starved is not None:
+                analysis.append(f"⏳ Mayor espera: {most_starved['pid']} (WT={most_starved['waiting_time']}, "
+                                f"adelantado por {most_starved['overtaken_by']} proceso(s))")
+        analysis.append(f"⚖️ Índice de equidad de Jain: {fairness['jain_index']}")
         
         # Analizar ventajas de SJF
         analysis.append("✅ Minimiza tiempo promedio de espera")
@@ -325,80 +686,88 @@ class SJFScheduler:
         
         return " | ".join(analysis)
         
+    def analysis_results(self):
+        """Sección 'analysis' de get_results(): texto e informe de equidad."""
+        fairness = self.analyze_fairness()
+        return {
+            'algorithm_analysis': self.analyze_sjf_characteristics(fairness),
+            'fairness': fairness
+        }
+        
     def calculate_statistics(self):
         """
-        Calcula estadísticas completas (media y desviación estándar).
+        Calcula estadísticas completas en una sola pasada (ver statistics_engine).
         
         Returns:
-            dict: Diccionario con medias y desviaciones estándar de todas las métricas
+            dict: Media, desviación estándar, mínimo y máximo de cada métrica,
+            más p50/p95/p99 de los tiempos de espera y de turnaround
         """
-        if not self.processes:
-            return {}
-        
-        import math
-        
-        # Extraer todas las métricas
-        arrival_times = [p.arrival_time for p in self.processes]
-        burst_times = [p.burst_time for p in self.processes]
-        completion_times = [p.completion_time for p in self.processes]
-        turnaround_times = [p.turnaround_time for p in self.processes]
-        waiting_times = [p.waiting_time for p in self.processes]
+        return compute_statistics(self.processes, STATISTICS_METRICS)
         
-        def calculate_mean_std(values):
-            """Calcula media y desviación estándar de una lista de valores."""
-            if not values:
-                return 0, 0
-            
-            mean = sum(values) / len(values)
-            
-            if len(values) == 1:
-                return mean, 0
-            
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            std_dev = math.sqrt(variance)
-            
-            return mean, std_dev
+    def stream(self, processes):
+        """
+        Simulación en streaming con memoria acotada (ver streaming.py).
         
-        # Calcular estadísticas para cada métrica
-        stats = {}
-        metrics = {
-            'arrival_time': arrival_times,
-            'burst_time': burst_times,
-            'completion_time': completion_times,
-            'turnaround_time': turnaround_times,
-            'waiting_time': waiting_times
-        }
+        A diferencia de schedule(), el SJF en streaming respeta los tiempos
+        de llegada: elige la ráfaga más corta entre los procesos ya llegados.
         
-        for metric_name, values in metrics.items():
-            mean, std_dev = calculate_mean_std(values)
-            stats[metric_name] = {
-                'mean': round(mean, 2),
-                'std_dev': round(std_dev, 2),
-                'min': min(values) if values else 0,
-                'max': max(values) if values else 0
-            }
+        Args:
+            processes: Iterador de procesos (pid, arrival_time, burst_time[,
+                priority]) ordenado por tiempo de llegada
         
-        return stats
+        Returns:
+            SimulationStream: Registros de segmentos y procesos terminados
+            a medida que ocurren, y su resumen (summary())
+        """
+        # Importación diferida: streaming importa este módulo
+        from streaming import stream_simulation
+        return stream_simulation('SJF', processes)
         
     def reset(self):
         """Reinicia el scheduler."""
-        self.processes = []
+        self.processes = ProcessTable()
         self.execution_order = []
-        self.gantt_chart = []
+        self.gantt_chart = GanttChart(SJF_GANTT_FIELDS)
+        self._scheduled = None
 
 
 class SchedulerFactory:
     """Factory para crear diferentes tipos de schedulers."""
     
     @staticmethod
-    def create_scheduler(algorithm_type, quantum=None):
-        """Crea un scheduler basado en el tipo de algoritmo."""
+    def create_scheduler(algorithm_type, quantum=None, event_driven=False, backend='python',
+                         aging_interval=DEFAULT_AGING_INTERVAL, cores=1, balancing='least_loaded',
+                         work_stealing=True):
+        """
+        Crea un scheduler basado en el tipo de algoritmo.
+        
+        Args:
+            algorithm_type (str): 'FCFS', 'SJF', 'RR', 'SRTF' o 'PRIORITY'
+            quantum (int): Quantum para Round Robin
+            event_driven (bool): Para RR, usa la simulación por eventos
+            backend (str): Para FCFS/SJF, 'python' o 'numpy'
+            aging_interval (int): Para PRIORITY, unidades de espera por nivel
+                de prioridad ganado (0 desactiva el aging)
+            cores (int): Con más de un núcleo (FCFS, SJF o RR) crea un
+                SMPScheduler con una cola por núcleo
+            balancing (str): Política de reparto entre núcleos (ver smp)
+            work_stealing (bool): Si los núcleos ociosos roban trabajo
+        """
+        if cores and cores > 1:
+            # Importación diferida: smp importa este módulo
+            from smp import SMPScheduler
+            return SMPScheduler(algorithm_type, cores=cores, quantum=quantum,
+                                balancing=balancing, work_stealing=work_stealing)
         if algorithm_type.upper() == 'FCFS':
-            return FCFSScheduler()
+            return FCFSScheduler(backend=backend)
         elif algorithm_type.upper() == 'SJF':
-            return SJFScheduler()
+            return SJFScheduler(backend=backend)
         elif algorithm_type.upper() == 'RR':
-            return RoundRobinScheduler(quantum)
+            return RoundRobinScheduler(quantum, event_driven=event_driven)
+        elif algorithm_type.upper() == 'SRTF':
+            return SRTFScheduler()
+        elif algorithm_type.upper() == 'PRIORITY':
+            return PriorityScheduler(aging_interval=aging_interval)
         else:
             raise ValueError(f"Algoritmo {algorithm_type} no soportado aún.")
 
@@ -418,22 +787,29 @@ class RoundRobinScheduler:
     - Context Switching: Cambios frecuentes entre procesos
     """
     
-    def __init__(self, quantum=4):
+    def __init__(self, quantum=4, event_driven=False):
         """
         Inicializa el scheduler Round Robin.
         
         Args:
             quantum (int): Tiempo de quantum para cada proceso (por defecto 4)
+            event_driven (bool): Si es True, la simulación salta directamente
+                al siguiente evento (llegada o finalización) en lugar de
+                avanzar quantum a quantum (ver _schedule_event_driven)
         """
-        self.processes = []
+        self.processes = ProcessTable()
         self.execution_order = []
-        self.gantt_chart = []
+        self.gantt_chart = GanttChart(RR_GANTT_FIELDS)
         self.quantum = quantum if quantum and quantum > 0 else 4
+        self.event_driven = event_driven
+        
+    def add_process(self, pid, arrival_time, burst_time, priority=0):
+        """Añade un proceso a la tabla de procesos."""
+        self.processes.append(pid, arrival_time, burst_time, priority)
         
-    def add_process(self, pid, arrival_time, burst_time):
-        """Añade un proceso a la lista."""
-        process = Process(pid, arrival_time, burst_time)
-        self.processes.append(process)
+    def add_processes(self, pids, arrival_times, burst_times, priorities=None):
+        """Añade procesos en bloque (columnas) sin crear un objeto por fila."""
+        self.processes.extend(pids, arrival_times, burst_times, priorities)
         
     def schedule(self):
         """
@@ -441,7 +817,8 @@ class RoundRobinScheduler:
         
         El algoritmo funciona de la siguiente manera:
         1. Los procesos se ordenan por tiempo de llegada
-        2. Se utiliza una cola circular (Ready Queue)
+        2. Se utiliza una cola circular (Ready Queue) sobre un deque, de modo
+           que tomar y reencolar un proceso cuesta O(1)
         3. Cada proceso ejecuta por máximo 'quantum' unidades
         4. Si el proceso no termina, va al final de la cola
         5. Se continúa hasta que todos los procesos terminen
@@ -449,186 +826,271 @@ class RoundRobinScheduler:
         if not self.processes:
             return
             
-        # Ordenar procesos por tiempo de llegada
-        self.processes.sort(key=lambda p: (p.arrival_time, p.pid))
+        # Ordenar procesos por tiempo de llegada y reiniciar el estado de
+        # ejecución (remaining_time, quantum_used...) para poder re-planificar
+        table = self.processes
+        table.sort_by('arrival_time', 'pid')
+        table.reset_results()
+        
+        self.gantt_chart = GanttChart(RR_GANTT_FIELDS)
+        mark('sort')
+        
+        if self.event_driven:
+            self._schedule_event_driven()
+            mark('simulate')
+            self.execution_order = table
+            return
         
-        # Cola de procesos listos
-        ready_queue = []
-        completed_processes = []
+        # Cola de procesos listos con índices de fila (deque: popleft/append en O(1))
+        ready_queue = deque()
         current_time = 0
-        self.gantt_chart = []
+        
+        total_processes = len(table)
+        quantum = self.quantum
+        gantt = self.gantt_chart
+        pids = table.pids
+        arrival_times = table.arrival_time
+        burst_times = table.burst_time
+        remaining_times = table.remaining_time
+        start_times = table.start_time
+        quantum_used = table.quantum_used
         
         # Índice para rastrear procesos que aún no han llegado
         process_index = 0
         
         # Agregar procesos que llegan en tiempo 0
-        while process_index < len(self.processes) and self.processes[process_index].arrival_time <= current_time:
-            ready_queue.append(self.processes[process_index])
+        while process_index < total_processes and arrival_times[process_index] <= current_time:
+            ready_queue.append(process_index)
             process_index += 1
         
-        while ready_queue or process_index < len(self.processes):
+        steps = 0  # Iteraciones, para los puntos de control (jobs.checkpoint)
+        while ready_queue or process_index < total_processes:
+            steps += 1
+            if not steps % CHECKPOINT_INTERVAL:
+                checkpoint()
             if not ready_queue:
                 # No hay procesos listos, avanzar tiempo hasta el próximo proceso
-                next_arrival = self.processes[process_index].arrival_time
+                next_arrival = arrival_times[process_index]
                 if next_arrival > current_time:
                     # Añadir tiempo idle al diagrama de Gantt
-                    self.gantt_chart.append({
-                        'type': 'idle',
-                        'start': current_time,
-                        'end': next_arrival,
-                        'duration': next_arrival - current_time
-                    })
+                    gantt.add_idle(current_time, next_arrival)
                     current_time = next_arrival
                 
                 # Agregar procesos que llegan en este momento
-                while process_index < len(self.processes) and self.processes[process_index].arrival_time <= current_time:
-                    ready_queue.append(self.processes[process_index])
+                while process_index < total_processes and arrival_times[process_index] <= current_time:
+                    ready_queue.append(process_index)
                     process_index += 1
                 continue
             
             # Tomar el primer proceso de la cola
-            current_process = ready_queue.pop(0)
+            row = ready_queue.popleft()
+            remaining_time = remaining_times[row]
             
             # Marcar tiempo de inicio si es la primera vez que ejecuta
-            if current_process.remaining_time == current_process.burst_time:
-                current_process.start_time = current_time
+            if remaining_time == burst_times[row]:
+                start_times[row] = current_time
             
             # Calcular tiempo de ejecución (mínimo entre quantum y tiempo restante)
-            execution_time = min(self.quantum, current_process.remaining_time)
+            execution_time = min(quantum, remaining_time)
             
             # Actualizar tiempo de ejecución
-            current_process.remaining_time -= execution_time
-            current_process.quantum_used += 1  # Incrementar quantums utilizados
+            remaining_time -= execution_time
+            remaining_times[row] = remaining_time
+            quantum_used[row] += 1  # Incrementar quantums utilizados
             
             # Añadir al diagrama de Gantt
-            self.gantt_chart.append({
-                'type': 'process',
-                'pid': current_process.pid,
-                'start': current_time,
-                'end': current_time + execution_time,
-                'duration': execution_time,
-                'quantum_number': current_process.quantum_used,
-                'remaining_time': current_process.remaining_time
-            })
+            gantt.add_process(pids[row], current_time, current_time + execution_time, quantum_used[row], remaining_time)
             
             # Avanzar tiempo actual
             current_time += execution_time
             
             # Agregar nuevos procesos que llegaron durante la ejecución
-            while process_index < len(self.processes) and self.processes[process_index].arrival_time <= current_time:
-                ready_queue.append(self.processes[process_index])
+            while process_index < total_processes and arrival_times[process_index] <= current_time:
+                ready_queue.append(process_index)
                 process_index += 1
             
             # Verificar si el proceso terminó
-            if current_process.remaining_time == 0:
-                # Proceso completado
-                current_process.calculate_times_rr(current_time)
-                completed_processes.append(current_process)
+            if remaining_time == 0:
+                self._complete_process(row, current_time)
             else:
                 # Proceso no terminado, regresa al final de la cola
-                ready_queue.append(current_process)
-        
-        # Reordenar procesos según el orden original para mostrar resultados
-        process_dict = {p.pid: p for p in self.processes}
-        completed_dict = {p.pid: p for p in completed_processes}
-        
-        # Actualizar procesos originales con los datos calculados
-        for process in self.processes:
-            if process.pid in completed_dict:
-                completed = completed_dict[process.pid]
-                process.completion_time = completed.completion_time
-                process.turnaround_time = completed.turnaround_time
-                process.waiting_time = completed.waiting_time
-                process.start_time = completed.start_time
-                process.quantum_used = completed.quantum_used
-        
-        self.execution_order = self.processes.copy()
-        
-    def get_results(self):
-        """Retorna los resultados del scheduling con estadísticas."""
-        results = {
-            'processes': [p.to_dict() for p in self.processes],
-            'gantt_chart': self.gantt_chart,
-            'average_waiting_time': self.calculate_average_waiting_time(),
-            'average_turnaround_time': self.calculate_average_turnaround_time(),
-            'algorithm_analysis': self.analyze_round_robin(),
-            'quantum': self.quantum,
-            'statistics': self.calculate_statistics()
-        }
-        return results
+                ready_queue.append(row)
+        mark('simulate')
+        
+        self.execution_order = table
+        
+    def _complete_process(self, row, completion_time):
+        """Registra CT, TT, WT y NTAT (TAT/BT) de un proceso terminado."""
+        table = self.processes
+        burst_time = table.burst_time[row]
+        turnaround_time = completion_time - table.arrival_time[row]
+        table.completion_time[row] = completion_time
+        table.turnaround_time[row] = turnaround_time
+        table.waiting_time[row] = turnaround_time - burst_time
+        table.normalized_turnaround_time[row] = round(turnaround_time / burst_time, 2) if burst_time > 0 else 0
+        
+    def _schedule_event_driven(self):
+        """
+        Simulación Round Robin por eventos (time-skipping).
+        
+        Produce los mismos tiempos por proceso que el recorrido quantum a
+        quantum, pero avanza el reloj directamente hasta el siguiente evento
+        de interés (próxima llegada o finalización):
+        
+        - Si hay un único proceso listo, ejecuta de una vez todos sus quantums
+          hasta que termina o hasta que llega otro proceso, y los registra como
+          un solo segmento en el diagrama de Gantt.
+        - Si hay varios procesos listos, liquida en bloque las rondas
+          completas en las que ninguno termina y no llega nadie, sin
+          operaciones de cola ni comprobaciones de llegada por quantum.
+        
+        Así el coste depende del número de eventos y de cambios de contexto
+        reales, no de burst_time / quantum.
+        """
+        table = self.processes
+        total_processes = len(table)
+        quantum = self.quantum
+        gantt = self.gantt_chart
+        pids = table.pids
+        arrival_times = table.arrival_time
+        burst_times = table.burst_time
+        remaining_times = table.remaining_time
+        start_times = table.start_time
+        quantum_used = table.quantum_used
+        
+        ready_queue = deque()
+        current_time = 0
+        process_index = 0
+        dispatches_until_check = 0
+        
+        steps = 0  # Iteraciones, para los puntos de control (jobs.checkpoint)
+        while ready_queue or process_index < total_processes:
+            steps += 1
+            if not steps % CHECKPOINT_INTERVAL:
+                checkpoint()
+            # Agregar procesos que ya llegaron
+            while process_index < total_processes and arrival_times[process_index] <= current_time:
+                ready_queue.append(process_index)
+                process_index += 1
+            
+            if not ready_queue:
+                # CPU ociosa hasta la próxima llegada
+                next_arrival = arrival_times[process_index]
+                gantt.add_idle(current_time, next_arrival)
+                current_time = next_arrival
+                continue
+            
+            next_arrival = arrival_times[process_index] if process_index < total_processes else None
+            queue_length = len(ready_queue)
+            
+            if queue_length > 1:
+                # Rondas completas que acaban antes de la próxima llegada (O(1);
+                # None si no quedan llegadas)
+                rounds = None
+                if next_arrival is not None:
+                    rounds = (next_arrival - current_time - 1) // (queue_length * quantum)
+                
+                if (rounds is None or rounds > 0) and dispatches_until_check <= 0:
+                    # ...y en las que nadie termina (a todos les queda más de un
+                    # quantum). Recorrer la cola cuesta O(n): si no se puede
+                    # saltar, no se vuelve a intentar hasta dentro de una ronda
+                    fewest_slices = min(-(-remaining_times[row] // quantum) for row in ready_queue) - 1
+                    rounds = fewest_slices if rounds is None else min(rounds, fewest_slices)
+                    if rounds <= 0:
+                        dispatches_until_check = queue_length
+                else:
+                    rounds = 0
+                dispatches_until_check -= 1
+                
+                if rounds > 0:
+                    # El orden de la cola no cambia tras rondas completas
+                    round_length = queue_length * quantum
+                    for offset, row in enumerate(ready_queue):
+                        if remaining_times[row] == burst_times[row]:
+                            start_times[row] = current_time + offset * quantum
+                    for r in range(rounds):
+                        start = current_time + r * round_length
+                        for row in ready_queue:
+                            quantum_used[row] += 1
+                            remaining_times[row] -= quantum
+                            gantt.add_process(pids[row], start, start + quantum, quantum_used[row], remaining_times[row])
+                            start += quantum
+                    current_time += rounds * round_length
+                    continue
+                slices = 1
+            else:
+                # Proceso solo en la cola: corre hasta terminar o hasta que
+                # un quantum acabe en (o después de) la próxima llegada
+                slices = -(-remaining_times[ready_queue[0]] // quantum)
+                if next_arrival is not None:
+                    slices = min(slices, -(-(next_arrival - current_time) // quantum))
+            
+            row = ready_queue.popleft()
+            remaining_time = remaining_times[row]
+            
+            if remaining_time == burst_times[row]:
+                start_times[row] = current_time
+            
+            execution_time = min(slices * quantum, remaining_time)
+            remaining_time -= execution_time
+            remaining_times[row] = remaining_time
+            quantum_used[row] += slices
+            
+            gantt.add_process(pids[row], current_time, current_time + execution_time, quantum_used[row], remaining_time)
+            
+            current_time += execution_time
+            
+            # Las llegadas durante la ejecución entran antes que el proceso
+            while process_index < total_processes and arrival_times[process_index] <= current_time:
+                ready_queue.append(process_index)
+                process_index += 1
+            
+            if remaining_time == 0:
+                self._complete_process(row, current_time)
+            else:
+                ready_queue.append(row)
+        
+    def get_results(self, fields=None):
+        """
+        Retorna los resultados del scheduling con estadísticas.
+        
+        Args:
+            fields: Secciones a calcular (ver parse_fields); por defecto todas
+        """
+        return build_results({
+            'processes': lambda: {'processes': self.processes.to_dicts()},
+            'gantt_chart': lambda: {'gantt_chart': self.gantt_chart.to_list()},
+            'averages': lambda: {
+                'average_waiting_time': self.calculate_average_waiting_time(),
+                'average_turnaround_time': self.calculate_average_turnaround_time()
+            },
+            'statistics': lambda: {'statistics': self.calculate_statistics()},
+            'analysis': lambda: {'algorithm_analysis': self.analyze_round_robin()}
+        }, fields, quantum=self.quantum)
         
     def calculate_average_waiting_time(self):
         """Calcula el tiempo promedio de espera."""
         if not self.processes:
             return 0
-        total_waiting_time = sum(p.waiting_time for p in self.processes)
+        total_waiting_time = sum(self.processes.waiting_time)
         return total_waiting_time / len(self.processes)
         
     def calculate_average_turnaround_time(self):
         """Calcula el tiempo promedio de turnaround."""
         if not self.processes:
             return 0
-        total_turnaround_time = sum(p.turnaround_time for p in self.processes)
+        total_turnaround_time = sum(self.processes.turnaround_time)
         return total_turnaround_time / len(self.processes)
         
     def calculate_statistics(self):
         """
-        Calcula estadísticas completas (media y desviación estándar).
+        Calcula estadísticas completas en una sola pasada (ver statistics_engine).
         
         Returns:
-            dict: Diccionario con medias y desviaciones estándar de todas las métricas
+            dict: Media, desviación estándar, mínimo y máximo de cada métrica,
+            más p50/p95/p99 de los tiempos de espera y de turnaround
         """
-        if not self.processes:
-            return {}
-        
-        import math
-        
-        # Extraer todas las métricas
-        arrival_times = [p.arrival_time for p in self.processes]
-        burst_times = [p.burst_time for p in self.processes]
-        completion_times = [p.completion_time for p in self.processes]
-        turnaround_times = [p.turnaround_time for p in self.processes]
-        waiting_times = [p.waiting_time for p in self.processes]
-        quantum_used = [p.quantum_used for p in self.processes]
-        normalized_turnaround_times = [getattr(p, 'normalized_turnaround_time', 0) for p in self.processes]
-        
-        def calculate_mean_std(values):
-            """Calcula media y desviación estándar de una lista de valores."""
-            if not values:
-                return 0, 0
-            
-            mean = sum(values) / len(values)
-            
-            if len(values) == 1:
-                return mean, 0
-            
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            std_dev = math.sqrt(variance)
-            
-            return mean, std_dev
-        
-        # Calcular estadísticas para cada métrica
-        stats = {}
-        metrics = {
-            'arrival_time': arrival_times,
-            'burst_time': burst_times,
-            'completion_time': completion_times,
-            'turnaround_time': turnaround_times,
-            'waiting_time': waiting_times,
-            'quantum_used': quantum_used,
-            'normalized_turnaround_time': normalized_turnaround_times
-        }
-        
-        for metric_name, values in metrics.items():
-            mean, std_dev = calculate_mean_std(values)
-            stats[metric_name] = {
-                'mean': round(mean, 2),
-                'std_dev': round(std_dev, 2),
-                'min': min(values) if values else 0,
-                'max': max(values) if values else 0
-            }
-        
-        return stats
+        return compute_statistics(self.processes, RR_STATISTICS_METRICS)
         
     def analyze_round_robin(self):
         """Analiza las características específicas del algoritmo Round Robin."""
@@ -638,18 +1100,21 @@ class RoundRobinScheduler:
         analysis = []
         
         # Analizar quantum efficiency
-        total_quantum_used = sum(p.quantum_used for p in self.processes)
-        total_execution_time = sum(p.burst_time for p in self.processes)
+        total_quantum_used = sum(self.processes.quantum_used)
+        total_execution_time = sum(self.processes.burst_time)
         
-        # Context switches (cambios de contexto)
-        context_switches = len([g for g in self.gantt_chart if g['type'] == 'process']) - len(self.processes)
+        # Context switches (cambios de contexto): uno por quantum después del
+        # primero de cada proceso. Se cuentan desde los quantums usados y no
+        # desde los segmentos del Gantt, porque en modo por eventos los
+        # quantums consecutivos de un mismo proceso forman un solo segmento
+        context_switches = total_quantum_used - len(self.processes)
         
         analysis.append(f"Quantum={self.quantum} unidades")
         analysis.append(f"Total quantums utilizados: {total_quantum_used}")
         analysis.append(f"Context switches: {context_switches}")
         
         # Analizar eficiencia del quantum
-        if self.quantum >= max(p.burst_time for p in self.processes):
+        if self.quantum >= max(self.processes.burst_time):
             analysis.append("⚠️ Quantum muy grande - comportamiento similar a FCFS")
         elif self.quantum == 1:
             analysis.append("⚠️ Quantum muy pequeño - muchos context switches")
@@ -658,8 +1123,445 @@ class RoundRobinScheduler:
             
         return " | ".join(analysis)
         
+    def stream(self, processes):
+        """
+        Simulación en streaming con memoria acotada (ver streaming.py).
+        
+        Args:
+            processes: Iterador de procesos (pid, arrival_time, burst_time[,
+                priority]) ordenado por tiempo de llegada
+        
+        Returns:
+            SimulationStream: Registros de segmentos y procesos terminados
+            a medida que ocurren, y su resumen (summary())
+        """
+        # Importación diferida: streaming importa este módulo
+        from streaming import stream_simulation
+        return stream_simulation('RR', processes, quantum=self.quantum)
+        
+    def reset(self):
+        """Reinicia el scheduler."""
+        self.processes = ProcessTable()
+        self.execution_order = []
+        self.gantt_chart = GanttChart(RR_GANTT_FIELDS)
+
+
+class SRTFScheduler:
+    """
+    Implementación de Shortest Remaining Time First (SRTF), la versión
+    preemptiva de SJF.
+    
+    Los procesos listos están en un heap por tiempo restante (O(log n) por
+    operación) y la simulación avanza por eventos: el proceso elegido corre
+    hasta terminar, y en cada llegada solo se le expulsa si el mejor proceso
+    listo tiene menos tiempo restante. Los empates se resuelven por orden
+    de llegada y PID, así que un proceso en ejecución no es expulsado por
+    otro con el mismo tiempo restante.
+    """
+    
+    def __init__(self):
+        self.processes = ProcessTable()
+        self.execution_order = []
+        self.gantt_chart = GanttChart(SRTF_GANTT_FIELDS)
+        
+    def add_process(self, pid, arrival_time, burst_time, priority=0):
+        """Añade un proceso a la tabla de procesos."""
+        self.processes.append(pid, arrival_time, burst_time, priority)
+        
+    def add_processes(self, pids, arrival_times, burst_times, priorities=None):
+        """Añade procesos en bloque (columnas) sin crear un objeto por fila."""
+        self.processes.extend(pids, arrival_times, burst_times, priorities)
+        
+    def schedule(self):
+        """Ejecuta SRTF y calcula todos los tiempos."""
+        if not self.processes:
+            return
+        
+        # El índice de fila (orden por llegada y PID) desempata en el heap
+        table = self.processes
+        table.sort_by('arrival_time', 'pid')
+        table.reset_results()
+        
+        self.gantt_chart = GanttChart(SRTF_GANTT_FIELDS)
+        gantt = self.gantt_chart
+        mark('sort')
+        
+        total_processes = len(table)
+        pids = table.pids
+        arrival_times = table.arrival_time
+        burst_times = table.burst_time
+        remaining_times = table.remaining_time
+        start_times = table.start_time
+        completion_times = table.completion_time
+        turnaround_times = table.turnaround_time
+        waiting_times = table.waiting_time
+        started = bytearray(total_processes)
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        # Heap de procesos listos: (tiempo restante, fila)
+        ready = []
+        current_time = 0
+        process_index = 0
+        
+        steps = 0  # Iteraciones, para los puntos de control (jobs.checkpoint)
+        while ready or process_index < total_processes:
+            steps += 1
+            if not steps % CHECKPOINT_INTERVAL:
+                checkpoint()
+            if not ready and arrival_times[process_index] > current_time:
+                # CPU ociosa hasta la próxima llegada
+                gantt.add_idle(current_time, arrival_times[process_index])
+                current_time = arrival_times[process_index]
+            
+            while process_index < total_processes and arrival_times[process_index] <= current_time:
+                heappush(ready, (remaining_times[process_index], process_index))
+                process_index += 1
+            
+            remaining_time, row = heappop(ready)
+            if not started[row]:
+                started[row] = 1
+                start_times[row] = current_time
+            segment_start = current_time
+            
+            # Ejecutar hasta terminar; en cada llegada se compara con el mejor
+            # proceso listo sin sacar de la CPU al actual si sigue siendo el mejor
+            while True:
+                end = current_time + remaining_time
+                if process_index >= total_processes or arrival_times[process_index] >= end:
+                    current_time = end
+                    remaining_time = 0
+                    break
+                
+                next_arrival = arrival_times[process_index]
+                remaining_time -= next_arrival - current_time
+                current_time = next_arrival
+                while process_index < total_processes and arrival_times[process_index] <= current_time:
+                    heappush(ready, (remaining_times[process_index], process_index))
+                    process_index += 1
+                
+                if ready[0] < (remaining_time, row):
+                    break
+            
+            remaining_times[row] = remaining_time
+            gantt.add_process(pids[row], segment_start, current_time, remaining_time)
+            
+            if remaining_time == 0:
+                completion_times[row] = current_time
+                turnaround_times[row] = current_time - arrival_times[row]
+                waiting_times[row] = current_time - arrival_times[row] - burst_times[row]
+            else:
+                heappush(ready, (remaining_time, row))
+        mark('simulate')
+        
+        self.execution_order = table
+        
+    def get_results(self, fields=None):
+        """
+        Retorna los resultados del scheduling.
+        
+        Args:
+            fields: Secciones a calcular (ver parse_fields); por defecto todas
+        """
+        return build_results({
+            'processes': lambda: {'processes': self.processes.to_dicts()},
+            'gantt_chart': lambda: {'gantt_chart': self.gantt_chart.to_list()},
+            'averages': lambda: {
+                'average_waiting_time': self.calculate_average_waiting_time(),
+                'average_turnaround_time': self.calculate_average_turnaround_time()
+            },
+            'statistics': lambda: {'statistics': self.calculate_statistics()},
+            'analysis': lambda: {'algorithm_analysis': self.analyze_srtf()}
+        }, fields)
+        
+    def calculate_average_waiting_time(self):
+        """Calcula el tiempo promedio de espera."""
+        if not self.processes:
+            return 0
+        total_waiting_time = sum(self.processes.waiting_time)
+        return total_waiting_time / len(self.processes)
+        
+    def calculate_average_turnaround_time(self):
+        """Calcula el tiempo promedio de turnaround."""
+        if not self.processes:
+            return 0
+        total_turnaround_time = sum(self.processes.turnaround_time)
+        return total_turnaround_time / len(self.processes)
+        
+    def analyze_srtf(self):
+        """Analiza las expulsiones (preemptions) producidas por SRTF."""
+        if not self.processes:
+            return "No hay procesos para analizar."
+        
+        # Cada expulsión parte la ejecución de un proceso en un segmento más
+        preemptions = self.gantt_chart.count_process_segments() - len(self.processes)
+        
+        analysis = [f"Preemptions: {preemptions}"]
+        analysis.append("✅ Minimiza el tiempo promedio de espera (óptimo entre los preemptivos)")
+        analysis.append("⚠️ Los procesos largos pueden sufrir starvation si siguen llegando procesos cortos")
+        return " | ".join(analysis)
+        
+    def calculate_statistics(self):
+        """
+        Calcula estadísticas completas en una sola pasada (ver statistics_engine).
+        
+        Returns:
+            dict: Media, desviación estándar, mínimo y máximo de cada métrica,
+            más p50/p95/p99 de los tiempos de espera y de turnaround
+        """
+        return compute_statistics(self.processes, STATISTICS_METRICS)
+        
+    def stream(self, processes):
+        """
+        Simulación en streaming con memoria acotada (ver streaming.py).
+        
+        Args:
+            processes: Iterador de procesos (pid, arrival_time, burst_time[,
+                priority]) ordenado por tiempo de llegada
+        
+        Returns:
+            SimulationStream: Registros de segmentos y procesos terminados
+            a medida que ocurren, y su resumen (summary())
+        """
+        # Importación diferida: streaming importa este módulo
+        from streaming import stream_simulation
+        return stream_simulation('SRTF', processes)
+        
+    def reset(self):
+        """Reinicia el scheduler."""
+        self.processes = ProcessTable()
+        self.execution_order = []
+        self.gantt_chart = GanttChart(SRTF_GANTT_FIELDS)
+
+
+class PriorityScheduler:
+    """
+    Planificación por prioridades con envejecimiento (aging).
+    
+    Un número menor indica mayor prioridad. Mientras espera en la cola, un
+    proceso gana un nivel de prioridad por cada aging_interval unidades de
+    tiempo, lo que evita la inanición de los procesos de baja prioridad.
+    
+    Como todos los procesos en espera envejecen al mismo ritmo, su orden
+    relativo solo depende de prioridad * aging_interval + instante en que
+    entraron a la cola. Esa clave no cambia con el tiempo, así que la cola es
+    un heap (O(log n) por operación) y no hay que recalcular prioridades en
+    cada unidad de tiempo.
+    
+    Con preemptive=True, en cada llegada se compara el mejor proceso en
+    espera (con su envejecimiento) con la prioridad del proceso en ejecución
+    y, si es estrictamente mejor, lo expulsa; el expulsado vuelve a la cola
+    sin envejecimiento acumulado.
+    """
+    
+    def __init__(self, aging_interval=DEFAULT_AGING_INTERVAL, preemptive=True):
+        """
+        Args:
+            aging_interval (int): Unidades de espera por nivel de prioridad
+                ganado (0 o None desactiva el aging)
+            preemptive (bool): Si una llegada puede expulsar al proceso en
+                ejecución
+        """
+        self.processes = ProcessTable()
+        self.execution_order = []
+        self.gantt_chart = GanttChart(PRIORITY_GANTT_FIELDS)
+        self.aging_interval = aging_interval if aging_interval and aging_interval > 0 else 0
+        self.preemptive = preemptive
+        
+    def add_process(self, pid, arrival_time, burst_time, priority=0):
+        """Añade un proceso a la tabla de procesos."""
+        self.processes.append(pid, arrival_time, burst_time, priority)
+        
+    def add_processes(self, pids, arrival_times, burst_times, priorities=None):
+        """Añade procesos en bloque (columnas) sin crear un objeto por fila."""
+        self.processes.extend(pids, arrival_times, burst_times, priorities)
+        
+    def schedule(self):
+        """Ejecuta la planificación por prioridades y calcula todos los tiempos."""
+        if not self.processes:
+            return
+        
+        table = self.processes
+        table.sort_by('arrival_time', 'pid')
+        table.reset_results()
+        
+        self.gantt_chart = GanttChart(PRIORITY_GANTT_FIELDS)
+        gantt = self.gantt_chart
+        mark('sort')
+        
+        total_processes = len(table)
+        aging = self.aging_interval
+        preemptive = self.preemptive
+        pids = table.pids
+        arrival_times = table.arrival_time
+        burst_times = table.burst_time
+        priorities = table.priority
+        remaining_times = table.remaining_time
+        start_times = table.start_time
+        completion_times = table.completion_time
+        turnaround_times = table.turnaround_time
+        waiting_times = table.waiting_time
+        started = bytearray(total_processes)
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        
+        # Heap de procesos listos: (clave, instante de entrada a la cola, fila);
+        # la clave es prioridad * aging + entrada, o solo la prioridad sin aging
+        ready = []
+        current_time = 0
+        process_index = 0
+        
+        steps = 0  # Iteraciones, para los puntos de control (jobs.checkpoint)
+        while ready or process_index < total_processes:
+            steps += 1
+            if not steps % CHECKPOINT_INTERVAL:
+                checkpoint()
+            if not ready and arrival_times[process_index] > current_time:
+                # CPU ociosa hasta la próxima llegada
+                gantt.add_idle(current_time, arrival_times[process_index])
+                current_time = arrival_times[process_index]
+            
+            # Los procesos entran a la cola (y empiezan a envejecer) al llegar
+            while process_index < total_processes and arrival_times[process_index] <= current_time:
+                arrival_time = arrival_times[process_index]
+                key = priorities[process_index] * aging + arrival_time if aging else priorities[process_index]
+                heappush(ready, (key, arrival_time, process_index))
+                process_index += 1
+            
+            _, ready_since, row = heappop(ready)
+            if not started[row]:
+                started[row] = 1
+                start_times[row] = current_time
+            
+            priority = priorities[row]
+            effective_priority = priority - (current_time - ready_since) // aging if aging else priority
+            remaining_time = remaining_times[row]
+            segment_start = current_time
+            
+            # Ejecutar hasta terminar; con preemption se re-evalúa en cada llegada
+            while True:
+                end = current_time + remaining_time
+                if not preemptive or process_index >= total_processes or arrival_times[process_index] >= end:
+                    current_time = end
+                    remaining_time = 0
+                    break
+                
+                next_arrival = arrival_times[process_index]
+                remaining_time -= next_arrival - current_time
+                current_time = next_arrival
+                while process_index < total_processes and arrival_times[process_index] <= current_time:
+                    arrival_time = arrival_times[process_index]
+                    key = priorities[process_index] * aging + arrival_time if aging else priorities[process_index]
+                    heappush(ready, (key, arrival_time, process_index))
+                    process_index += 1
+                
+                # Clave que tendría el proceso en ejecución si volviera a la cola
+                running_key = priority * aging + current_time if aging else priority
+                if ready[0][0] < running_key:
+                    break
+            
+            remaining_times[row] = remaining_time
+            gantt.add_process(pids[row], segment_start, current_time, priority, effective_priority)
+            
+            if remaining_time == 0:
+                completion_times[row] = current_time
+                turnaround_times[row] = current_time - arrival_times[row]
+                waiting_times[row] = current_time - arrival_times[row] - burst_times[row]
+            else:
+                key = priority * aging + current_time if aging else priority
+                heappush(ready, (key, current_time, row))
+        mark('simulate')
+        
+        self.execution_order = table
+        
+    def get_results(self, fields=None):
+        """
+        Retorna los resultados del scheduling.
+        
+        Args:
+            fields: Secciones a calcular (ver parse_fields); por defecto todas
+        """
+        return build_results({
+            'processes': lambda: {'processes': self.processes.to_dicts()},
+            'gantt_chart': lambda: {'gantt_chart': self.gantt_chart.to_list()},
+            'averages': lambda: {
+                'average_waiting_time': self.calculate_average_waiting_time(),
+                'average_turnaround_time': self.calculate_average_turnaround_time()
+            },
+            'statistics': lambda: {'statistics': self.calculate_statistics()},
+            'analysis': lambda: {'algorithm_analysis': self.analyze_priority()}
+        }, fields, aging_interval=self.aging_interval)
+        
+    def calculate_average_waiting_time(self):
+        """Calcula el tiempo promedio de espera."""
+        if not self.processes:
+            return 0
+        total_waiting_time = sum(self.processes.waiting_time)
+        return total_waiting_time / len(self.processes)
+        
+    def calculate_average_turnaround_time(self):
+        """Calcula el tiempo promedio de turnaround."""
+        if not self.processes:
+            return 0
+        total_turnaround_time = sum(self.processes.turnaround_time)
+        return total_turnaround_time / len(self.processes)
+        
+    def analyze_priority(self):
+        """Analiza el efecto del aging y las expulsiones."""
+        if not self.processes:
+            return "No hay procesos para analizar."
+        
+        gantt = self.gantt_chart
+        preemptions = gantt.count_process_segments() - len(self.processes)
+        
+        # Despachos en los que el aging mejoró la prioridad del proceso
+        priorities = gantt.extras['priority']
+        effective_priorities = gantt.extras['effective_priority']
+        aged_dispatches = sum(1 for index in range(len(gantt))
+                              if not gantt.is_idle(index) and effective_priorities[index] < priorities[index])
+        
+        analysis = []
+        if self.aging_interval:
+            analysis.append(f"Aging: +1 nivel de prioridad cada {self.aging_interval} unidades de espera")
+        else:
+            analysis.append("Aging desactivado")
+        analysis.append(f"Preemptions: {preemptions}")
+        analysis.append(f"Despachos favorecidos por aging: {aged_dispatches}")
+        if self.aging_interval:
+            analysis.append("✅ El aging evita la starvation de procesos de baja prioridad")
+        else:
+            analysis.append("⚠️ Sin aging, los procesos de baja prioridad pueden sufrir starvation")
+        return " | ".join(analysis)
+        
+    def calculate_statistics(self):
+        """
+        Calcula estadísticas completas en una sola pasada (ver statistics_engine).
+        
+        Returns:
+            dict: Media, desviación estándar, mínimo y máximo de cada métrica,
+            más p50/p95/p99 de los tiempos de espera y de turnaround
+        """
+        return compute_statistics(self.processes, STATISTICS_METRICS)
+        
+    def stream(self, processes):
+        """
+        Simulación en streaming con memoria acotada (ver streaming.py).
+        
+        Args:
+            processes: Iterador de procesos (pid, arrival_time, burst_time[,
+                priority]) ordenado por tiempo de llegada
+        
+        Returns:
+            SimulationStream: Registros de segmentos y procesos terminados
+            a medida que ocurren, y su resumen (summary())
+        """
+        # Importación diferida: streaming importa este módulo
+        from streaming import stream_simulation
+        return stream_simulation('PRIORITY', processes, aging_interval=self.aging_interval,
+                                 preemptive=self.preemptive)
+        
     def reset(self):
         """Reinicia el scheduler."""
-        self.processes = []
+        self.processes = ProcessTable()
         self.execution_order = []
-        self.gantt_chart = []
+        self.gantt_chart = GanttChart(PRIORITY_GANTT_FIELDS)
@@ -0,0 +1,375 @@
+"""
+Tabla de procesos en columnas (struct-of-arrays).
+
+En lugar de un objeto Process con su propio __dict__ por proceso, la tabla
+guarda cada atributo en un arreglo tipado (array.array): un proceso ocupa
+8 bytes por columna más su PID. Los schedulers recorren las columnas
+directamente y ProcessRow ofrece una vista ligera de una fila con la misma
+interfaz que Process para el código que accede proceso a proceso.
+"""
+
+import hashlib
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: acelera permute() si está disponible
+    np = None
+
+
+# Columnas enteras (int64) y de punto flotante (float64) de la tabla
+INT_COLUMNS = (
+    'arrival_time',
+    'burst_time',
+    'remaining_time',
+    'completion_time',
+    'turnaround_time',
+    'waiting_time',
+    'start_time',
+    'quantum_used',
+    'priority',
+)
+FLOAT_COLUMNS = ('normalized_turnaround_time',)
+COLUMNS = INT_COLUMNS + FLOAT_COLUMNS
+
+# Columnas de entrada: definen la carga de trabajo junto con los PIDs
+INPUT_COLUMNS = ('arrival_time', 'burst_time', 'priority')
+
+# Columnas calculadas por el scheduling (se reinician antes de cada ejecución)
+RESULT_COLUMNS = (
+    'completion_time',
+    'turnaround_time',
+    'waiting_time',
+    'start_time',
+    'quantum_used',
+)
+
+
+def _typecode(name):
+    """Tipo de array.array para una columna."""
+    return 'd' if name in FLOAT_COLUMNS else 'q'
+
+
+def _int_array(values):
+    """Convierte un iterable en array('q'); los arreglos NumPy se copian en bloque."""
+    if np is not None and isinstance(values, np.ndarray):
+        column = array('q')
+        column.frombytes(values.astype(np.int64, copy=False).tobytes())
+        return column
+    return array('q', values)
+
+
+class ProcessTable:
+    """
+    Almacén de procesos compartido por FCFSScheduler, SJFScheduler y
+    RoundRobinScheduler.
+
+    Cada atributo de proceso es una columna (``table.arrival_time``,
+    ``table.burst_time``, ...) y los PIDs están en ``table.pids``; la fila i
+    de todas las columnas describe el mismo proceso. Los tiempos son enteros.
+    Un índice hash de PIDs permite comprobar ``pid in table`` en O(1).
+
+    ``revision`` cuenta los cambios que no son añadir filas al final
+    (reordenar o modificar tiempos de entrada): mientras no cambie, las filas
+    ya planificadas siguen siendo válidas y un scheduler solo tiene que
+    incorporar las añadidas.
+    """
+
+    def __init__(self):
+        self.pids = []
+        self._pid_index = set()
+        self._fingerprint = None
+        self.revision = 0
+        for name in COLUMNS:
+            setattr(self, name, array(_typecode(name)))
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __contains__(self, pid):
+        """Indica si ya existe un proceso con ese PID (O(1))."""
+        return pid in self._pid_index
+
+    def contains_any(self, pids):
+        """Indica si alguno de los PIDs ya existe (sin un bucle de Python por PID)."""
+        return bool(self._pid_index) and not self._pid_index.isdisjoint(pids)
+
+    def __iter__(self):
+        """Itera sobre vistas de fila (ProcessRow)."""
+        return (ProcessRow(self, row) for row in range(len(self.pids)))
+
+    def __getitem__(self, row):
+        """Retorna la vista de la fila indicada (admite índices negativos)."""
+        size = len(self.pids)
+        if row < 0:
+            row += size
+        if not 0 <= row < size:
+            raise IndexError('Índice de proceso fuera de rango')
+        return ProcessRow(self, row)
+
+    def append(self, pid, arrival_time, burst_time, priority=0):
+        """Añade un proceso al final de la tabla y retorna su fila."""
+        self.pids.append(pid)
+        self._pid_index.add(pid)
+        self._fingerprint = None
+        self.arrival_time.append(arrival_time)
+        self.burst_time.append(burst_time)
+        self.remaining_time.append(burst_time)
+        self.priority.append(priority)
+        for name in RESULT_COLUMNS:
+            getattr(self, name).append(0)
+        self.normalized_turnaround_time.append(0.0)
+        return len(self.pids) - 1
+
+    def extend(self, pids, arrival_times, burst_times, priorities=None):
+        """
+        Añade procesos en bloque a partir de columnas, sin crear un objeto
+        por fila.
+
+        Args:
+            pids (list): PIDs de los procesos
+            arrival_times: Iterable (o arreglo) de tiempos de llegada
+            burst_times: Iterable (o arreglo) de tiempos de ráfaga
+            priorities: Iterable (o arreglo) de prioridades (por defecto 0)
+        """
+        arrival_times = _int_array(arrival_times)
+        burst_times = _int_array(burst_times)
+        count = len(pids)
+        priorities = _int_array(priorities) if priorities is not None else array('q', bytes(8 * count))
+        if len(arrival_times) != count or len(burst_times) != count or len(priorities) != count:
+            raise ValueError('Las columnas deben tener la misma longitud')
+
+        self.pids.extend(pids)
+        self._pid_index.update(pids)
+        self._fingerprint = None
+        self.arrival_time.extend(arrival_times)
+        self.burst_time.extend(burst_times)
+        self.remaining_time.extend(burst_times)
+        self.priority.extend(priorities)
+        zeros = bytes(8 * count)
+        for name in RESULT_COLUMNS:
+            getattr(self, name).frombytes(zeros)
+        self.normalized_turnaround_time.frombytes(zeros)
+
+    def column(self, name):
+        """Retorna la columna indicada ('pid' para la lista de PIDs)."""
+        if name == 'pid':
+            return self.pids
+        if name not in COLUMNS:
+            raise KeyError(f'Columna {name} no existe')
+        return getattr(self, name)
+
+    def set_column(self, name, values):
+        """Reemplaza una columna completa (acepta iterables o arreglos NumPy)."""
+        if name not in COLUMNS:
+            raise KeyError(f'Columna {name} no existe')
+        typecode = _typecode(name)
+        if np is not None and isinstance(values, np.ndarray):
+            column = array(typecode)
+            column.frombytes(values.astype('f8' if typecode == 'd' else 'i8', copy=False).tobytes())
+        else:
+            column = array(typecode, values)
+        if len(column) != len(self.pids):
+            raise ValueError('La columna debe tener una fila por proceso')
+        setattr(self, name, column)
+        if name in INPUT_COLUMNS:
+            self._fingerprint = None
+            self.revision += 1
+
+    def reset_results(self):
+        """Reinicia las columnas calculadas para poder re-planificar."""
+        zeros = bytes(8 * len(self.pids))
+        self.remaining_time = array('q', self.burst_time)
+        for name in RESULT_COLUMNS:
+            setattr(self, name, array('q', zeros))
+        self.normalized_turnaround_time = array('d', zeros)
+
+    def sort(self, key):
+        """
+        Ordena las filas de forma estable.
+
+        Args:
+            key: Función que recibe el índice de fila y retorna la clave
+        """
+        self.permute(sorted(range(len(self.pids)), key=key))
+
+    def sort_by(self, *names):
+        """
+        Ordena de forma estable por una o más columnas (p. ej. 'arrival_time', 'pid').
+
+        Como la ordenación es estable, ordena por la última columna y luego
+        por cada una de las anteriores, siempre con claves de acceso directo
+        (sin construir una tupla por fila).
+        """
+        order = list(range(len(self.pids)))
+        for name in reversed(names):
+            order.sort(key=self.column(name).__getitem__)
+        self.permute(order)
+
+    def permute(self, order):
+        """
+        Reordena todas las columnas: la nueva fila i es la antigua order[i].
+
+        Si la tabla ya está en ese orden (p. ej. al re-planificar) no copia
+        nada y conserva la huella calculada.
+        """
+        if np is not None and len(order) > 1024:
+            index = np.asarray(order, dtype=np.int64)
+            if np.array_equal(index, np.arange(len(index))):
+                return
+            self._fingerprint = None
+            self.revision += 1
+            for name in COLUMNS:
+                typecode = _typecode(name)
+                values = np.frombuffer(getattr(self, name), dtype='f8' if typecode == 'd' else 'i8')
+                column = array(typecode)
+                column.frombytes(values[index].tobytes())
+                setattr(self, name, column)
+            pids = self.pids
+            self.pids = [pids[row] for row in index.tolist()]
+            return
+
+        if list(order) == list(range(len(self.pids))):
+            return
+        self._fingerprint = None
+        self.revision += 1
+        for name in COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, array(_typecode(name), map(column.__getitem__, order)))
+        self.pids = list(map(self.pids.__getitem__, order))
+
+    def permute_tail(self, start, order):
+        """
+        Reordena solo las filas desde start (O(filas reordenadas)): la nueva
+        fila start + i es la antigua order[i], con order una permutación de
+        range(start, len(table)).
+        """
+        order = list(order)
+        if order == list(range(start, len(self.pids))):
+            return
+        self._fingerprint = None
+        self.revision += 1
+
+        # Tramos de filas consecutivas: al insertar pocas filas en un orden
+        # existente el sufijo se copia por rebanadas en lugar de fila a fila
+        runs = []
+        run_start = previous = order[0]
+        for row in order[1:]:
+            if row != previous + 1:
+                runs.append((run_start, previous + 1))
+                run_start = row
+            previous = row
+        runs.append((run_start, previous + 1))
+
+        for name in COLUMNS:
+            column = getattr(self, name)
+            tail = array(_typecode(name))
+            for first, last in runs:
+                tail += column[first:last]
+            column[start:] = tail
+        pids = self.pids
+        pids[start:] = [pid for first, last in runs for pid in pids[first:last]]
+
+    def fingerprint(self):
+        """
+        Huella (hash BLAKE2b) de la carga de trabajo: PIDs, tiempos de
+        llegada y ráfagas en el orden actual de las filas.
+
+        Se calcula una vez y se conserva hasta que cambian los procesos o su
+        orden, así que consultarla repetidamente es O(1).
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(len(self.pids).to_bytes(8, 'little'))
+            digest.update('\0'.join(map(str, self.pids)).encode('utf-8', 'surrogatepass'))
+            for name in INPUT_COLUMNS:
+                digest.update(getattr(self, name).tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def row_dict(self, row):
+        """Convierte una fila a diccionario para JSON (mismo formato que Process.to_dict)."""
+        return {
+            'pid': self.pids[row],
+            'arrival_time': self.arrival_time[row],
+            'burst_time': self.burst_time[row],
+            'completion_time': self.completion_time[row],
+            'turnaround_time': self.turnaround_time[row],
+            'waiting_time': self.waiting_time[row],
+            'start_time': self.start_time[row],
+            'quantum_used': self.quantum_used[row],
+            'priority': self.priority[row],
+            # 0 (entero) cuando el algoritmo no calcula NTAT
+            'normalized_turnaround_time': self.normalized_turnaround_time[row] or 0
+        }
+
+    def to_dicts(self):
+        """Convierte toda la tabla a una lista de diccionarios."""
+        return [self.row_dict(row) for row in range(len(self.pids))]
+
+    def nbytes(self):
+        """Memoria aproximada de las columnas numéricas (sin contar los PIDs)."""
+        return sum(getattr(self, name).itemsize * len(self.pids) for name in COLUMNS)
+
+
+def _column_property(name):
+    """Propiedad de ProcessRow que lee/escribe la columna de la tabla."""
+    def getter(self):
+        return getattr(self._table, name)[self._row]
+
+    def setter(self, value):
+        getattr(self._table, name)[self._row] = value
+        if name in INPUT_COLUMNS:
+            self._table._fingerprint = None
+            self._table.revision += 1
+
+    return property(getter, setter)
+
+
+class ProcessRow:
+    """
+    Vista ligera de una fila de ProcessTable con la interfaz de Process.
+
+    No copia datos: leer o asignar ``row.waiting_time`` accede directamente
+    a la columna de la tabla.
+    """
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def pid(self):
+        return self._table.pids[self._row]
+
+    def calculate_times(self, completion_time):
+        """Calcula los tiempos CT, TT y WT del proceso."""
+        self.completion_time = completion_time
+        self.turnaround_time = completion_time - self.arrival_time
+        self.waiting_time = self.turnaround_time - self.burst_time
+
+    def calculate_times_sjf(self, completion_time):
+        """Calcula los tiempos para SJF donde TT = CT."""
+        self.completion_time = completion_time
+        self.turnaround_time = completion_time
+        self.waiting_time = self.turnaround_time - self.burst_time
+
+    def calculate_times_rr(self, completion_time):
+        """Calcula los tiempos para Round Robin (incluye NTAT = TAT/BT)."""
+        self.calculate_times(completion_time)
+        burst_time = self.burst_time
+        self.normalized_turnaround_time = round(self.turnaround_time / burst_time, 2) if burst_time > 0 else 0
+
+    def to_dict(self):
+        """Convierte el proceso a diccionario para JSON."""
+        return self._table.row_dict(self._row)
+
+    def __repr__(self):
+        return f'ProcessRow(pid={self.pid!r}, arrival_time={self.arrival_time}, burst_time={self.burst_time})'
+
+
+for _name in COLUMNS:
+    setattr(ProcessRow, _name, _column_property(_name))
+del _name
@@ -0,0 +1,222 @@
+"""
+Perfilado por fases y métricas en formato Prometheus.
+
+Los schedulers marcan el final de cada fase de una ejecución con mark()
+('sort', 'simulate', 'to_dict', 'statistics', 'analysis'...): el tiempo
+transcurrido desde la marca anterior se atribuye a esa fase. Fuera de un
+bloque profiled() mark() no hace nada más que consultar una variable
+local del hilo, así que las marcas pueden quedarse en el camino crítico.
+
+Con memory=True se mide además el pico de memoria reservada en cada fase
+con tracemalloc. tracemalloc es global al proceso y ralentiza todas las
+reservas, por eso es opcional y los perfilados de memoria se serializan
+entre sí; con otras peticiones en paralelo el pico incluye también sus
+reservas.
+
+MetricsRegistry reúne histogramas y métricas calculadas al exportar y las
+exporta en el formato de texto de Prometheus (endpoint /metrics).
+"""
+
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+
+
+# Límites superiores (segundos) de los histogramas de duración
+PHASE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Límites superiores (bytes) de los histogramas de memoria
+MEMORY_BUCKETS = tuple(2 ** exponent for exponent in range(10, 33, 2))
+
+_active = threading.local()
+
+# Un solo perfilado de memoria a la vez (tracemalloc es global)
+_memory_lock = threading.Lock()
+
+
+class Profiler:
+    """
+    Tiempos (y opcionalmente picos de memoria) de las fases de una ejecución.
+
+    Las fases son consecutivas, no anidadas: cada mark() cierra la fase que
+    empezó en la marca anterior. Si una fase se marca varias veces sus
+    tiempos se suman.
+    """
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.phases = {}
+        self._started = self._last = time.perf_counter()
+
+    def mark(self, phase):
+        """Cierra la fase en curso con el nombre indicado."""
+        now = time.perf_counter()
+        entry = self.phases.get(phase)
+        if entry is None:
+            entry = self.phases[phase] = {'seconds': 0.0, 'peak_bytes': 0 if self.memory else None}
+        entry['seconds'] += now - self._last
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            entry['peak_bytes'] = max(entry['peak_bytes'], peak - self._memory_base)
+            tracemalloc.reset_peak()
+            self._memory_base = current
+        self._last = time.perf_counter()
+
+    @property
+    def total_seconds(self):
+        return self._last - self._started
+
+    def to_dict(self):
+        """Perfil para la respuesta: milisegundos (y bytes) por fase."""
+        phases = []
+        for phase, entry in self.phases.items():
+            data = {'phase': phase, 'wall_ms': round(entry['seconds'] * 1000, 3)}
+            if entry['peak_bytes'] is not None:
+                data['peak_bytes'] = entry['peak_bytes']
+            phases.append(data)
+        return {'total_ms': round(self.total_seconds * 1000, 3), 'memory': self.memory, 'phases': phases}
+
+
+@contextmanager
+def profiled(memory=False):
+    """
+    Activa un Profiler para el hilo actual durante el bloque.
+
+    Yields:
+        Profiler: El perfil en construcción (con las marcas del bloque)
+    """
+    previous = getattr(_active, 'profiler', None)
+    if not memory:
+        profiler = Profiler()
+        _active.profiler = profiler
+        try:
+            yield profiler
+        finally:
+            _active.profiler = previous
+        return
+
+    with _memory_lock:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        profiler = Profiler(memory=True)
+        profiler._memory_base = tracemalloc.get_traced_memory()[0]
+        _active.profiler = profiler
+        try:
+            yield profiler
+        finally:
+            _active.profiler = previous
+            if started_tracing:
+                tracemalloc.stop()
+
+
+def mark(phase):
+    """Cierra una fase del perfil activo en este hilo (no hace nada si no hay)."""
+    profiler = getattr(_active, 'profiler', None)
+    if profiler is not None:
+        profiler.mark(phase)
+
+
+def _format_labels(names, values, extra=''):
+    labels = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        labels.append(extra)
+    return '{' + ','.join(labels) + '}' if labels else ''
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Histograma acumulado por combinación de etiquetas (como en Prometheus)."""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=PHASE_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        """Registra una observación con los valores de etiqueta indicados."""
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            # Cada observación cuenta en su cubeta; la exportación acumula
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def samples(self):
+        """Líneas de texto de las series del histograma."""
+        with self._lock:
+            series = sorted((labels, [list(counts), total, count])
+                            for labels, (counts, total, count) in self._series.items())
+        lines = []
+        for label_values, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_number(bound)}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labels, label_values, le)} {cumulative}')
+            labels = _format_labels(self.labels, label_values)
+            lines.append(f'{self.name}_sum{labels} {_format_number(total)}')
+            lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class Callback:
+    """Métrica cuyo valor se lee al exportar (tamaño de la caché, sesiones...)."""
+
+    def __init__(self, name, documentation, kind, function):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.function = function
+
+    def samples(self):
+        return [f'{self.name} {_format_number(self.function())}']
+
+
+class MetricsRegistry:
+    """Conjunto de métricas exportables en el formato de texto de Prometheus."""
+
+    def __init__(self):
+        self._metrics = []
+
+    def histogram(self, name, documentation, labels=(), buckets=PHASE_BUCKETS):
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def callback(self, name, documentation, function, kind='gauge'):
+        """Registra una métrica calculada al exportar ('gauge' o 'counter')."""
+        return self._register(Callback(name, documentation, kind, function))
+
+    def _register(self, metric):
+        if any(existing.name == metric.name for existing in self._metrics):
+            raise ValueError(f'La métrica {metric.name} ya está registrada.')
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """Exportación completa en el formato de texto de Prometheus."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
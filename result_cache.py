@@ -0,0 +1,113 @@
+"""
+Caché de resultados de scheduling.
+
+Los resultados de get_results() dependen solo del algoritmo, del quantum y
+de la carga de trabajo, así que se memorizan con la clave
+(algoritmo, quantum, huella de la tabla de procesos). La caché es LRU y
+está acotada tanto en número de entradas como en tamaño total (procesos
+más segmentos de Gantt de todos los resultados guardados). Es compartida
+por todas las sesiones: dos usuarios con la misma carga comparten entrada.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+# Máximo de resultados guardados
+MAX_ENTRIES = 256
+
+# Máximo de filas (procesos + segmentos de Gantt) sumando todas las entradas
+MAX_ROWS = 2_000_000
+
+
+def schedule_key(algorithm, quantum, table, smp=None):
+    """
+    Clave de caché de una ejecución.
+
+    Args:
+        algorithm (str): Algoritmo ('FCFS', 'SJF', 'RR', ...)
+        quantum (int): Quantum de Round Robin (se ignora en los demás)
+        table (ProcessTable): Procesos a planificar
+        smp (tuple): Opciones del modo multiprocesador, o None
+    """
+    return (algorithm, quantum if algorithm == 'RR' else None, smp, table.fingerprint())
+
+
+def result_rows(results):
+    """Tamaño de un resultado de get_results() para la cota de memoria."""
+    return len(results.get('processes', ())) + len(results.get('gantt_chart', ()))
+
+
+class ResultCache:
+    """
+    Caché LRU de resultados de scheduling con contadores de aciertos y
+    fallos. Es segura entre hilos.
+
+    Los valores guardados se comparten entre peticiones: quien los obtenga
+    con get() no debe modificarlos.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_rows=MAX_ROWS):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._rows = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Retorna el resultado guardado para la clave, o None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, rows):
+        """
+        Guarda un valor, descartando los menos usados si hace falta.
+
+        Args:
+            key: Clave (ver schedule_key())
+            value: Valor a guardar (p. ej. la respuesta JSON serializada)
+            rows (int): Tamaño del valor en filas (ver result_rows())
+        """
+        if rows > self.max_rows:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._rows -= previous[1]
+            self._entries[key] = (value, rows)
+            self._rows += rows
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                _, (_, evicted_rows) = self._entries.popitem(last=False)
+                self._rows -= evicted_rows
+                self.evictions += 1
+
+    def clear(self):
+        """Vacía la caché (los contadores se conservan)."""
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+
+    def stats(self):
+        """Contadores de la caché."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'rows': self._rows,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0
+            }
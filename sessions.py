@@ -0,0 +1,170 @@
+"""
+Registro de sesiones de simulación.
+
+Cada usuario (identificado por una cookie) tiene su propio scheduler,
+algoritmo y quantum, en lugar de las variables globales compartidas. El
+registro protege su diccionario con un lock y cada sesión tiene el suyo,
+de modo que peticiones de usuarios distintos se ejecutan en paralelo bajo
+un servidor con hilos y las de un mismo usuario se serializan. Las
+sesiones inactivas se descartan pasado idle_timeout, y si se supera
+max_sessions se descarta la usada hace más tiempo.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from process import SchedulerFactory
+
+
+# Algoritmo y quantum con los que empieza cada sesión
+DEFAULT_ALGORITHM = 'FCFS'
+DEFAULT_QUANTUM = 3
+
+# Segundos sin actividad tras los que se descarta una sesión
+IDLE_TIMEOUT = 30 * 60
+
+# Máximo de sesiones simultáneas en memoria
+MAX_SESSIONS = 1000
+
+# Intervalo mínimo (segundos) entre barridos de sesiones inactivas
+EVICTION_INTERVAL = 60
+
+
+class SimulationSession:
+    """
+    Estado de simulación de un usuario.
+
+    Las operaciones sobre el scheduler deben hacerse dentro de
+    ``with session.lock:``.
+    """
+
+    def __init__(self, session_id, algorithm=DEFAULT_ALGORITHM, quantum=DEFAULT_QUANTUM):
+        self.session_id = session_id
+        self.algorithm = algorithm
+        self.quantum = quantum
+        # Modo multiprocesador (1 núcleo = simulación clásica)
+        self.cores = 1
+        self.balancing = 'least_loaded'
+        self.work_stealing = True
+        self.scheduler = None
+        # Clave (ver result_cache.schedule_key) de la carga con la que se
+        # ejecutó por última vez scheduler.schedule(), o None
+        self.scheduled_key = None
+        self.lock = threading.RLock()
+        self.last_access = time.monotonic()
+
+    def new_scheduler(self):
+        """Crea un scheduler vacío con el algoritmo y las opciones de la sesión."""
+        if self.cores > 1:
+            return SchedulerFactory.create_scheduler(
+                self.algorithm, quantum=self.quantum, cores=self.cores,
+                balancing=self.balancing, work_stealing=self.work_stealing)
+        if self.algorithm == 'RR':
+            return SchedulerFactory.create_scheduler(self.algorithm, quantum=self.quantum)
+        return SchedulerFactory.create_scheduler(self.algorithm)
+
+    def get_scheduler(self):
+        """Retorna el scheduler de la sesión, creándolo si no existe."""
+        if self.scheduler is None:
+            self.scheduler = self.new_scheduler()
+        return self.scheduler
+
+    def snapshot_scheduler(self):
+        """
+        Copia del scheduler con la carga actual, para planificarla fuera del
+        lock de la sesión (trabajos en segundo plano). Retorna None si no hay
+        procesos.
+        """
+        if self.scheduler is None or not self.scheduler.processes:
+            return None
+        table = self.scheduler.processes
+        scheduler = self.new_scheduler()
+        scheduler.add_processes(table.pids, table.arrival_time, table.burst_time, table.priority)
+        return scheduler
+
+    def smp_options(self):
+        """(núcleos, balanceo, work stealing) en modo multiprocesador, o None."""
+        if self.cores > 1:
+            return (self.cores, self.balancing, self.work_stealing)
+        return None
+
+    def reset(self):
+        """Descarta el scheduler (y sus procesos)."""
+        if self.scheduler:
+            self.scheduler.reset()
+        self.scheduler = None
+        self.scheduled_key = None
+
+
+class SessionRegistry:
+    """
+    Sesiones de simulación indexadas por ID, en orden de último acceso.
+
+    Es seguro usarlo desde varios hilos: get() y los barridos de expiración
+    se ejecutan bajo el lock del registro, que solo protege el diccionario
+    (nunca se mantiene mientras se ejecuta un scheduling).
+    """
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT, max_sessions=MAX_SESSIONS):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_eviction = time.monotonic()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def get(self, session_id=None):
+        """
+        Retorna la sesión indicada y actualiza su último acceso.
+
+        Si el ID no existe (o expiró) se crea una sesión nueva con un ID
+        aleatorio; nunca se adopta el ID enviado por el cliente, así que una
+        cookie inventada no permite fijar ni adivinar sesiones ajenas.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_eviction >= EVICTION_INTERVAL:
+                self._evict_idle(now)
+
+            session = self._sessions.get(session_id) if session_id else None
+            if session is not None and now - session.last_access > self.idle_timeout:
+                del self._sessions[session_id]
+                session = None
+
+            if session is None:
+                session = SimulationSession(secrets.token_urlsafe(16))
+                self._sessions[session.session_id] = session
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session_id)
+
+            session.last_access = now
+            return session
+
+    def remove(self, session_id):
+        """Elimina una sesión (no falla si no existe)."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def evict_idle(self):
+        """Descarta las sesiones inactivas y retorna cuántas se eliminaron."""
+        with self._lock:
+            return self._evict_idle(time.monotonic())
+
+    def _evict_idle(self, now):
+        # Las sesiones están en orden de último acceso: basta con recorrer
+        # desde la más antigua hasta la primera que sigue activa
+        evicted = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_access <= self.idle_timeout:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+        self._last_eviction = now
+        return evicted
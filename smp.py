@@ -0,0 +1,410 @@
+"""
+Simulación multiprocesador (SMP).
+
+SMPScheduler simula FCFS, SJF o Round Robin sobre varios núcleos. Cada
+núcleo tiene su propia cola de listos (run queue) y aplica el algoritmo
+localmente; las llegadas se reparten entre núcleos con una política de
+balanceo de carga y, con work stealing, un núcleo sin trabajo toma un
+proceso de la cola más cargada. La simulación es por eventos (llegadas y
+fin de ráfaga o de quantum en cada núcleo), con un heap de eventos.
+
+Con un solo núcleo FCFS y Round Robin dan los mismos tiempos que
+FCFSScheduler y RoundRobinScheduler. SJF se aplica aquí respetando el
+tiempo de llegada (no preemptivo, TT = CT - AT), porque con colas por
+núcleo un proceso no puede ejecutarse antes de llegar.
+"""
+
+import heapq
+from array import array
+from collections import deque
+
+from gantt import GanttChart
+from jobs import CHECKPOINT_INTERVAL, checkpoint
+from process import RR_GANTT_FIELDS, RR_STATISTICS_METRICS, STATISTICS_METRICS, build_results
+from process_table import ProcessTable
+from profiling import mark
+from statistics_engine import compute_statistics
+
+
+# Algoritmos con modo multiprocesador
+SMP_ALGORITHMS = ('FCFS', 'SJF', 'RR')
+
+# Políticas de reparto de las llegadas entre núcleos:
+# - least_loaded: núcleo con menos trabajo pendiente (cola + ejecución)
+# - shortest_queue: núcleo con menos procesos en cola
+# - round_robin: reparto cíclico, sin mirar la carga
+BALANCING_POLICIES = ('least_loaded', 'shortest_queue', 'round_robin')
+
+# Máximo de núcleos simulados
+MAX_CORES = 1024
+
+
+class SMPScheduler:
+    """
+    Planificador multiprocesador con una cola de listos por núcleo.
+
+    Después de schedule(), ``gantt_charts`` tiene un diagrama por núcleo,
+    ``core_of[fila]`` el núcleo donde terminó cada proceso y ``core_stats``
+    la utilización y el retardo en cola de cada núcleo.
+    """
+
+    def __init__(self, algorithm='FCFS', cores=2, quantum=4, balancing='least_loaded', work_stealing=True):
+        """
+        Args:
+            algorithm (str): 'FCFS', 'SJF' o 'RR' (política de cada núcleo)
+            cores (int): Número de núcleos
+            quantum (int): Quantum de Round Robin
+            balancing (str): Política de reparto (ver BALANCING_POLICIES)
+            work_stealing (bool): Si un núcleo ocioso toma procesos de la
+                cola más cargada
+        """
+        algorithm = algorithm.upper()
+        if algorithm not in SMP_ALGORITHMS:
+            raise ValueError(f"Algoritmo {algorithm} no soportado en modo SMP. Algoritmos disponibles: {', '.join(SMP_ALGORITHMS)}")
+        if balancing not in BALANCING_POLICIES:
+            raise ValueError(f"Política de balanceo {balancing} no soportada. Políticas disponibles: {', '.join(BALANCING_POLICIES)}")
+        if not isinstance(cores, int) or not 1 <= cores <= MAX_CORES:
+            raise ValueError(f'El número de núcleos debe ser un entero entre 1 y {MAX_CORES}.')
+
+        self.algorithm = algorithm
+        self.cores = cores
+        self.quantum = quantum if quantum and quantum > 0 else 4
+        self.balancing = balancing
+        self.work_stealing = work_stealing
+        self.processes = ProcessTable()
+        self.execution_order = []
+        self.gantt_charts = [self._new_gantt() for _ in range(cores)]
+        self.core_of = array('q')
+        self.core_stats = []
+
+    def _new_gantt(self):
+        return GanttChart(RR_GANTT_FIELDS if self.algorithm == 'RR' else ())
+
+    def add_process(self, pid, arrival_time, burst_time, priority=0):
+        """Añade un proceso a la tabla de procesos."""
+        self.processes.append(pid, arrival_time, burst_time, priority)
+
+    def add_processes(self, pids, arrival_times, burst_times, priorities=None):
+        """Añade procesos en bloque (columnas) sin crear un objeto por fila."""
+        self.processes.extend(pids, arrival_times, burst_times, priorities)
+
+    def schedule(self):
+        """Ejecuta la simulación multiprocesador y calcula todos los tiempos."""
+        if not self.processes:
+            return
+
+        table = self.processes
+        # Mismo orden que los schedulers de un núcleo (FCFS desempata por
+        # orden de inserción, RR por PID)
+        if self.algorithm == 'FCFS':
+            table.sort_by('arrival_time')
+        else:
+            table.sort_by('arrival_time', 'pid')
+        table.reset_results()
+        mark('sort')
+
+        total_processes = len(table)
+        cores = self.cores
+        is_rr = self.algorithm == 'RR'
+        is_sjf = self.algorithm == 'SJF'
+        quantum = self.quantum
+        balancing = self.balancing
+        work_stealing = self.work_stealing
+
+        pids = table.pids
+        arrival_times = table.arrival_time
+        burst_times = table.burst_time
+        remaining_times = table.remaining_time
+        start_times = table.start_time
+        completion_times = table.completion_time
+        turnaround_times = table.turnaround_time
+        waiting_times = table.waiting_time
+        quantum_used = table.quantum_used
+        normalized_turnaround_times = table.normalized_turnaround_time
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        gantt_charts = [self._new_gantt() for _ in range(cores)]
+        core_of = array('q', bytes(8 * total_processes))
+        started = bytearray(total_processes)
+
+        # Colas por núcleo: deque (FCFS/RR) o, para SJF, un heap de mínimos
+        # con el rango de cada fila en el orden (BT, PID) y, con work
+        # stealing, otro de máximos (rangos negados) para robar en O(log n)
+        # el proceso que la víctima ejecutaría más tarde. Las entradas de un
+        # heap cuyo proceso ya salió por el otro se descartan al encontrarlas
+        # (taken), así que la longitud de cada cola se lleva en queue_lengths
+        queues = [[] if is_sjf else deque() for _ in range(cores)]
+        queue_lengths = [0] * cores
+        if is_sjf:
+            row_of_rank = sorted(range(total_processes), key=lambda row: (burst_times[row], pids[row]))
+            rank_of = array('q', bytes(8 * total_processes))
+            for rank, row in enumerate(row_of_rank):
+                rank_of[row] = rank
+            longest = [[] for _ in range(cores)] if work_stealing else None
+            taken = bytearray(total_processes)
+        queued_work = [0] * cores
+        queued_count = 0
+        running = [-1] * cores
+        busy_until = [0] * cores
+        lane_end = [0] * cores
+        idle_cores = set(range(cores))
+        next_core = 0
+
+        # Métricas por núcleo
+        busy_time = [0] * cores
+        dispatched = [0] * cores
+        queueing_delay = [0] * cores
+        max_queueing_delay = [0] * cores
+        steals = [0] * cores
+
+        # Heap de eventos: (instante en que termina la ráfaga o el quantum, núcleo)
+        events = []
+        process_index = 0
+
+        def enqueue(core, row):
+            queued_work[core] += remaining_times[row]
+            queue_lengths[core] += 1
+            if is_sjf:
+                heappush(queues[core], rank_of[row])
+                if work_stealing:
+                    heappush(longest[core], -rank_of[row])
+            else:
+                queues[core].append(row)
+
+        def dequeue(core, last):
+            # Primero de la cola (o el último si last, al robar)
+            queue_lengths[core] -= 1
+            if not is_sjf:
+                return queues[core].pop() if last else queues[core].popleft()
+            if last:
+                heap, sign = longest[core], -1
+            else:
+                heap, sign = queues[core], 1
+            row = row_of_rank[sign * heappop(heap)]
+            while taken[row]:
+                row = row_of_rank[sign * heappop(heap)]
+            taken[row] = 1
+            return row
+
+        def choose_core(now):
+            # Los empates se resuelven empezando por un núcleo distinto en
+            # cada llegada, para no cargar siempre los primeros núcleos
+            nonlocal next_core
+            first = next_core
+            next_core = (next_core + 1) % cores
+            if balancing == 'round_robin':
+                return first
+            best_core, best_load = first, None
+            for offset in range(cores):
+                core = (first + offset) % cores
+                row = running[core]
+                if balancing == 'shortest_queue':
+                    load = queue_lengths[core] + (row >= 0)
+                else:
+                    # least_loaded: trabajo en cola + lo que le queda al proceso en ejecución
+                    load = queued_work[core]
+                    if row >= 0:
+                        load += busy_until[core] - now + remaining_times[row]
+                if best_load is None or load < best_load:
+                    best_core, best_load = core, load
+                    if load == 0:
+                        break
+            return best_core
+
+        def dispatch(core, row, now):
+            if not started[row]:
+                started[row] = 1
+                start_times[row] = now
+                delay = now - arrival_times[row]
+                dispatched[core] += 1
+                queueing_delay[core] += delay
+                if delay > max_queueing_delay[core]:
+                    max_queueing_delay[core] = delay
+
+            remaining_time = remaining_times[row]
+            execution_time = min(quantum, remaining_time) if is_rr else remaining_time
+            remaining_time -= execution_time
+            remaining_times[row] = remaining_time
+            end = now + execution_time
+
+            gantt = gantt_charts[core]
+            if lane_end[core] < now:
+                gantt.add_idle(lane_end[core], now)
+            if is_rr:
+                quantum_used[row] += 1
+                gantt.add_process(pids[row], now, end, quantum_used[row], remaining_time)
+            else:
+                gantt.add_process(pids[row], now, end)
+            lane_end[core] = end
+
+            busy_time[core] += execution_time
+            core_of[row] = core
+            running[core] = row
+            busy_until[core] = end
+            idle_cores.discard(core)
+            heappush(events, (end, core))
+
+        steps = 0  # Iteraciones, para los puntos de control (jobs.checkpoint)
+        while process_index < total_processes or events:
+            steps += 1
+            if not steps % CHECKPOINT_INTERVAL:
+                checkpoint()
+            next_event = events[0][0] if events else None
+            if process_index < total_processes and (next_event is None or arrival_times[process_index] < next_event):
+                current_time = arrival_times[process_index]
+            else:
+                current_time = next_event
+
+            # 1. Fin de ráfagas/quantums en este instante
+            preempted = []
+            while events and events[0][0] == current_time:
+                _, core = heappop(events)
+                row = running[core]
+                running[core] = -1
+                idle_cores.add(core)
+                if remaining_times[row] == 0:
+                    turnaround_time = current_time - arrival_times[row]
+                    burst_time = burst_times[row]
+                    completion_times[row] = current_time
+                    turnaround_times[row] = turnaround_time
+                    waiting_times[row] = turnaround_time - burst_time
+                    if is_rr:
+                        normalized_turnaround_times[row] = round(turnaround_time / burst_time, 2) if burst_time > 0 else 0
+                else:
+                    preempted.append((core, row))
+
+            # 2. Llegadas (entran a la cola antes que los procesos expulsados)
+            while process_index < total_processes and arrival_times[process_index] <= current_time:
+                enqueue(choose_core(current_time), process_index)
+                queued_count += 1
+                process_index += 1
+
+            # 3. Round Robin: el proceso expulsado vuelve al final de su cola
+            for core, row in preempted:
+                enqueue(core, row)
+                queued_count += 1
+
+            # 4. Los núcleos libres toman trabajo de su propia cola y, después,
+            # los que siguen libres roban de la cola más cargada (en dos pasadas,
+            # para no robar un proceso que su núcleo, libre, iba a ejecutar ya)
+            if queued_count:
+                for core in sorted(idle_cores):
+                    if queue_lengths[core]:
+                        row = dequeue(core, last=False)
+                        queued_work[core] -= remaining_times[row]
+                        queued_count -= 1
+                        dispatch(core, row, current_time)
+
+            if work_stealing and queued_count and idle_cores:
+                for core in sorted(idle_cores):
+                    victim = max(range(cores), key=lambda c: (queue_lengths[c], -c))
+                    # Se roba el proceso que la víctima ejecutaría más tarde
+                    row = dequeue(victim, last=True)
+                    queued_work[victim] -= remaining_times[row]
+                    queued_count -= 1
+                    steals[core] += 1
+                    dispatch(core, row, current_time)
+                    if not queued_count:
+                        break
+
+        makespan = max(lane_end)
+        self.gantt_charts = gantt_charts
+        self.core_of = core_of
+        self.core_stats = [
+            {
+                'core': core,
+                'busy_time': busy_time[core],
+                'utilization': round(busy_time[core] / makespan, 4) if makespan else 0,
+                'processes_started': dispatched[core],
+                'average_queueing_delay': round(queueing_delay[core] / dispatched[core], 2) if dispatched[core] else 0,
+                'max_queueing_delay': max_queueing_delay[core],
+                'steals': steals[core]
+            }
+            for core in range(cores)
+        ]
+        mark('simulate')
+        self.execution_order = table
+
+    def gantt_to_list(self):
+        """Segmentos de todos los núcleos (núcleo a núcleo), cada uno con su 'core'."""
+        segments = []
+        for core, gantt in enumerate(self.gantt_charts):
+            for segment in gantt.to_list():
+                segment['core'] = core
+                segments.append(segment)
+        return segments
+
+    def get_results(self, fields=None):
+        """
+        Retorna los resultados del scheduling, con un carril de Gantt por núcleo.
+
+        Args:
+            fields: Secciones a calcular (ver process.parse_fields); por defecto todas
+        """
+        config = {'core_count': self.cores, 'cores': self.core_stats}
+        if self.algorithm == 'RR':
+            config['quantum'] = self.quantum
+        return build_results({
+            'processes': lambda: {'processes': self.process_dicts()},
+            'gantt_chart': lambda: {'gantt_chart': self.gantt_to_list()},
+            'averages': lambda: {
+                'average_waiting_time': self.calculate_average_waiting_time(),
+                'average_turnaround_time': self.calculate_average_turnaround_time()
+            },
+            'statistics': lambda: {'statistics': self.calculate_statistics()},
+            'analysis': lambda: {'algorithm_analysis': self.analyze_smp()}
+        }, fields, **config)
+
+    def process_dicts(self):
+        """Procesos como diccionarios, con el núcleo asignado a cada uno."""
+        processes = self.processes.to_dicts()
+        for process, core in zip(processes, self.core_of):
+            process['core'] = core
+        return processes
+
+    def calculate_average_waiting_time(self):
+        """Calcula el tiempo promedio de espera."""
+        if not self.processes:
+            return 0
+        total_waiting_time = sum(self.processes.waiting_time)
+        return total_waiting_time / len(self.processes)
+
+    def calculate_average_turnaround_time(self):
+        """Calcula el tiempo promedio de turnaround."""
+        if not self.processes:
+            return 0
+        total_turnaround_time = sum(self.processes.turnaround_time)
+        return total_turnaround_time / len(self.processes)
+
+    def analyze_smp(self):
+        """Analiza el reparto de carga entre núcleos."""
+        if not self.processes or not self.core_stats:
+            return "No hay procesos para analizar."
+
+        utilizations = [stats['utilization'] for stats in self.core_stats]
+        analysis = [f"{self.algorithm} en {self.cores} núcleo(s), balanceo {self.balancing}"]
+        analysis.append(f"Utilización media: {round(100 * sum(utilizations) / len(utilizations), 1)}%")
+        analysis.append(f"Desbalance (máx - mín): {round(100 * (max(utilizations) - min(utilizations)), 1)}%")
+        if self.work_stealing:
+            analysis.append(f"Robos de trabajo: {sum(stats['steals'] for stats in self.core_stats)}")
+        return " | ".join(analysis)
+
+    def calculate_statistics(self):
+        """
+        Calcula estadísticas completas en una sola pasada (ver statistics_engine).
+
+        Returns:
+            dict: Media, desviación estándar, mínimo y máximo de cada métrica,
+            más p50/p95/p99 de los tiempos de espera y de turnaround
+        """
+        metrics = RR_STATISTICS_METRICS if self.algorithm == 'RR' else STATISTICS_METRICS
+        return compute_statistics(self.processes, metrics)
+
+    def reset(self):
+        """Reinicia el scheduler."""
+        self.processes = ProcessTable()
+        self.execution_order = []
+        self.gantt_charts = [self._new_gantt() for _ in range(self.cores)]
+        self.core_of = array('q')
+        self.core_stats = []
@@ -69,7 +69,8 @@ async function addProcess(event) {
     const processData = {
         pid: formData.get('pid').trim(),
         arrival_time: formData.get('arrival_time'),
-        burst_time: formData.get('burst_time')
+        burst_time: formData.get('burst_time'),
+        priority: formData.get('priority') || 0
     };
     
     try {
@@ -235,6 +236,12 @@ function showAlgorithmDifferences(algorithm) {
     } else if (algorithm === 'RR') {
         message = `🔄 Cambiado a Round Robin: Los procesos se ejecutarán en turnos de <strong>${currentQuantum} unidades de tiempo</strong>. 
                    Es preemptivo y equitativo, pero genera cambios de contexto. Puedes ajustar el quantum según necesites.`;
+    } else if (algorithm === 'SRTF') {
+        message = `🔄 Cambiado a SRTF: Siempre ejecuta el proceso con <strong>menor tiempo restante</strong>; 
+                   una llegada más corta expulsa al proceso en ejecución.`;
+    } else if (algorithm === 'PRIORITY') {
+        message = `🔄 Cambiado a Prioridades: Se ejecuta el proceso con <strong>menor número de prioridad</strong>. 
+                   Con aging, los procesos en espera ganan prioridad con el tiempo y no sufren starvation.`;
     }
     
     if (message) {
@@ -277,7 +284,7 @@ function updateProcessList() {
         const processHtml = processes.map(p => `
             <div class="process-item">
                 <span class="process-id">${p.pid}</span>
-                <span class="process-details">AT: ${p.arrival_time}, BT: ${p.burst_time}</span>
+                <span class="process-details">AT: ${p.arrival_time}, BT: ${p.burst_time}${p.priority ? `, P: ${p.priority}` : ''}</span>
             </div>
         `).join('');
         
@@ -321,6 +328,10 @@ function displayResults(results) {
         showFCFSAnalysis(results);
     } else if (currentAlgorithm === 'RR') {
         showRRAnalysis(results);
+    } else if (results.algorithm_analysis) {
+        setTimeout(() => {
+            showMessage(`📊 ${currentAlgorithm}: ${results.algorithm_analysis}`, 'info');
+        }, 1000);
     }
     
     // Scroll a resultados
@@ -402,145 +413,349 @@ function displayResultsTable(processes) {
     });
 }
 
+// Estado del diagrama de Gantt. El diagrama se dibuja en un canvas y solo
+// se pide al servidor la ventana visible, ya agregada al ancho del canvas
+// (/gantt?width=...), así que el costo no depende del número de segmentos.
+const GANTT_ARRIVAL_BAND = 25;   // Alto de la franja de llegadas (px)
+const GANTT_LANE_HEIGHT = 60;    // Alto de un carril (px)
+const GANTT_CORE_LANE_HEIGHT = 36;
+const GANTT_CORE_GUTTER = 48;    // Margen izquierdo con el nombre del núcleo
+const GANTT_SPAN_COLORS = { busy: '#2c3e50', mixed: '#5d6d7e', idle: '#95a5a6' };
+
+const ganttView = {
+    canvas: null,
+    chartStart: 0,
+    chartEnd: 0,
+    start: 0,
+    end: 0,
+    lanes: [],          // Tramos visibles por núcleo, ordenados por inicio
+    arrivals: null,     // Tiempos de llegada distintos, ordenados
+    arrivalPids: null,  // Procesos que llegan en cada tiempo
+    arrivalByPid: null, // Tiempo de llegada de cada proceso (para el tooltip)
+    requestId: 0,
+    fetchTimer: null,
+    dragX: null
+};
+
 // Función para mostrar diagrama de Gantt
 function displayGanttChart(ganttData) {
     const ganttChart = document.getElementById('gantt-chart');
-    const ganttTimeline = document.getElementById('gantt-timeline');
-    
-    // Limpiar contenido previo
-    ganttChart.innerHTML = '';
-    ganttTimeline.innerHTML = '';
     
-    // Calcular tiempo total
-    const totalTime = Math.max(...ganttData.map(item => item.end));
-    
-    // Crear contenedor para indicadores de llegada
-    const arrivalIndicators = document.createElement('div');
-    arrivalIndicators.className = 'arrival-indicators';
-    arrivalIndicators.style.cssText = `
-        position: relative;
-        height: 25px;
-        margin-bottom: 5px;
-        border-bottom: 2px solid #3498db;
-        background: linear-gradient(to right, rgba(52, 152, 219, 0.1) 0%, rgba(52, 152, 219, 0.05) 100%);
-    `;
+    // Extensión del diagrama y número de núcleos (sin spread: ganttData
+    // puede tener cientos de miles de segmentos)
+    let chartStart = Infinity;
+    let chartEnd = 0;
+    let cores = 1;
+    for (let i = 0; i < ganttData.length; i++) {
+        const item = ganttData[i];
+        if (item.start < chartStart) chartStart = item.start;
+        if (item.end > chartEnd) chartEnd = item.end;
+        if (item.core !== undefined && item.core + 1 > cores) cores = item.core + 1;
+    }
+    if (!isFinite(chartStart)) chartStart = 0;
+    
+    ganttView.chartStart = chartStart;
+    ganttView.chartEnd = Math.max(chartEnd, chartStart + 1);
+    ganttView.start = ganttView.chartStart;
+    ganttView.end = ganttView.chartEnd;
+    ganttView.lanes = Array.from({ length: cores }, () => []);
+    buildArrivalIndex();
+    
+    // Crear el canvas una sola vez
+    if (!ganttView.canvas) {
+        ganttChart.innerHTML = '';
+        const canvas = document.createElement('canvas');
+        canvas.className = 'gantt-canvas';
+        ganttChart.appendChild(canvas);
+        ganttView.canvas = canvas;
+        
+        canvas.addEventListener('wheel', onGanttWheel, { passive: false });
+        canvas.addEventListener('mousedown', event => { ganttView.dragX = event.clientX; });
+        window.addEventListener('mouseup', () => { ganttView.dragX = null; });
+        canvas.addEventListener('mousemove', onGanttMouseMove);
+        canvas.addEventListener('dblclick', () => {
+            setGanttWindow(ganttView.chartStart, ganttView.chartEnd);
+        });
+        window.addEventListener('resize', () => {
+            if (ganttView.lanes.length) {
+                drawGanttChart();
+                scheduleGanttFetch();
+            }
+        });
+    }
     
-    // Obtener información de llegada de procesos desde currentResults
+    drawGanttChart();
+    fetchGanttWindow();
+}
+
+// Agrupa las llegadas de los procesos por tiempo (una sola vez por resultado)
+function buildArrivalIndex() {
+    const byTime = new Map();
     if (currentResults && currentResults.processes) {
-        const processArrivalInfo = new Map();
         currentResults.processes.forEach(process => {
-            processArrivalInfo.set(process.pid, {
-                arrival_time: process.arrival_time,
-                color: getProcessColor(process.pid)
-            });
-        });
-        
-        // Crear indicadores de llegada únicos
-        const addedArrivals = new Set();
-        processArrivalInfo.forEach((info, pid) => {
-            const arrivalTime = info.arrival_time;
-            const arrivalKey = `${arrivalTime}`;
-            
-            if (!addedArrivals.has(arrivalKey)) {
-                addedArrivals.add(arrivalKey);
-                
-                // Obtener todos los procesos que llegan en este tiempo
-                const processesAtTime = Array.from(processArrivalInfo.entries())
-                    .filter(([p, i]) => i.arrival_time === arrivalTime)
-                    .map(([p, i]) => p);
-                
-                const arrow = document.createElement('div');
-                arrow.className = 'arrival-arrow';
-                arrow.style.cssText = `
-                    position: absolute;
-                    left: ${(arrivalTime / totalTime) * 100}%;
-                    top: -2px;
-                    width: 0;
-                    height: 0;
-                    border-left: 8px solid transparent;
-                    border-right: 8px solid transparent;
-                    border-top: 12px solid #e74c3c;
-                    transform: translateX(-50%);
-                    z-index: 10;
-                `;
-                arrow.title = `Llegada en t=${arrivalTime}: ${processesAtTime.join(', ')}`;
-                
-                // Etiqueta con el número del proceso directamente en la flecha
-                const processLabel = document.createElement('div');
-                processLabel.className = 'process-number-label';
-                processLabel.style.cssText = `
-                    position: absolute;
-                    left: ${(arrivalTime / totalTime) * 100}%;
-                    top: -20px;
-                    font-size: 11px;
-                    font-weight: bold;
-                    color: #e74c3c;
-                    transform: translateX(-50%);
-                    white-space: nowrap;
-                    text-shadow: 1px 1px 2px rgba(255,255,255,0.9);
-                    background: rgba(255,255,255,0.8);
-                    padding: 1px 4px;
-                    border-radius: 3px;
-                    border: 1px solid #e74c3c;
-                `;
-                // Mostrar los números de proceso separados por coma si hay múltiples
-                processLabel.textContent = processesAtTime.join(',');
-                
-                arrivalIndicators.appendChild(arrow);
-                arrivalIndicators.appendChild(processLabel);
+            const pids = byTime.get(process.arrival_time);
+            if (pids) {
+                pids.push(process.pid);
+            } else {
+                byTime.set(process.arrival_time, [process.pid]);
             }
         });
     }
+    ganttView.arrivals = Float64Array.from(byTime.keys()).sort();
+    ganttView.arrivalPids = byTime;
+    ganttView.arrivalByPid = null;
+}
+
+// Primer índice de un arreglo ordenado con valor >= value
+function lowerBound(values, value, key = item => item) {
+    let low = 0;
+    let high = values.length;
+    while (low < high) {
+        const middle = (low + high) >> 1;
+        if (key(values[middle]) < value) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    return low;
+}
+
+// Geometría del área de dibujo
+function ganttLayout() {
+    const canvas = ganttView.canvas;
+    const cores = ganttView.lanes.length;
+    const gutter = cores > 1 ? GANTT_CORE_GUTTER : 0;
+    const laneHeight = cores > 1 ? GANTT_CORE_LANE_HEIGHT : GANTT_LANE_HEIGHT;
+    const width = canvas.parentNode.clientWidth;
+    return {
+        gutter,
+        laneHeight,
+        width,
+        plotWidth: Math.max(width - gutter, 1),
+        height: GANTT_ARRIVAL_BAND + laneHeight * cores
+    };
+}
+
+function timeToX(time, layout) {
+    return layout.gutter + (time - ganttView.start) / (ganttView.end - ganttView.start) * layout.plotWidth;
+}
+
+// Cambia la ventana visible y pide al servidor los segmentos de la nueva
+function setGanttWindow(start, end) {
+    const minSpan = 1;
+    const fullSpan = ganttView.chartEnd - ganttView.chartStart;
+    let span = Math.min(Math.max(end - start, minSpan), fullSpan);
+    start = Math.min(Math.max(start, ganttView.chartStart), ganttView.chartEnd - span);
+    ganttView.start = start;
+    ganttView.end = start + span;
+    drawGanttChart();
+    scheduleGanttFetch();
+}
+
+function scheduleGanttFetch() {
+    clearTimeout(ganttView.fetchTimer);
+    ganttView.fetchTimer = setTimeout(fetchGanttWindow, 60);
+}
+
+async function fetchGanttWindow() {
+    const layout = ganttLayout();
+    const requestId = ++ganttView.requestId;
+    const start = Math.floor(ganttView.start);
+    const end = Math.ceil(ganttView.end);
+    const params = new URLSearchParams({ start, end, width: Math.round(layout.plotWidth) });
     
-    // Agregar indicadores de llegada al contenedor principal
-    ganttChart.parentNode.insertBefore(arrivalIndicators, ganttChart);
-    
-    // Crear barras del diagrama de Gantt
-    ganttData.forEach((item, index) => {
-        const bar = document.createElement('div');
-        bar.className = item.type === 'idle' ? 'gantt-bar gantt-idle' : 'gantt-bar gantt-process';
-        
-        // Calcular porcentaje de ancho
-        const widthPercent = (item.duration / totalTime) * 100;
-        bar.style.width = `${widthPercent}%`;
+    try {
+        const response = await fetch(`/gantt?${params}`);
+        const result = await response.json();
         
-        // Contenido de la barra
-        if (item.type === 'process') {
-            bar.innerHTML = `
-                <span class="gantt-label">${item.pid}</span>
-                <span class="gantt-duration">${item.duration}</span>
-            `;
-            bar.style.backgroundColor = getProcessColor(item.pid);
-        } else {
-            bar.innerHTML = `<span class="gantt-label">Idle</span>`;
+        // Descartar respuestas de ventanas que ya no están visibles
+        if (requestId !== ganttView.requestId) return;
+        if (!result.success) {
+            showMessage(result.message, 'error');
+            return;
         }
         
-        // Tooltip mejorado
-        if (item.type === 'process' && currentResults && currentResults.processes) {
-            const processInfo = currentResults.processes.find(p => p.pid === item.pid);
-            const arrivalTime = processInfo ? processInfo.arrival_time : 'N/A';
-            bar.title = `${item.pid}: ${item.start} - ${item.end} (${item.duration} unidades)\nLlegada: t=${arrivalTime}`;
-        } else {
-            bar.title = `${item.type === 'process' ? item.pid : 'Idle'}: ${item.start} - ${item.end} (${item.duration} unidades)`;
+        const lanes = ganttView.lanes.map(() => []);
+        result.segments.forEach(segment => {
+            const core = segment.core || 0;
+            if (lanes[core]) lanes[core].push(segment);
+        });
+        ganttView.lanes = lanes;
+        drawGanttChart();
+    } catch (error) {
+        showMessage(`Error de conexión: ${error.message}`, 'error');
+    }
+}
+
+// Dibuja la ventana visible: solo los tramos recibidos (O(ancho en píxeles))
+function drawGanttChart() {
+    const canvas = ganttView.canvas;
+    const layout = ganttLayout();
+    const ratio = window.devicePixelRatio || 1;
+    canvas.style.width = `${layout.width}px`;
+    canvas.style.height = `${layout.height}px`;
+    canvas.width = Math.round(layout.width * ratio);
+    canvas.height = Math.round(layout.height * ratio);
+    
+    const ctx = canvas.getContext('2d');
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    ctx.clearRect(0, 0, layout.width, layout.height);
+    ctx.textAlign = 'center';
+    ctx.textBaseline = 'middle';
+    
+    drawArrivals(ctx, layout);
+    
+    ganttView.lanes.forEach((spans, core) => {
+        const top = GANTT_ARRIVAL_BAND + core * layout.laneHeight;
+        if (layout.gutter) {
+            ctx.fillStyle = '#2c3e50';
+            ctx.font = 'bold 11px sans-serif';
+            ctx.fillText(`CPU ${core}`, layout.gutter / 2, top + layout.laneHeight / 2);
         }
         
-        ganttChart.appendChild(bar);
+        for (let i = 0; i < spans.length; i++) {
+            const span = spans[i];
+            const x0 = Math.max(timeToX(span.start, layout), layout.gutter);
+            const x1 = Math.min(timeToX(span.end, layout), layout.width);
+            if (x1 <= x0) continue;
+            
+            ctx.fillStyle = span.type === 'process' ? getProcessColor(span.pid) : GANTT_SPAN_COLORS[span.type];
+            ctx.fillRect(x0, top + 1, Math.max(x1 - x0, 1), layout.laneHeight - 2);
+            
+            // Etiquetas solo si caben
+            const barWidth = x1 - x0;
+            if (barWidth > 28) {
+                const label = span.type === 'process' ? span.pid : span.type === 'idle' ? 'Idle' : '';
+                ctx.fillStyle = span.type === 'idle' ? '#2c3e50' : 'white';
+                ctx.font = 'bold 12px sans-serif';
+                if (label && layout.laneHeight >= GANTT_LANE_HEIGHT && barWidth > 40) {
+                    ctx.fillText(label, (x0 + x1) / 2, top + layout.laneHeight / 2 - 7);
+                    ctx.font = '10px sans-serif';
+                    ctx.fillText(String(span.duration), (x0 + x1) / 2, top + layout.laneHeight / 2 + 9);
+                } else if (label) {
+                    ctx.fillText(label, (x0 + x1) / 2, top + layout.laneHeight / 2);
+                }
+            }
+        }
     });
     
-    // Crear timeline
-    const timelineSteps = Math.min(totalTime + 1, 20); // Máximo 20 marcas
-    const stepSize = totalTime / (timelineSteps - 1);
+    drawGanttTimeline(layout);
+}
+
+// Flechas de llegada de los procesos en la ventana visible
+function drawArrivals(ctx, layout) {
+    const arrivals = ganttView.arrivals;
+    ctx.fillStyle = 'rgba(52, 152, 219, 0.08)';
+    ctx.fillRect(layout.gutter, 0, layout.plotWidth, GANTT_ARRIVAL_BAND - 2);
+    ctx.fillStyle = '#3498db';
+    ctx.fillRect(layout.gutter, GANTT_ARRIVAL_BAND - 2, layout.plotWidth, 2);
+    if (!arrivals || !arrivals.length) return;
+    
+    const first = lowerBound(arrivals, ganttView.start);
+    const last = lowerBound(arrivals, ganttView.end + 1);
+    const visible = last - first;
+    // Con demasiadas llegadas visibles solo se marcan, sin etiquetas
+    const showLabels = visible <= layout.plotWidth / 40;
+    const step = Math.max(1, Math.ceil(visible / layout.plotWidth));
+    
+    ctx.fillStyle = '#e74c3c';
+    ctx.font = 'bold 11px sans-serif';
+    for (let i = first; i < last; i += step) {
+        const x = timeToX(arrivals[i], layout);
+        if (showLabels) {
+            ctx.beginPath();
+            ctx.moveTo(x - 6, GANTT_ARRIVAL_BAND - 14);
+            ctx.lineTo(x + 6, GANTT_ARRIVAL_BAND - 14);
+            ctx.lineTo(x, GANTT_ARRIVAL_BAND - 3);
+            ctx.fill();
+            ctx.fillText(ganttView.arrivalPids.get(arrivals[i]).join(','), x, 6);
+        } else {
+            ctx.fillRect(x, GANTT_ARRIVAL_BAND - 10, 1, 8);
+        }
+    }
+}
+
+// Marcas de tiempo de la ventana visible (máximo 20)
+function drawGanttTimeline(layout) {
+    const ganttTimeline = document.getElementById('gantt-timeline');
+    ganttTimeline.innerHTML = '';
+    
+    const span = ganttView.end - ganttView.start;
+    const timelineSteps = Math.max(2, Math.min(Math.floor(span) + 1, 20));
+    const stepSize = span / (timelineSteps - 1);
     
     for (let i = 0; i < timelineSteps; i++) {
-        const timeValue = Math.round(i * stepSize);
+        const timeValue = Math.round(ganttView.start + i * stepSize);
         const timeMarker = document.createElement('div');
         timeMarker.className = 'timeline-marker';
         timeMarker.textContent = timeValue;
-        timeMarker.style.left = `${(timeValue / totalTime) * 100}%`;
+        timeMarker.style.left = `${timeToX(timeValue, layout)}px`;
         ganttTimeline.appendChild(timeMarker);
     }
 }
 
+// Zoom con la rueda del ratón, centrado en el cursor
+function onGanttWheel(event) {
+    event.preventDefault();
+    const layout = ganttLayout();
+    const x = event.offsetX - layout.gutter;
+    const anchor = ganttView.start + (x / layout.plotWidth) * (ganttView.end - ganttView.start);
+    const factor = event.deltaY < 0 ? 0.8 : 1.25;
+    setGanttWindow(anchor - (anchor - ganttView.start) * factor,
+                   anchor + (ganttView.end - anchor) * factor);
+}
+
+// Arrastre para desplazar la ventana y tooltip del tramo bajo el cursor
+function onGanttMouseMove(event) {
+    const layout = ganttLayout();
+    const timePerPixel = (ganttView.end - ganttView.start) / layout.plotWidth;
+    
+    if (ganttView.dragX !== null) {
+        const shift = (ganttView.dragX - event.clientX) * timePerPixel;
+        ganttView.dragX = event.clientX;
+        setGanttWindow(ganttView.start + shift, ganttView.end + shift);
+        return;
+    }
+    
+    const core = Math.floor((event.offsetY - GANTT_ARRIVAL_BAND) / layout.laneHeight);
+    const spans = ganttView.lanes[core];
+    const time = ganttView.start + (event.offsetX - layout.gutter) * timePerPixel;
+    if (!spans || event.offsetY < GANTT_ARRIVAL_BAND) {
+        ganttView.canvas.title = '';
+        return;
+    }
+    
+    const span = spans[lowerBound(spans, time, item => item.end)];
+    if (!span || span.start > time) {
+        ganttView.canvas.title = '';
+        return;
+    }
+    
+    const prefix = layout.gutter ? `CPU ${core} · ` : '';
+    if (span.type === 'process') {
+        const arrival = findArrival(span.pid);
+        ganttView.canvas.title = `${prefix}${span.pid}: ${span.start} - ${span.end} (${span.duration} unidades)` +
+            (arrival !== null ? `\nLlegada: t=${arrival}` : '');
+    } else if (span.type === 'idle') {
+        ganttView.canvas.title = `${prefix}Idle: ${span.start} - ${span.end} (${span.duration} unidades)`;
+    } else {
+        ganttView.canvas.title = `${prefix}${span.segments} segmentos: ${span.start} - ${span.end}` +
+            `\nCPU ocupada ${span.busy_time} de ${span.duration} unidades` +
+            '\nAcerque el zoom (rueda del ratón) para ver el detalle';
+    }
+}
+
+// Tiempo de llegada de un proceso (desde los resultados cargados)
+function findArrival(pid) {
+    if (!currentResults || !currentResults.processes) return null;
+    if (!ganttView.arrivalByPid) {
+        ganttView.arrivalByPid = new Map(currentResults.processes.map(p => [p.pid, p.arrival_time]));
+    }
+    const arrival = ganttView.arrivalByPid.get(pid);
+    return arrival === undefined ? null : arrival;
+}
+
 // Función para generar color único para cada proceso
 function getProcessColor(pid) {
     const colors = [
@@ -700,6 +915,9 @@ function displayStatistics(statistics) {
             <td>${stats.std_dev}</td>
             <td>${stats.min}</td>
             <td>${stats.max}</td>
+            <td>${stats.p50 ?? '-'}</td>
+            <td>${stats.p95 ?? '-'}</td>
+            <td>${stats.p99 ?? '-'}</td>
         `;
         tbody.appendChild(row);
     });
@@ -0,0 +1,234 @@
+"""
+Motor de estadísticas compartido por todos los schedulers.
+
+Calcula media, desviación estándar, mínimo y máximo de cada métrica en una
+sola pasada con el algoritmo en línea de Welford (numéricamente estable),
+y los percentiles p50/p95/p99 con un sketch de cuantiles de memoria
+acotada. No construye listas temporales por métrica, así que sirve tanto
+para una ProcessTable completa como para flujos de procesos (streaming).
+"""
+
+import math
+
+
+# Percentiles reportados para las métricas de latencia
+PERCENTILES = (50, 95, 99)
+
+
+class RunningStats:
+    """
+    Media, varianza (poblacional), mínimo y máximo en línea (Welford).
+
+    La media se obtiene de la suma acumulada, que es exacta para enteros;
+    la varianza usa la actualización incremental de Welford para evitar la
+    cancelación catastrófica de sum(x²) - n·μ².
+    """
+
+    __slots__ = ('count', 'total', '_mean', '_m2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def update(self, value):
+        """Incorpora un valor."""
+        self.count += 1
+        self.total += value
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def update_many(self, values, sketch=None):
+        """
+        Incorpora una secuencia de valores en una sola pasada, con el estado
+        en variables locales (mucho más rápido que llamar update() por valor).
+        
+        Args:
+            values: Iterable de valores (p. ej. una columna de ProcessTable)
+            sketch (QuantileSketch): Sketch que se alimenta en la misma pasada
+        """
+        count, total, mean, m2 = self.count, self.total, self._mean, self._m2
+        low, high = self.min, self.max
+        add_to_sketch = sketch.update if sketch is not None else None
+        for value in values:
+            if low is None:
+                low = high = value
+            count += 1
+            total += value
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+            if add_to_sketch is not None:
+                add_to_sketch(value)
+        self.count, self.total, self._mean, self._m2 = count, total, mean, m2
+        self.min, self.max = low, high
+
+    def merge(self, other):
+        """Combina con otro RunningStats (algoritmo paralelo de Chan)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.total, self._mean, self._m2 = other.count, other.total, other._mean, other._m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self._mean += delta * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    @property
+    def std_dev(self):
+        if self.count < 2:
+            return 0
+        return math.sqrt(max(self._m2, 0.0) / self.count)
+
+    def to_dict(self):
+        """Formato de calculate_statistics(): media y σ redondeadas a 2 decimales."""
+        return {
+            'mean': round(self.mean, 2),
+            'std_dev': round(self.std_dev, 2),
+            'min': self.min if self.count else 0,
+            'max': self.max if self.count else 0
+        }
+
+
+class QuantileSketch:
+    """
+    Sketch de cuantiles de memoria acotada.
+
+    Mientras hay pocos valores (hasta exact_limit) los guarda tal cual y los
+    percentiles son exactos. A partir de ahí los agrupa en un histograma
+    logarítmico con sub_buckets subdivisiones por potencia de 2: el error
+    relativo de cada percentil queda por debajo de 1/sub_buckets y la
+    memoria depende del rango de valores, no de cuántos hay.
+    """
+
+    __slots__ = ('exact_limit', 'sub_buckets', 'count', 'min', 'max', '_values', '_buckets')
+
+    def __init__(self, exact_limit=2048, sub_buckets=64):
+        self.exact_limit = exact_limit
+        self.sub_buckets = sub_buckets
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._values = []
+        self._buckets = None
+
+    def update(self, value):
+        """Incorpora un valor."""
+        self.count += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self._buckets is None:
+            self._values.append(value)
+            if len(self._values) > self.exact_limit:
+                self._buckets = {}
+                for buffered in self._values:
+                    self._add_to_bucket(buffered)
+                self._values = []
+        else:
+            self._add_to_bucket(value)
+
+    def _bucket_key(self, value):
+        """
+        Bucket de un valor como entero monótono: 0 para el cero y
+        ±((exponente + 1100) * sub_buckets + subdivisión) según el signo
+        (el desplazamiento cubre todo el rango de exponentes de un float).
+        """
+        if value == 0:
+            return 0
+        mantissa, exponent = math.frexp(abs(value))
+        key = (exponent + 1100) * self.sub_buckets + int((mantissa - 0.5) * 2 * self.sub_buckets)
+        return key if value > 0 else -key
+
+    def _add_to_bucket(self, value):
+        key = self._bucket_key(value)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+
+    def _bucket_value(self, key):
+        """Valor representativo (punto medio) de un bucket."""
+        if key == 0:
+            return 0
+        exponent, sub = divmod(abs(key), self.sub_buckets)
+        low = (0.5 + sub / (2 * self.sub_buckets)) * 2.0 ** (exponent - 1100)
+        high = (0.5 + (sub + 1) / (2 * self.sub_buckets)) * 2.0 ** (exponent - 1100)
+        middle = (low + high) / 2
+        return middle if key > 0 else -middle
+
+    def quantile(self, q):
+        """
+        Retorna el cuantil q (0 <= q <= 1).
+
+        En modo exacto interpola linealmente entre los rangos vecinos; en
+        modo histograma retorna el punto medio del bucket que contiene el
+        rango, acotado a [min, max].
+        """
+        if self.count == 0:
+            return 0
+        if self._buckets is None:
+            values = sorted(self._values)
+            position = q * (len(values) - 1)
+            lower = int(position)
+            upper = min(lower + 1, len(values) - 1)
+            return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                return min(max(self._bucket_value(key), self.min), self.max)
+        return self.max
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """Diccionario {'p50': ..., 'p95': ..., 'p99': ...} redondeado a 2 decimales."""
+        return {f'p{p}': round(self.quantile(p / 100), 2) for p in percentiles}
+
+
+def compute_statistics(table, metrics, percentile_metrics=('waiting_time', 'turnaround_time')):
+    """
+    Calcula las estadísticas de varias columnas, una sola pasada por columna
+    (media, σ, mínimo, máximo y percentiles a la vez).
+
+    Args:
+        table: ProcessTable (o cualquier objeto con una columna por métrica)
+        metrics (tuple): Nombres de las columnas a resumir
+        percentile_metrics (tuple): Métricas que además reportan p50/p95/p99
+
+    Returns:
+        dict: {métrica: {'mean', 'std_dev', 'min', 'max'[, 'p50', 'p95', 'p99']}}
+    """
+    if not len(table):
+        return {}
+
+    stats = {}
+    for name in metrics:
+        accumulator = RunningStats()
+        sketch = QuantileSketch() if name in percentile_metrics else None
+        accumulator.update_many(table.column(name), sketch)
+        stats[name] = accumulator.to_dict()
+        if sketch is not None:
+            stats[name].update(sketch.percentiles())
+    return stats
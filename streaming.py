@@ -0,0 +1,442 @@
+"""
+Simulación en streaming con memoria acotada.
+
+Los schedulers normales guardan toda la tabla de procesos y todo el
+diagrama de Gantt hasta get_results(). En modo streaming los procesos se
+leen de un iterador ordenado por tiempo de llegada y la simulación produce
+los registros a medida que ocurren:
+
+    {'record': 'segment', 'type': 'process' | 'idle', 'pid', 'start', 'end', 'duration', ...}
+    {'record': 'process', 'pid', 'arrival_time', 'burst_time', 'completion_time', ...}
+
+Solo se guardan los procesos que ya llegaron y no han terminado (la cola de
+listos) y los agregados del resumen (RunningStats y QuantileSketch), así
+que una traza de varios GB puede simularse y volcarse a disco como NDJSON
+sin cargarla en memoria:
+
+    python streaming.py RR --quantum 4 < traza.csv > eventos.ndjson
+
+A diferencia de SJFScheduler (que ignora los tiempos de llegada), el SJF en
+streaming es el no expropiativo clásico: elige la ráfaga más corta entre los
+procesos que ya llegaron (TT = CT - AT), como el modo multiprocesador.
+"""
+
+import argparse
+import heapq
+import json
+import sys
+from collections import deque
+
+from ingest import iter_rows, validate_row
+from process import (DEFAULT_AGING_INTERVAL, PRIORITY_GANTT_FIELDS, RR_GANTT_FIELDS,
+                     SJF_GANTT_FIELDS, SRTF_GANTT_FIELDS)
+from statistics_engine import QuantileSketch, RunningStats
+
+
+# Algoritmos con modo streaming
+STREAM_ALGORITHMS = ('FCFS', 'SJF', 'RR', 'SRTF', 'PRIORITY')
+
+# Métricas por proceso resumidas en el streaming (las dos primeras con percentiles)
+STREAM_METRICS = ('waiting_time', 'turnaround_time', 'normalized_turnaround_time', 'burst_time')
+STREAM_PERCENTILE_METRICS = ('waiting_time', 'turnaround_time')
+
+
+def read_processes(processes):
+    """
+    Normaliza y valida un iterador de procesos.
+
+    Acepta tuplas (pid, arrival_time, burst_time[, priority]) o diccionarios
+    con esos campos (validados con ingest.validate_row()).
+
+    Yields:
+        tuple: (pid, arrival_time, burst_time, priority)
+
+    Raises:
+        ValueError: Si un proceso no es válido o llega desordenado
+    """
+    previous_arrival = 0
+    for data in processes:
+        if isinstance(data, Exception):
+            raise data
+        if isinstance(data, dict):
+            pid, arrival_time, burst_time, priority = validate_row(data)
+        else:
+            pid, arrival_time, burst_time = data[0], int(data[1]), int(data[2])
+            priority = int(data[3]) if len(data) > 3 else 0
+            if arrival_time < 0 or burst_time <= 0:
+                raise ValueError(f'Proceso {pid}: se requiere arrival_time >= 0 y burst_time > 0')
+        if arrival_time < previous_arrival:
+            raise ValueError(f'Proceso {pid}: los procesos deben llegar ordenados por arrival_time')
+        previous_arrival = arrival_time
+        yield pid, arrival_time, burst_time, priority
+
+
+class StreamSummary:
+    """Agregados de una simulación en streaming (memoria constante)."""
+
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.process_count = 0
+        self.segment_count = 0
+        self.process_segments = 0
+        self.busy_time = 0
+        self.idle_time = 0
+        self.makespan = 0
+        self.max_ready = 0
+        self.stats = {name: RunningStats() for name in STREAM_METRICS}
+        self.sketches = {name: QuantileSketch() for name in STREAM_PERCENTILE_METRICS}
+
+    def add_segment(self, segment):
+        self.segment_count += 1
+        if segment['type'] == 'idle':
+            self.idle_time += segment['duration']
+        else:
+            self.process_segments += 1
+            self.busy_time += segment['duration']
+        self.makespan = segment['end']
+
+    def add_process(self, record):
+        self.process_count += 1
+        for name, accumulator in self.stats.items():
+            accumulator.update(record[name])
+        for name, sketch in self.sketches.items():
+            sketch.update(record[name])
+
+    def to_dict(self):
+        """Resumen con el formato de get_results() (promedios y estadísticas)."""
+        statistics = {}
+        for name, accumulator in self.stats.items():
+            statistics[name] = accumulator.to_dict()
+            if name in self.sketches:
+                statistics[name].update(self.sketches[name].percentiles())
+        return {
+            'algorithm': self.algorithm,
+            'process_count': self.process_count,
+            'segment_count': self.segment_count,
+            'makespan': self.makespan,
+            'busy_time': self.busy_time,
+            'idle_time': self.idle_time,
+            'cpu_utilization': round(self.busy_time / self.makespan, 4) if self.makespan else 0,
+            'context_switches': max(self.process_segments - self.process_count, 0),
+            'max_ready_processes': self.max_ready,
+            'average_waiting_time': self.stats['waiting_time'].mean,
+            'average_turnaround_time': self.stats['turnaround_time'].mean,
+            'statistics': statistics
+        }
+
+
+class SimulationStream:
+    """
+    Registros de una simulación en streaming.
+
+    Se itera una sola vez; summary() retorna los agregados de lo simulado
+    hasta el momento (el resumen final cuando la iteración terminó).
+    """
+
+    def __init__(self, algorithm, records, summary):
+        self.algorithm = algorithm
+        self._records = records
+        self._summary = summary
+
+    def __iter__(self):
+        return self._records
+
+    def summary(self):
+        return self._summary.to_dict()
+
+
+def _segment(summary, pid, start, end, fields=(), values=()):
+    segment = {'record': 'segment', 'type': 'process', 'pid': pid,
+               'start': start, 'end': end, 'duration': end - start}
+    segment.update(zip(fields, values))
+    summary.add_segment(segment)
+    return segment
+
+
+def _idle(summary, start, end):
+    segment = {'record': 'segment', 'type': 'idle', 'start': start, 'end': end, 'duration': end - start}
+    summary.add_segment(segment)
+    return segment
+
+
+def _completed(summary, pid, arrival_time, burst_time, priority, start_time, completion_time):
+    turnaround_time = completion_time - arrival_time
+    record = {
+        'record': 'process',
+        'pid': pid,
+        'arrival_time': arrival_time,
+        'burst_time': burst_time,
+        'priority': priority,
+        'start_time': start_time,
+        'completion_time': completion_time,
+        'turnaround_time': turnaround_time,
+        'waiting_time': turnaround_time - burst_time,
+        'normalized_turnaround_time': round(turnaround_time / burst_time, 2)
+    }
+    summary.add_process(record)
+    return record
+
+
+def _fcfs_records(source, summary):
+    current_time = 0
+    for pid, arrival_time, burst_time, priority in source:
+        if arrival_time > current_time:
+            yield _idle(summary, current_time, arrival_time)
+            current_time = arrival_time
+        start_time = current_time
+        current_time += burst_time
+        yield _segment(summary, pid, start_time, current_time)
+        yield _completed(summary, pid, arrival_time, burst_time, priority, start_time, current_time)
+
+
+def _sjf_records(source, summary):
+    # Heap de procesos listos por (ráfaga, PID), como el orden de SJFScheduler
+    ready = []
+    current_time = 0
+    order = 0
+    pending = next(source, None)
+    while ready or pending is not None:
+        if not ready and pending[1] > current_time:
+            yield _idle(summary, current_time, pending[1])
+            current_time = pending[1]
+        while pending is not None and pending[1] <= current_time:
+            pid, arrival_time, burst_time, priority = pending
+            heapq.heappush(ready, (burst_time, pid, arrival_time, priority))
+            pending = next(source, None)
+        summary.max_ready = max(summary.max_ready, len(ready))
+
+        burst_time, pid, arrival_time, priority = heapq.heappop(ready)
+        order += 1
+        start_time = current_time
+        current_time += burst_time
+        yield _segment(summary, pid, start_time, current_time, SJF_GANTT_FIELDS, (arrival_time, order))
+        yield _completed(summary, pid, arrival_time, burst_time, priority, start_time, current_time)
+
+
+def _rr_records(source, summary, quantum):
+    # Cola de listos con [pid, llegada, ráfaga, prioridad, restante, inicio, quantums]
+    ready = deque()
+    current_time = 0
+    pending = next(source, None)
+    while ready or pending is not None:
+        if not ready and pending[1] > current_time:
+            yield _idle(summary, current_time, pending[1])
+            current_time = pending[1]
+        while pending is not None and pending[1] <= current_time:
+            ready.append([*pending, pending[2], None, 0])
+            pending = next(source, None)
+        summary.max_ready = max(summary.max_ready, len(ready))
+
+        process = ready.popleft()
+        if process[5] is None:
+            process[5] = current_time
+        execution_time = min(quantum, process[4])
+        process[4] -= execution_time
+        process[6] += 1
+        start_time = current_time
+        current_time += execution_time
+        yield _segment(summary, process[0], start_time, current_time, RR_GANTT_FIELDS, (process[6], process[4]))
+
+        # Los que llegaron durante el quantum entran antes que el expulsado
+        while pending is not None and pending[1] <= current_time:
+            ready.append([*pending, pending[2], None, 0])
+            pending = next(source, None)
+
+        if process[4] == 0:
+            yield _completed(summary, *process[:4], process[5], current_time)
+        else:
+            ready.append(process)
+
+
+def _srtf_records(source, summary):
+    # Heap de listos: (restante, orden de llegada); el orden desempata como
+    # la fila en SRTFScheduler
+    ready = []
+    waiting = {}
+    current_time = 0
+    sequence = 0
+    pending = next(source, None)
+
+    def admit():
+        nonlocal pending, sequence
+        while pending is not None and pending[1] <= current_time:
+            waiting[sequence] = [*pending, None]
+            heapq.heappush(ready, (pending[2], sequence))
+            sequence += 1
+            pending = next(source, None)
+
+    while ready or pending is not None:
+        if not ready and pending[1] > current_time:
+            yield _idle(summary, current_time, pending[1])
+            current_time = pending[1]
+        admit()
+        summary.max_ready = max(summary.max_ready, len(ready))
+
+        remaining_time, key = heapq.heappop(ready)
+        process = waiting[key]
+        if process[4] is None:
+            process[4] = current_time
+        segment_start = current_time
+
+        while True:
+            end = current_time + remaining_time
+            if pending is None or pending[1] >= end:
+                current_time = end
+                remaining_time = 0
+                break
+            remaining_time -= pending[1] - current_time
+            current_time = pending[1]
+            admit()
+            if ready[0] < (remaining_time, key):
+                break
+
+        yield _segment(summary, process[0], segment_start, current_time, SRTF_GANTT_FIELDS, (remaining_time,))
+        if remaining_time == 0:
+            del waiting[key]
+            yield _completed(summary, *process[:4], process[4], current_time)
+        else:
+            heapq.heappush(ready, (remaining_time, key))
+
+
+def _priority_records(source, summary, aging, preemptive):
+    # Heap de listos: (clave, entrada a la cola, orden de llegada), con la
+    # misma clave que PriorityScheduler
+    ready = []
+    waiting = {}
+    current_time = 0
+    sequence = 0
+    pending = next(source, None)
+
+    def admit():
+        nonlocal pending, sequence
+        while pending is not None and pending[1] <= current_time:
+            arrival_time = pending[1]
+            key = pending[3] * aging + arrival_time if aging else pending[3]
+            waiting[sequence] = [*pending, pending[2], None]
+            heapq.heappush(ready, (key, arrival_time, sequence))
+            sequence += 1
+            pending = next(source, None)
+
+    while ready or pending is not None:
+        if not ready and pending[1] > current_time:
+            yield _idle(summary, current_time, pending[1])
+            current_time = pending[1]
+        admit()
+        summary.max_ready = max(summary.max_ready, len(ready))
+
+        _, ready_since, number = heapq.heappop(ready)
+        process = waiting[number]
+        if process[5] is None:
+            process[5] = current_time
+        priority = process[3]
+        effective_priority = priority - (current_time - ready_since) // aging if aging else priority
+        remaining_time = process[4]
+        segment_start = current_time
+
+        while True:
+            end = current_time + remaining_time
+            if not preemptive or pending is None or pending[1] >= end:
+                current_time = end
+                remaining_time = 0
+                break
+            remaining_time -= pending[1] - current_time
+            current_time = pending[1]
+            admit()
+            running_key = priority * aging + current_time if aging else priority
+            if ready[0][0] < running_key:
+                break
+
+        process[4] = remaining_time
+        yield _segment(summary, process[0], segment_start, current_time,
+                       PRIORITY_GANTT_FIELDS, (priority, effective_priority))
+        if remaining_time == 0:
+            del waiting[number]
+            yield _completed(summary, *process[:4], process[5], current_time)
+        else:
+            key = priority * aging + current_time if aging else priority
+            heapq.heappush(ready, (key, current_time, number))
+
+
+def stream_simulation(algorithm, processes, quantum=4, aging_interval=DEFAULT_AGING_INTERVAL,
+                      preemptive=True):
+    """
+    Simula un algoritmo en streaming.
+
+    Args:
+        algorithm (str): Uno de STREAM_ALGORITHMS
+        processes: Iterador de procesos ordenado por tiempo de llegada (ver
+            read_processes()); se consume a medida que avanza la simulación
+        quantum (int): Quantum de Round Robin
+        aging_interval (int): Aging del algoritmo por prioridades (0 lo desactiva)
+        preemptive (bool): Si las llegadas expulsan en el algoritmo por prioridades
+
+    Returns:
+        SimulationStream: Registros de segmentos y procesos terminados, en
+        orden de tiempo, y su resumen
+
+    Nota: los PIDs repetidos no se detectan (requeriría recordar todos).
+    """
+    algorithm = algorithm.upper()
+    summary = StreamSummary(algorithm)
+    source = read_processes(processes)
+    if algorithm == 'FCFS':
+        records = _fcfs_records(source, summary)
+    elif algorithm == 'SJF':
+        records = _sjf_records(source, summary)
+    elif algorithm == 'RR':
+        if not isinstance(quantum, int) or quantum <= 0:
+            raise ValueError('Para Round Robin, el quantum debe ser un entero positivo.')
+        records = _rr_records(source, summary, quantum)
+    elif algorithm == 'SRTF':
+        records = _srtf_records(source, summary)
+    elif algorithm == 'PRIORITY':
+        aging = aging_interval if aging_interval and aging_interval > 0 else 0
+        records = _priority_records(source, summary, aging, preemptive)
+    else:
+        raise ValueError(f'Algoritmo {algorithm} no soportado. Algoritmos disponibles: {", ".join(STREAM_ALGORITHMS)}')
+    return SimulationStream(algorithm, records, summary)
+
+
+def write_ndjson(stream, output):
+    """
+    Escribe los registros de un SimulationStream como NDJSON (una línea por
+    registro) y retorna el resumen final.
+    """
+    dumps = json.JSONEncoder(separators=(',', ':')).encode
+    write = output.write
+    for record in stream:
+        write(dumps(record))
+        write('\n')
+    return stream.summary()
+
+
+def main(argv=None):
+    """Simula una traza (entrada estándar o --trace) y escribe NDJSON en la salida estándar."""
+    parser = argparse.ArgumentParser(description='Simulación en streaming con memoria acotada.')
+    parser.add_argument('algorithm', choices=STREAM_ALGORITHMS)
+    parser.add_argument('--quantum', type=int, default=4)
+    parser.add_argument('--aging-interval', type=int, default=DEFAULT_AGING_INTERVAL)
+    parser.add_argument('--format', choices=('csv', 'ndjson'), default='csv',
+                        help='Formato de la traza de entrada (ordenada por arrival_time)')
+    parser.add_argument('--trace', help='Leer la traza de un archivo CSV o binario (trace_loader) '
+                                        'en lugar de la entrada estándar')
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        # Importación diferida: solo se necesita al leer archivos de traza
+        from trace_loader import iter_trace
+        rows = iter_trace(args.trace)
+    else:
+        rows = (data for _, data in iter_rows(sys.stdin.buffer, args.format))
+    try:
+        stream = stream_simulation(args.algorithm, rows, quantum=args.quantum,
+                                   aging_interval=args.aging_interval)
+        summary = write_ndjson(stream, sys.stdout)
+    except ValueError as e:
+        parser.exit(1, f'Error: {e}\n')
+    json.dump(summary, sys.stderr, indent=2)
+    sys.stderr.write('\n')
+
+
+if __name__ == '__main__':
+    main()
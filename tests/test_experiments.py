@@ -0,0 +1,63 @@
+import re
+
+import pytest
+
+from app import app
+from experiments import MAX_SWEEP_POINTS, comparison_runs, sweep_quantum
+from process_table import ProcessTable
+
+
+PROCESSES = [
+    {'pid': 'P1', 'arrival_time': 0, 'burst_time': 10},
+    {'pid': 'P2', 'arrival_time': 30, 'burst_time': 7},
+]
+
+
+def schedule_context_switches(client, quantum):
+    client.post('/change_algorithm', json={'algorithm': 'RR', 'quantum': quantum})
+    client.post('/add_processes', json=PROCESSES)
+    response = client.post('/schedule').get_json()
+    assert response['success'], response['message']
+    return int(re.search(r'Context switches: (\d+)', response['results']['algorithm_analysis']).group(1))
+
+
+def test_compare_and_sweep_context_switches_match_schedule():
+    client = app.test_client()
+    expected = {quantum: schedule_context_switches(client, quantum) for quantum in (2, 3)}
+    assert expected == {2: 7, 3: 5}
+
+    compared = client.post('/compare', json={'algorithms': ['RR'], 'quanta': [2, 3], 'gantt': 'none',
+                                             'workers': 1, 'processes': PROCESSES}).get_json()
+    assert compared['success'], compared['message']
+    assert {run['quantum']: run['metrics']['context_switches'] for run in compared['results']['runs']} == expected
+
+    swept = client.post('/sweep', json={'quanta': [2, 3], 'workers': 1}).get_json()
+    assert swept['success'], swept['message']
+    assert {point['quantum']: point['context_switches'] for point in swept['results']} == expected
+
+
+def test_compare_normalized_turnaround_for_every_algorithm():
+    client = app.test_client()
+    processes = [{'pid': pid, 'arrival_time': arrival_time, 'burst_time': burst_time}
+                 for pid, arrival_time, burst_time in [('P1', 0, 8), ('P2', 1, 4), ('P3', 2, 9), ('P4', 3, 5)]]
+    compared = client.post('/compare', json={'algorithms': ['FCFS', 'SJF', 'RR', 'SRTF', 'PRIORITY'],
+                                             'quanta': [2, 4], 'gantt': 'none', 'workers': 1,
+                                             'processes': processes}).get_json()
+    assert compared['success'], compared['message']
+    ntat = {run['label']: run['metrics']['average_normalized_turnaround_time'] for run in compared['results']['runs']}
+    assert all(value > 0 for value in ntat.values())
+    assert ntat['RR (q=2)'] == 3.04 and ntat['RR (q=4)'] == 2.83
+    assert compared['results']['best']['average_normalized_turnaround_time'] == 'SRTF'
+
+
+def test_huge_sweep_range_is_rejected_before_building_it():
+    client = app.test_client()
+    client.post('/add_processes', json=PROCESSES)
+    response = client.post('/sweep', json={'start': 1, 'stop': 10 ** 12}).get_json()
+    assert not response['success']
+    assert str(MAX_SWEEP_POINTS) in response['message']
+
+    with pytest.raises(ValueError):
+        sweep_quantum(ProcessTable(), range(1, 10 ** 12))
+    with pytest.raises(ValueError):
+        comparison_runs(['RR'], range(1, 10 ** 12))
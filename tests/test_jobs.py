@@ -0,0 +1,35 @@
+import threading
+import time
+
+from jobs import CANCELLED, JobManager, checkpoint
+from process import RoundRobinScheduler
+
+
+def test_checkpoint_outside_a_job_does_nothing():
+    checkpoint()
+
+
+def test_cancel_stops_a_running_simulation():
+    # Round Robin con quantum 1: millones de iteraciones del bucle de simulación
+    scheduler = RoundRobinScheduler(1)
+    scheduler.add_processes([f'P{i}' for i in range(200)], [0] * 200, [20000] * 200)
+    started = threading.Event()
+
+    def work(job):
+        started.set()
+        scheduler.schedule()
+        return '{}'
+
+    manager = JobManager(workers=1)
+    job = manager.submit('schedule', 'owner', work)
+    assert started.wait(5)
+    time.sleep(0.05)
+    cancelled_at = time.perf_counter()
+    manager.cancel(job.job_id, 'owner')
+    job.future.result(timeout=30)
+
+    assert job.status == CANCELLED
+    assert job.result is None
+    assert time.perf_counter() - cancelled_at < 1
+    # La simulación se interrumpió antes de terminar los procesos
+    assert 0 in scheduler.processes.completion_time
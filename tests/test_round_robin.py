@@ -0,0 +1,32 @@
+import pytest
+
+from process import RoundRobinScheduler
+from workload import generate_workload
+
+
+def build(event_driven, quantum, processes=None, count=200, seed=1):
+    scheduler = RoundRobinScheduler(quantum, event_driven=event_driven)
+    if processes is None:
+        generate_workload(scheduler, count, seed=seed)
+    else:
+        for pid, arrival_time, burst_time in processes:
+            scheduler.add_process(pid, arrival_time, burst_time)
+    scheduler.schedule()
+    return scheduler
+
+
+def test_context_switches_with_idle_gap():
+    # P1 se ejecuta solo (5 quantums) y P2 llega con la CPU libre (4 quantums)
+    processes = [('P1', 0, 10), ('P2', 30, 7)]
+    for event_driven in (False, True):
+        analysis = build(event_driven, 2, processes).analyze_round_robin()
+        assert 'Context switches: 7' in analysis
+
+
+@pytest.mark.parametrize('quantum', [1, 2, 4, 16])
+@pytest.mark.parametrize('seed', [1, 2])
+def test_event_driven_matches_per_quantum(quantum, seed):
+    fields = ['processes', 'averages', 'statistics', 'analysis']
+    per_quantum = build(False, quantum, seed=seed).get_results(fields)
+    event_driven = build(True, quantum, seed=seed).get_results(fields)
+    assert event_driven == per_quantum
@@ -0,0 +1,42 @@
+import pytest
+
+from ingest import ingest
+from process import FCFSScheduler
+from trace_loader import load_trace, write_binary_trace
+
+
+def loaded_and_ingested(path, chunk_bytes):
+    loaded = FCFSScheduler()
+    ingested = FCFSScheduler()
+    for scheduler in (loaded, ingested):
+        scheduler.add_processes(['P0'], [0], [1])
+    with open(path, 'rb') as stream:
+        expected = ingest(ingested, stream, 'csv')
+    return load_trace(loaded, str(path), 'csv', chunk_bytes=chunk_bytes), expected
+
+
+# Filas todas válidas (lectura rápida por bloques) y filas mezcladas con inválidas y vacías
+@pytest.mark.parametrize('lines', [
+    ['P1,0,5', 'P2,1,3', 'P0,2,4', 'P1,3,2', 'P3,4,1', 'P2,5,6'],
+    ['P1,0,5', '', 'P2,x,3', 'P0,2,4', 'P1,3,2', ',4,1', 'P3,4,1', 'P2,5,6'],
+])
+@pytest.mark.parametrize('chunk_bytes', [16, 1 << 20])
+def test_duplicate_pid_rows_match_ingest(tmp_path, lines, chunk_bytes):
+    path = tmp_path / 'trace.csv'
+    path.write_text('\n'.join(['pid,arrival_time,burst_time', *lines]) + '\n')
+
+    loaded, expected = loaded_and_ingested(path, chunk_bytes)
+
+    assert loaded == expected
+    assert all(error['row'] is not None for error in loaded['errors'])
+
+
+def test_binary_duplicate_pid_rows(tmp_path):
+    path = tmp_path / 'trace.bin'
+    write_binary_trace(str(path), ['P1', 'P2', 'P1', 'P0'], [0, 1, 2, 3], [5, 3, 2, 4])
+    scheduler = FCFSScheduler()
+    scheduler.add_processes(['P0'], [0], [1])
+
+    loaded = load_trace(scheduler, str(path), 'binary')
+
+    assert [(error['row'], error['pid']) for error in loaded['errors']] == [(3, 'P1'), (4, 'P0')]
@@ -0,0 +1,308 @@
+"""
+Carga de trazas desde archivos grandes.
+
+El archivo se mapea en memoria (mmap) y se procesa por bloques de
+CHUNK_BYTES: cada bloque se convierte directamente en columnas (PIDs y
+arreglos de enteros) que se vuelcan a la tabla de procesos del scheduler con
+add_processes(), sin crear una tupla ni un diccionario por fila. Solo los
+bloques con alguna fila inválida (o con comillas CSV) se procesan fila a
+fila, para poder rechazar esas filas individualmente como /add_processes.
+
+Formatos:
+
+- CSV: pid,arrival_time,burst_time[,priority], con cabecera opcional.
+- Binario de ancho fijo: la firma TRACE_MAGIC seguida de registros de
+  RECORD_SIZE bytes (little-endian): PID en PID_BYTES bytes UTF-8
+  rellenos con ceros, y arrival_time, burst_time y priority como int64.
+  write_binary_trace() genera archivos en este formato.
+"""
+
+import csv
+import io
+import mmap
+import os
+import struct
+from array import array
+from itertools import repeat
+
+from ingest import FIELDS, MAX_REPORTED_ERRORS, validate_row
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: acelera los bloques binarios
+    np = None
+
+
+# Tamaño de los bloques en que se procesa el archivo
+CHUNK_BYTES = 8 * 1024 * 1024
+
+# Firma de los archivos binarios y formato de cada registro
+TRACE_MAGIC = b'PTRACE01'
+PID_BYTES = 16
+RECORD = struct.Struct(f'<{PID_BYTES}sqqq')
+RECORD_SIZE = RECORD.size
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([('pid', f'S{PID_BYTES}'), ('arrival_time', '<i8'),
+                             ('burst_time', '<i8'), ('priority', '<i8')])
+
+
+def detect_trace_format(path):
+    """Retorna 'binary' si el archivo empieza con TRACE_MAGIC y 'csv' en otro caso."""
+    with open(path, 'rb') as trace:
+        return 'binary' if trace.read(len(TRACE_MAGIC)) == TRACE_MAGIC else 'csv'
+
+
+class _Chunk:
+    """
+    Filas válidas de un bloque, en columnas, y los errores de las rechazadas.
+
+    rows guarda el número de fila del archivo de cada fila válida (un range
+    en los bloques sin rechazos), para reportar los PIDs repetidos con su
+    fila como ingest.
+    """
+
+    __slots__ = ('rows', 'pids', 'arrival_times', 'burst_times', 'priorities', 'errors', 'rejected')
+
+    def __init__(self):
+        self.rows = array('q')
+        self.pids = []
+        self.arrival_times = array('q')
+        self.burst_times = array('q')
+        self.priorities = array('q')
+        self.errors = []
+        self.rejected = 0
+
+    def add(self, row, pid, arrival_time, burst_time, priority):
+        self.rows.append(row)
+        self.pids.append(pid)
+        self.arrival_times.append(arrival_time)
+        self.burst_times.append(burst_time)
+        self.priorities.append(priority)
+
+    def reject(self, row, pid, message):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row, 'pid': pid, 'message': message})
+
+    def valid(self):
+        """Comprueba en bloque las reglas de validate_row() sobre las columnas."""
+        return (len(self.pids) == len(self.arrival_times) == len(self.burst_times) == len(self.priorities)
+                and (not self.pids or (min(self.arrival_times) >= 0 and min(self.burst_times) > 0))
+                and '' not in self.pids)
+
+
+def _csv_layout(first_line):
+    """
+    Columnas del CSV a partir de su primera línea.
+
+    Returns:
+        tuple: (nombres de columna, hay cabecera)
+    """
+    fields = [field.strip().lower() for field in first_line.decode('utf-8').split(',')]
+    if 'pid' in fields:
+        missing = [name for name in FIELDS[:3] if name not in fields]
+        if missing:
+            raise ValueError(f'Faltan columnas en la cabecera: {", ".join(missing)}')
+        return fields, True
+    return list(FIELDS[:len(fields)]), False
+
+
+def _parse_csv_fast(lines, columns, first_row):
+    """
+    Convierte las líneas de un bloque en columnas sin objetos por fila.
+
+    Retorna None si el bloque no cumple las condiciones del camino rápido
+    (mismo número de campos en todas las líneas, enteros válidos, sin
+    comillas ni PIDs vacíos), para procesarlo fila a fila.
+    """
+    width = len(columns)
+    if set(map(bytes.count, lines, repeat(b','))) != {width - 1}:
+        return None
+    fields = b','.join(lines).split(b',')
+    chunk = _Chunk()
+    try:
+        for name, column in (('arrival_time', chunk.arrival_times), ('burst_time', chunk.burst_times),
+                             ('priority', chunk.priorities)):
+            if name in columns:
+                column.extend(map(int, fields[columns.index(name)::width]))
+            else:
+                column.frombytes(bytes(8 * len(lines)))
+        pids = b'\n'.join(fields[columns.index('pid')::width]).decode('utf-8').split('\n')
+    except ValueError:
+        return None
+    chunk.pids = [pid.strip() for pid in pids]
+    chunk.rows = range(first_row, first_row + len(lines))
+    return chunk if chunk.valid() else None
+
+
+def _parse_csv_rows(lines, columns, first_row):
+    """Camino lento: valida cada línea con validate_row() y rechaza las inválidas."""
+    chunk = _Chunk()
+    text = io.StringIO(b'\n'.join(lines).decode('utf-8', errors='replace'))
+    for row, record in enumerate(csv.reader(text), start=first_row):
+        if not record or all(not field.strip() for field in record):
+            continue
+        data = dict(zip(columns, record))
+        try:
+            chunk.add(row, *validate_row(data))
+        except ValueError as e:
+            chunk.reject(row, data.get('pid'), str(e))
+    return chunk
+
+
+def _iter_csv_chunks(mapped, chunk_bytes):
+    size = len(mapped)
+    first_end = mapped.find(b'\n')
+    first_line = mapped[:first_end if first_end >= 0 else size].rstrip(b'\r')
+    columns, has_header = _csv_layout(first_line)
+    position = 0
+    if has_header:
+        position = first_end + 1 if first_end >= 0 else size
+    row = 2 if has_header else 1
+
+    while position < size:
+        end = mapped.rfind(b'\n', position, position + chunk_bytes) + 1
+        if end <= position:
+            # Línea más larga que un bloque: se extiende hasta su final
+            end = mapped.find(b'\n', position + chunk_bytes) + 1 or size
+        if position + chunk_bytes >= size:
+            end = size
+        lines = mapped[position:end].split(b'\n')
+        if not lines[-1]:
+            lines.pop()
+
+        chunk = None
+        if lines and b'"' not in lines[0] and all(lines):
+            chunk = _parse_csv_fast(lines, columns, row)
+        if chunk is None:
+            chunk = _parse_csv_rows(lines, columns, row)
+        yield chunk
+        row += len(lines)
+        position = end
+
+
+def _iter_binary_chunks(mapped, chunk_bytes):
+    body = len(mapped) - len(TRACE_MAGIC)
+    if body % RECORD_SIZE:
+        raise ValueError(f'El archivo binario no tiene un número entero de registros de {RECORD_SIZE} bytes.')
+    records_per_chunk = max(chunk_bytes // RECORD_SIZE, 1)
+    total = body // RECORD_SIZE
+
+    for first in range(0, total, records_per_chunk):
+        count = min(records_per_chunk, total - first)
+        start = len(TRACE_MAGIC) + first * RECORD_SIZE
+        data = mapped[start:start + count * RECORD_SIZE]
+
+        chunk = _Chunk()
+        if np is not None:
+            records = np.frombuffer(data, dtype=RECORD_DTYPE)
+            chunk.arrival_times.frombytes(records['arrival_time'].astype(np.int64).tobytes())
+            chunk.burst_times.frombytes(records['burst_time'].astype(np.int64).tobytes())
+            chunk.priorities.frombytes(records['priority'].astype(np.int64).tobytes())
+            try:
+                chunk.pids = b'\n'.join(records['pid'].tolist()).decode('utf-8').split('\n')
+            except UnicodeDecodeError:
+                chunk.pids = []
+            if chunk.valid():
+                chunk.rows = range(first + 1, first + 1 + count)
+                yield chunk
+                continue
+            chunk = _Chunk()
+
+        for row, (pid, arrival_time, burst_time, priority) in enumerate(RECORD.iter_unpack(data), start=first + 1):
+            pid = pid.rstrip(b'\x00').decode('utf-8', errors='replace')
+            if not pid or arrival_time < 0 or burst_time <= 0:
+                chunk.reject(row, pid, 'Datos inválidos: se requiere pid, arrival_time >= 0 y burst_time > 0')
+            else:
+                chunk.add(row, pid, arrival_time, burst_time, priority)
+        yield chunk
+
+
+def iter_trace_chunks(path, fmt=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Recorre un archivo de traza por bloques.
+
+    Args:
+        path (str): Ruta del archivo
+        fmt (str): 'csv' o 'binary' (por defecto se detecta por la firma)
+        chunk_bytes (int): Tamaño aproximado de cada bloque
+
+    Yields:
+        Bloques con pids, arrival_times, burst_times y priorities (columnas
+        de las filas válidas), y errors/rejected de las filas rechazadas
+    """
+    fmt = fmt or detect_trace_format(path)
+    if fmt not in ('csv', 'binary'):
+        raise ValueError(f'Formato de traza {fmt} no soportado (csv o binary).')
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, 'rb') as trace, mmap.mmap(trace.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        if fmt == 'binary':
+            yield from _iter_binary_chunks(mapped, chunk_bytes)
+        else:
+            yield from _iter_csv_chunks(mapped, chunk_bytes)
+
+
+def load_trace(scheduler, path, fmt=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Carga un archivo de traza en la tabla de procesos del scheduler.
+
+    Sirve para cualquier scheduler con add_processes() (FCFSScheduler,
+    SJFScheduler, RoundRobinScheduler, ...). Las filas inválidas y los PIDs
+    repetidos se rechazan individualmente sin detener la carga.
+
+    Returns:
+        dict: {'added', 'rejected', 'errors'} como ingest.ingest()
+    """
+    table = scheduler.processes
+    added = rejected = 0
+    errors = []
+
+    for chunk in iter_trace_chunks(path, fmt, chunk_bytes):
+        pids = chunk.pids
+        if len(set(pids)) != len(pids) or table.contains_any(pids):
+            # PIDs repetidos: se filtran fila a fila conservando la primera aparición
+            unique = _Chunk()
+            seen = set()
+            for row, pid, arrival_time, burst_time, priority in zip(
+                    chunk.rows, pids, chunk.arrival_times, chunk.burst_times, chunk.priorities):
+                if pid in table or pid in seen:
+                    unique.reject(row, pid, f'El proceso {pid} ya existe. Use un ID diferente.')
+                else:
+                    seen.add(pid)
+                    unique.add(row, pid, arrival_time, burst_time, priority)
+            # Errores en orden de fila, como ingest
+            unique.errors = sorted(chunk.errors + unique.errors, key=lambda error: error['row'])[:MAX_REPORTED_ERRORS]
+            unique.rejected += chunk.rejected
+            chunk = unique
+
+        if chunk.pids:
+            scheduler.add_processes(chunk.pids, chunk.arrival_times, chunk.burst_times, chunk.priorities)
+        added += len(chunk.pids)
+        rejected += chunk.rejected
+        errors.extend(chunk.errors[:MAX_REPORTED_ERRORS - len(errors)])
+
+    return {'added': added, 'rejected': rejected, 'errors': errors}
+
+
+def iter_trace(path, fmt=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Procesos válidos de una traza como tuplas (pid, arrival_time,
+    burst_time, priority), para la simulación en streaming.
+    """
+    for chunk in iter_trace_chunks(path, fmt, chunk_bytes):
+        yield from zip(chunk.pids, chunk.arrival_times, chunk.burst_times, chunk.priorities)
+
+
+def write_binary_trace(path, pids, arrival_times, burst_times, priorities=None):
+    """Escribe una traza en el formato binario de ancho fijo."""
+    if priorities is None:
+        priorities = repeat(0)
+    with open(path, 'wb') as trace:
+        trace.write(TRACE_MAGIC)
+        for pid, arrival_time, burst_time, priority in zip(pids, arrival_times, burst_times, priorities):
+            encoded = str(pid).encode('utf-8')
+            if len(encoded) > PID_BYTES:
+                raise ValueError(f'El PID {pid} supera {PID_BYTES} bytes.')
+            trace.write(RECORD.pack(encoded, arrival_time, burst_time, priority))
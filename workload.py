@@ -0,0 +1,295 @@
+"""
+Generador de cargas de trabajo sintéticas.
+
+Produce las columnas de llegada, ráfaga y prioridad por lotes vectorizados
+con NumPy y las vuelca a la tabla de procesos del scheduler con
+add_processes(), sin crear un Process (ni una tupla) por fila. Con la misma
+semilla y las mismas opciones la carga generada es siempre la misma.
+
+Distribuciones de llegada:
+
+- 'poisson': proceso de Poisson de tasa rate (llegadas por unidad de
+  tiempo), es decir, tiempos entre llegadas exponenciales.
+- 'onoff': ráfagas de llegadas. Alterna fases ON y OFF de duración
+  exponencial (medias on_duration y off_duration) con llegadas de Poisson
+  de tasa on_rate y off_rate respectivamente.
+
+Distribuciones de ráfaga (redondeadas hacia arriba, mínimo 1):
+
+- 'exponential': media mean.
+- 'pareto': cola pesada con índice alpha y valor mínimo minimum, acotada
+  en maximum.
+- 'bimodal': mezcla de trabajos cortos y largos (exponenciales de medias
+  short_mean y long_mean; long_fraction es la proporción de largos).
+- 'uniform': enteros uniformes entre low y high (incluidos).
+
+Las llegadas se generan en orden, así que la carga también sirve para la
+simulación en streaming (iter_workload()).
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo requiere el generador
+    np = None
+
+
+# Opciones por defecto de cada distribución de llegada
+ARRIVAL_DISTRIBUTIONS = {
+    'poisson': {'rate': 0.25},
+    'onoff': {'on_rate': 1.0, 'off_rate': 0.0, 'on_duration': 50.0, 'off_duration': 200.0},
+}
+
+# Opciones por defecto de cada distribución de ráfaga
+BURST_DISTRIBUTIONS = {
+    'exponential': {'mean': 8.0},
+    'pareto': {'alpha': 1.5, 'minimum': 2.0, 'maximum': 10000},
+    'bimodal': {'short_mean': 3.0, 'long_mean': 40.0, 'long_fraction': 0.1},
+    'uniform': {'low': 1, 'high': 20},
+}
+
+# Procesos por lote (la carga generada no depende del tamaño del lote que
+# consuma el llamador, pero sí de esta constante)
+BATCH_SIZE = 1 << 20
+
+
+def _check_numpy():
+    if np is None:
+        raise ImportError('El generador de cargas requiere tener NumPy instalado (pip install numpy).')
+
+
+def _options(kind, distributions, name, options):
+    """Opciones de una distribución completadas con sus valores por defecto."""
+    if name not in distributions:
+        raise ValueError(f"Distribución de {kind} {name} no soportada. "
+                         f"Disponibles: {', '.join(distributions)}")
+    defaults = distributions[name]
+    options = dict(options or {})
+    unknown = sorted(set(options) - set(defaults))
+    if unknown:
+        raise ValueError(f"Opciones no válidas para {name}: {', '.join(unknown)} "
+                         f"(disponibles: {', '.join(defaults)})")
+    try:
+        return {key: float(options.get(key, value)) for key, value in defaults.items()}
+    except (TypeError, ValueError):
+        raise ValueError(f'Las opciones de {name} deben ser números')
+
+
+def _require(condition, message):
+    if not condition:
+        raise ValueError(message)
+
+
+class WorkloadGenerator:
+    """
+    Generador reproducible de cargas sintéticas por lotes.
+
+    Args:
+        count (int): Número de procesos
+        seed (int): Semilla del generador (None para una carga aleatoria)
+        arrival (str): Distribución de llegada (ver ARRIVAL_DISTRIBUTIONS)
+        arrival_options (dict): Parámetros de la distribución de llegada
+        burst (str): Distribución de ráfaga (ver BURST_DISTRIBUTIONS)
+        burst_options (dict): Parámetros de la distribución de ráfaga
+        priority_levels (int): Con más de 1, prioridades uniformes en
+            [0, priority_levels); si no, todas 0
+        pid_prefix (str): Prefijo de los PIDs (P1, P2, ...)
+        first_pid (int): Número del primer PID
+    """
+
+    def __init__(self, count, seed=None, arrival='poisson', arrival_options=None,
+                 burst='exponential', burst_options=None, priority_levels=0,
+                 pid_prefix='P', first_pid=1):
+        _check_numpy()
+        self.count = int(count)
+        _require(self.count >= 0, 'count debe ser mayor o igual que 0')
+        self.seed = seed
+        self.arrival = arrival
+        self.arrival_options = _options('llegada', ARRIVAL_DISTRIBUTIONS, arrival, arrival_options)
+        self.burst = burst
+        self.burst_options = _options('ráfaga', BURST_DISTRIBUTIONS, burst, burst_options)
+        self.priority_levels = int(priority_levels or 0)
+        _require(self.priority_levels >= 0, 'priority_levels debe ser mayor o igual que 0')
+        self.pid_prefix = str(pid_prefix)
+        self.first_pid = int(first_pid)
+        self._validate()
+
+    def _validate(self):
+        arrival = self.arrival_options
+        if self.arrival == 'poisson':
+            _require(arrival['rate'] > 0, 'rate debe ser mayor que 0')
+        else:
+            _require(arrival['on_rate'] > 0 and arrival['off_rate'] >= 0,
+                     'on_rate debe ser mayor que 0 y off_rate no negativo')
+            _require(arrival['on_duration'] > 0 and arrival['off_duration'] >= 0,
+                     'on_duration debe ser mayor que 0 y off_duration no negativo')
+        burst = self.burst_options
+        if self.burst == 'exponential':
+            _require(burst['mean'] > 0, 'mean debe ser mayor que 0')
+        elif self.burst == 'pareto':
+            _require(burst['alpha'] > 0 and burst['minimum'] > 0, 'alpha y minimum deben ser mayores que 0')
+            _require(burst['maximum'] >= burst['minimum'], 'maximum debe ser mayor o igual que minimum')
+        elif self.burst == 'bimodal':
+            _require(burst['short_mean'] > 0 and burst['long_mean'] > 0,
+                     'short_mean y long_mean deben ser mayores que 0')
+            _require(0 <= burst['long_fraction'] <= 1, 'long_fraction debe estar entre 0 y 1')
+        else:
+            _require(1 <= burst['low'] <= burst['high'], 'Se requiere 1 <= low <= high')
+
+    def batches(self, batch_size=BATCH_SIZE):
+        """
+        Genera la carga por lotes.
+
+        Yields:
+            tuple: (pids, arrival_times, burst_times, priorities), con los
+            PIDs en una lista y las demás columnas como arreglos int64
+        """
+        rng = np.random.default_rng(self.seed)
+        state = {'clock': 0.0, 'pending': np.empty(0)}
+        generated = 0
+        while generated < self.count:
+            size = min(BATCH_SIZE, self.count - generated)
+            arrival_times = self._arrivals(rng, size, state)
+            burst_times = self._bursts(rng, size)
+            if self.priority_levels > 1:
+                priorities = rng.integers(0, self.priority_levels, size, dtype=np.int64)
+            else:
+                priorities = np.zeros(size, dtype=np.int64)
+            first = self.first_pid + generated
+            prefix = self.pid_prefix
+            pids = [f'{prefix}{number}' for number in range(first, first + size)]
+            generated += size
+
+            # Lotes más pequeños que BATCH_SIZE: se reparte el lote generado
+            for start in range(0, size, batch_size):
+                stop = start + batch_size
+                yield pids[start:stop], arrival_times[start:stop], burst_times[start:stop], priorities[start:stop]
+
+    def _arrivals(self, rng, size, state):
+        options = self.arrival_options
+        if self.arrival == 'poisson':
+            times = state['clock'] + np.cumsum(rng.exponential(1.0 / options['rate'], size))
+            state['clock'] = float(times[-1])
+            return np.floor(times).astype(np.int64)
+
+        # On-off: dado el número de llegadas de una fase de Poisson, sus
+        # instantes son uniformes dentro de la fase. Se generan fases hasta
+        # tener size llegadas; las sobrantes quedan para el siguiente lote
+        pending = state['pending']
+        expected = (options['on_rate'] * options['on_duration']
+                    + options['off_rate'] * options['off_duration'])
+        while len(pending) < size:
+            phases = max(int((size - len(pending)) / expected * 1.25) + 8, 8)
+            durations = np.empty(2 * phases)
+            durations[0::2] = rng.exponential(options['on_duration'], phases)
+            durations[1::2] = rng.exponential(options['off_duration'], phases)
+            rates = np.tile([options['on_rate'], options['off_rate']], phases)
+            counts = rng.poisson(rates * durations)
+            starts = state['clock'] + np.concatenate(([0.0], np.cumsum(durations[:-1])))
+            state['clock'] = float(starts[-1] + durations[-1])
+            points = np.repeat(starts, counts) + rng.random(int(counts.sum())) * np.repeat(durations, counts)
+            points.sort()
+            pending = np.concatenate((pending, points))
+        state['pending'] = pending[size:]
+        return np.floor(pending[:size]).astype(np.int64)
+
+    def _bursts(self, rng, size):
+        options = self.burst_options
+        if self.burst == 'exponential':
+            values = rng.exponential(options['mean'], size)
+        elif self.burst == 'pareto':
+            # Pareto clásico: minimum * (1 + Lomax(alpha)), acotado en maximum
+            values = np.minimum(options['minimum'] * (1.0 + rng.pareto(options['alpha'], size)),
+                                options['maximum'])
+        elif self.burst == 'bimodal':
+            long_jobs = rng.random(size) < options['long_fraction']
+            values = rng.exponential(1.0, size) * np.where(long_jobs, options['long_mean'], options['short_mean'])
+        else:
+            return rng.integers(int(options['low']), int(options['high']), size, dtype=np.int64, endpoint=True)
+        return np.maximum(np.ceil(values), 1).astype(np.int64)
+
+    def load(self, scheduler):
+        """
+        Genera la carga y la vuelca a la tabla de procesos del scheduler
+        (FCFSScheduler, SJFScheduler, RoundRobinScheduler...).
+
+        Returns:
+            int: Procesos añadidos
+
+        Raises:
+            ValueError: Si algún PID generado ya existe en el scheduler
+        """
+        added = 0
+        for pids, arrival_times, burst_times, priorities in self.batches():
+            if scheduler.processes.contains_any(pids):
+                raise ValueError(f'Algunos PIDs {self.pid_prefix}N ya existen. '
+                                 'Use otro pid_prefix o first_pid.')
+            scheduler.add_processes(pids, arrival_times, burst_times, priorities)
+            added += len(pids)
+        return added
+
+    def summary(self):
+        """Parámetros de la carga (para reproducirla)."""
+        return {
+            'count': self.count,
+            'seed': self.seed,
+            'arrival': self.arrival,
+            'arrival_options': self.arrival_options,
+            'burst': self.burst,
+            'burst_options': self.burst_options,
+            'priority_levels': self.priority_levels,
+            'pid_prefix': self.pid_prefix,
+            'first_pid': self.first_pid,
+            'batch_size': BATCH_SIZE,
+            'offered_load': self.offered_load()
+        }
+
+    def offered_load(self):
+        """
+        Carga ofrecida aproximada: ráfaga media por tasa media de llegada
+        (por encima de 1 la cola de listos crece sin límite).
+        """
+        options = self.arrival_options
+        if self.arrival == 'poisson':
+            rate = options['rate']
+        else:
+            period = options['on_duration'] + options['off_duration']
+            rate = (options['on_rate'] * options['on_duration'] + options['off_rate'] * options['off_duration']) / period
+        burst = self.burst_options
+        if self.burst == 'exponential':
+            mean = burst['mean']
+        elif self.burst == 'pareto':
+            alpha, minimum, maximum = burst['alpha'], burst['minimum'], burst['maximum']
+            # Media de min(X, maximum) con X Pareto
+            if alpha == 1:
+                mean = minimum * (1 + math.log(maximum / minimum))
+            else:
+                mean = minimum * alpha / (alpha - 1) * (1 - (minimum / maximum) ** (alpha - 1)) \
+                    + maximum * (minimum / maximum) ** alpha
+        elif self.burst == 'bimodal':
+            mean = (1 - burst['long_fraction']) * burst['short_mean'] + burst['long_fraction'] * burst['long_mean']
+        else:
+            mean = (burst['low'] + burst['high']) / 2
+        return round(rate * mean, 4)
+
+
+def generate_workload(scheduler, count, seed=None, **options):
+    """
+    Genera count procesos y los añade al scheduler (ver WorkloadGenerator).
+
+    Returns:
+        WorkloadGenerator: El generador usado (summary() describe la carga)
+    """
+    generator = WorkloadGenerator(count, seed=seed, **options)
+    generator.load(scheduler)
+    return generator
+
+
+def iter_workload(count, seed=None, **options):
+    """
+    Procesos (pid, arrival_time, burst_time, priority) en orden de llegada,
+    para la simulación en streaming.
+    """
+    for pids, arrival_times, burst_times, priorities in WorkloadGenerator(count, seed=seed, **options).batches():
+        yield from zip(pids, arrival_times.tolist(), burst_times.tolist(), priorities.tolist())